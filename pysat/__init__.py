@@ -77,13 +77,15 @@ else:
 
 from pandas import Panel, DataFrame, Series, datetime
 from . import utils, model_utils
+from ._cache import LoadCache, DiskCache
 from ._constellation import Constellation
 from ._instrument import Instrument
 from ._meta import Meta
 from ._files import Files
 from ._custom import Custom
-from ._orbits import Orbits
+from ._orbits import Orbits, OrbitTable
 from . import instruments
 from . import ssnl
+from . import parallel
 
-__all__ = ['ssnl', 'instruments', 'utils']
+__all__ = ['ssnl', 'instruments', 'utils', 'parallel']
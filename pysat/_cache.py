@@ -0,0 +1,454 @@
+from __future__ import print_function
+from __future__ import absolute_import
+# python 2/3 compatibility
+try:
+    basestring
+except NameError:
+    basestring = str
+
+import collections
+import hashlib
+import json
+import os
+import pickle
+import shutil
+
+import numpy as np
+import pandas as pds
+
+
+class LoadCache(object):
+    """In-memory cache of data and metadata returned by instrument loads.
+
+    Stores the (data, meta) output of instrument load routines, evicting the
+    least recently used entries once the total size of the stored data
+    exceeds the byte budget.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum size of the cached data, in bytes. (default=2**30)
+
+    Attributes
+    ----------
+    hits : int
+        number of requests served from the cache
+    misses : int
+        number of requests that were not in the cache
+    nbytes : int
+        current size of the cached data, in bytes
+
+    Note
+    ----
+    A LoadCache is shared, rather than copied, by Instrument.copy, so
+    copies of an Instrument benefit from loads performed by the original.
+    Entries are keyed by platform, name, tag, sat_id, the filenames loaded,
+    and the keyword arguments passed to the load routine. Data is copied
+    going into and out of the cache, so changes made to loaded data are
+    never seen by later loads.
+
+    Examples
+    --------
+    ::
+
+        cache = pysat.LoadCache(max_bytes=4*2**30)
+        ivm = pysat.Instrument('cnofs', 'ivm', cache=cache)
+        vefi = pysat.Instrument('cnofs', 'vefi', 'dc_b', cache=cache)
+        ivm.load(2009, 1)
+        ivm.load(2009, 2)
+        ivm.load(2009, 1)
+        print(cache.hits, cache.misses)
+
+    """
+
+    def __init__(self, max_bytes=2**30):
+        self.max_bytes = max_bytes
+        self._store = collections.OrderedDict()
+        self._sizes = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        output_str = ''.join(('pysat.LoadCache(max_bytes=',
+                              '{:d})'.format(self.max_bytes)))
+        return output_str
+
+    def __str__(self):
+        output_str = '\npysat LoadCache object\n'
+        output_str += '----------------------\n'
+        output_str += 'Number of entries: {:d}\n'.format(len(self))
+        output_str += 'Size: {:d} of {:d} bytes\n'.format(self.nbytes,
+                                                          self.max_bytes)
+        output_str += 'Hits: {:d}\n'.format(self.hits)
+        output_str += 'Misses: {:d}\n'.format(self.misses)
+        return output_str
+
+    def __len__(self):
+        return len(self._store)
+
+    def __contains__(self, key):
+        return key in self._store
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        """Pickle the cache settings but not the cached data."""
+        return {'max_bytes': self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @staticmethod
+    def make_key(inst, fnames):
+        """Create the cache key for loading fnames with an Instrument.
+
+        Parameters
+        ----------
+        inst : pysat.Instrument
+            Instrument performing the load
+        fnames : list-like
+            filenames passed to the instrument load routine
+
+        Returns
+        -------
+        tuple
+            hashable key
+
+        """
+
+        kwargs = repr(sorted(inst.kwargs.items()))
+        return (inst.platform, inst.name, inst.tag, inst.sat_id,
+                tuple(fnames), kwargs)
+
+    @staticmethod
+    def _get_nbytes(data):
+        """Return the memory used by a pandas or xarray data object."""
+
+        if isinstance(data, pds.DataFrame):
+            return int(data.memory_usage(index=True, deep=True).sum())
+        else:
+            return int(data.nbytes)
+
+    def get(self, key):
+        """Return a copy of the cached (data, meta) for key.
+
+        Parameters
+        ----------
+        key : tuple
+            cache key, see LoadCache.make_key
+
+        Returns
+        -------
+        tuple or NoneType
+            (data, meta) if key is in the cache, otherwise None
+
+        """
+
+        if key in self._store:
+            self.hits += 1
+            # move entry to the most recently used position
+            data, meta = self._store.pop(key)
+            self._store[key] = (data, meta)
+            return data.copy(), meta.copy()
+        else:
+            self.misses += 1
+            return None
+
+    def put(self, key, data, meta):
+        """Store a copy of (data, meta) under key.
+
+        Parameters
+        ----------
+        key : tuple
+            cache key, see LoadCache.make_key
+        data : pandas.DataFrame or xarray.Dataset
+            data returned by the instrument load routine
+        meta : pysat.Meta
+            metadata returned by the instrument load routine
+
+        Note
+        ----
+        Data larger than max_bytes is not stored.
+
+        """
+
+        nbytes = self._get_nbytes(data)
+        if nbytes > self.max_bytes:
+            return
+
+        self.pop(key)
+        # remove least recently used data until there is room
+        while (self.nbytes + nbytes > self.max_bytes) and (len(self) > 0):
+            old_key, _ = self._store.popitem(last=False)
+            self.nbytes -= self._sizes.pop(old_key)
+
+        self._store[key] = (data.copy(), meta.copy())
+        self._sizes[key] = nbytes
+        self.nbytes += nbytes
+
+    def pop(self, key):
+        """Remove key from the cache, if present.
+
+        Parameters
+        ----------
+        key : tuple
+            cache key, see LoadCache.make_key
+
+        """
+
+        if key in self._store:
+            del self._store[key]
+            self.nbytes -= self._sizes.pop(key)
+
+    def clear(self):
+        """Remove all data from the cache and reset the counters."""
+
+        self._store = collections.OrderedDict()
+        self._sizes = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+class DiskCache(object):
+    """Persistent on-disk cache of data and metadata returned by loads.
+
+    Stores the (data, meta) output of instrument load routines in a binary
+    layout under the pysat data directory. DataFrames of simple (numeric,
+    boolean, or datetime) columns are stored one numpy array per column and
+    memory mapped when read back. Other data, such as xarray Datasets or
+    higher order data, is pickled. Metadata is pickled alongside the data.
+
+    Parameters
+    ----------
+    path : str or NoneType
+        Directory used to store cached data. If None, the directory
+        pysat_cache within pysat.data_dir is used. (default=None)
+
+    Attributes
+    ----------
+    hits : int
+        number of requests served from the cache
+    misses : int
+        number of requests that were not in the cache, or out of date
+
+    Note
+    ----
+    A DiskCache is shared, rather than copied, by Instrument.copy, so the
+    hit and miss counters include loads by copies of an Instrument. Cached
+    data is only used while the modification time and size of every
+    source file are unchanged. Loads of filenames that do not exist on the
+    local system are not cached. Columns are memory mapped copy-on-write,
+    so changes made to loaded data are never written to the cache.
+
+    Examples
+    --------
+    ::
+
+        cache = pysat.DiskCache()
+        sm = pysat.Instrument('supermag', 'magnetometer', cache=cache)
+        sm.load(2009, 1)
+        # later sessions load the decoded data from the cache
+        sm = pysat.Instrument('supermag', 'magnetometer',
+                              cache=pysat.DiskCache())
+        sm.load(2009, 1)
+
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            from pysat import data_dir
+            path = os.path.join(data_dir, 'pysat_cache')
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "pysat.DiskCache(path='{:s}')".format(self.path)
+
+    def __str__(self):
+        output_str = '\npysat DiskCache object\n'
+        output_str += '----------------------\n'
+        output_str += 'Path: {:s}\n'.format(self.path)
+        output_str += 'Hits: {:d}\n'.format(self.hits)
+        output_str += 'Misses: {:d}\n'.format(self.misses)
+        return output_str
+
+    def __contains__(self, key):
+        return self._read_info(key) is not None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    make_key = staticmethod(LoadCache.make_key)
+
+    def _entry_path(self, key):
+        """Return the directory used to store data for key."""
+
+        platform, name, tag, sat_id = [k if k != '' else '_'
+                                       for k in key[:4]]
+        digest = hashlib.md5(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.path, platform, name, tag, sat_id, digest)
+
+    @staticmethod
+    def _file_stamps(fnames):
+        """Return [filename, modification time, size] for each file.
+
+        Returns None if any of the files can not be found.
+
+        """
+
+        stamps = []
+        for fname in fnames:
+            try:
+                stat = os.stat(fname)
+            except OSError:
+                return None
+            stamps.append([fname, stat.st_mtime, stat.st_size])
+        return stamps
+
+    def _read_info(self, key):
+        """Return stored information for key, None if missing or out of date.
+        """
+
+        info_file = os.path.join(self._entry_path(key), 'info.json')
+        if not os.path.isfile(info_file):
+            return None
+        with open(info_file, 'r') as fin:
+            info = json.load(fin)
+        if info['stamps'] != self._file_stamps(key[4]):
+            return None
+        return info
+
+    def get(self, key):
+        """Return the cached (data, meta) for key.
+
+        Parameters
+        ----------
+        key : tuple
+            cache key, see DiskCache.make_key
+
+        Returns
+        -------
+        tuple or NoneType
+            (data, meta) if key is in the cache and the source files are
+            unchanged, otherwise None
+
+        """
+
+        info = self._read_info(key)
+        if info is None:
+            self.misses += 1
+            return None
+
+        entry_path = self._entry_path(key)
+        with open(os.path.join(entry_path, 'meta.pkl'), 'rb') as fin:
+            meta = pickle.load(fin)
+        if info['layout'] == 'columns':
+            index = np.load(os.path.join(entry_path, 'index.npy'),
+                            mmap_mode='r')
+            index = pds.DatetimeIndex(index, name=info['index_name'])
+            # no explicit copy, pandas already gathers the columns into its
+            # own blocks, and any column kept as given is a writeable
+            # copy-on-write map that never changes the stored file
+            data = collections.OrderedDict()
+            for i, col in enumerate(info['columns']):
+                data[col] = np.load(os.path.join(entry_path,
+                                                 'col_{:d}.npy'.format(i)),
+                                    mmap_mode='c')
+            data = pds.DataFrame(data, index=index, columns=info['columns'])
+        else:
+            with open(os.path.join(entry_path, 'data.pkl'), 'rb') as fin:
+                data = pickle.load(fin)
+
+        self.hits += 1
+        return data, meta
+
+    def put(self, key, data, meta):
+        """Store (data, meta) under key.
+
+        Parameters
+        ----------
+        key : tuple
+            cache key, see DiskCache.make_key
+        data : pandas.DataFrame or xarray.Dataset
+            data returned by the instrument load routine
+        meta : pysat.Meta
+            metadata returned by the instrument load routine
+
+        """
+
+        stamps = self._file_stamps(key[4])
+        if stamps is None:
+            return
+
+        entry_path = self._entry_path(key)
+        temp_path = '{:s}_tmp{:d}'.format(entry_path, os.getpid())
+        if os.path.isdir(temp_path):
+            shutil.rmtree(temp_path)
+        os.makedirs(temp_path)
+
+        info = {'stamps': stamps}
+        simple = (isinstance(data, pds.DataFrame) and
+                  isinstance(data.index, pds.DatetimeIndex) and
+                  (data.index.tz is None) and data.columns.is_unique and
+                  all([isinstance(col, basestring)
+                       for col in data.columns]) and
+                  all([isinstance(dtype, np.dtype) and (dtype.kind in 'biufcM')
+                       for dtype in data.dtypes]))
+        if simple:
+            info['layout'] = 'columns'
+            info['columns'] = list(data.columns)
+            info['index_name'] = data.index.name
+            np.save(os.path.join(temp_path, 'index.npy'),
+                    data.index.values)
+            for i, col in enumerate(data.columns):
+                np.save(os.path.join(temp_path, 'col_{:d}.npy'.format(i)),
+                        data[col].values)
+        else:
+            info['layout'] = 'pickle'
+            with open(os.path.join(temp_path, 'data.pkl'), 'wb') as fout:
+                pickle.dump(data, fout, protocol=2)
+
+        with open(os.path.join(temp_path, 'meta.pkl'), 'wb') as fout:
+            pickle.dump(meta, fout, protocol=2)
+        # info is written last, marking a complete entry
+        with open(os.path.join(temp_path, 'info.json'), 'w') as fout:
+            json.dump(info, fout)
+
+        self.pop(key)
+        try:
+            os.rename(temp_path, entry_path)
+        except OSError:
+            # another process stored the same data first
+            shutil.rmtree(temp_path)
+
+    def pop(self, key):
+        """Remove key from the cache, if present.
+
+        Parameters
+        ----------
+        key : tuple
+            cache key, see DiskCache.make_key
+
+        """
+
+        entry_path = self._entry_path(key)
+        if os.path.isdir(entry_path):
+            shutil.rmtree(entry_path)
+
+    def clear(self):
+        """Remove all cached data and reset the counters."""
+
+        if os.path.isdir(self.path):
+            shutil.rmtree(self.path)
+        self.hits = 0
+        self.misses = 0
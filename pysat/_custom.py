@@ -42,9 +42,41 @@ class Custom(object):
     ----
     User should interact with Custom through pysat.Instrument instance's
     attribute, instrument.custom
+
+    By default, 'add' and 'pass' functions are each supplied a full copy of
+    the Instrument. If Custom.copy is set to False, these functions are
+    instead supplied a read-only view of the Instrument, and no copy is made.
+    Functions that change the supplied Instrument may still be given a copy
+    by setting function.mutates_input = True. ::
+
+        instrument.custom.copy = False
+        instrument.custom.add(custom_func2, 'add', opt_param2=True)
+
+    Functions added with Custom.add_lazy are not run on load. They are run
+    the first time one of the variables they provide is accessed through
+    the Instrument, after any functions providing the variables they
+    require. ::
+
+        omni.custom.add_lazy(calculate_clock_angle,
+                             ['clock_angle', 'BYZ_GSM'],
+                             ['BY_GSM', 'BZ_GSM'], 'modify')
+        omni.custom.add_lazy(calculate_dayside_reconnection, 'recon_day',
+                             ['clock_angle', 'BYZ_GSM', 'flow_speed'],
+                             'modify')
+        omni.load(date=date)
+        # runs calculate_clock_angle, then calculate_dayside_reconnection
+        print(omni['recon_day'])
+
+    Attributes
+    ----------
+    copy : bool
+        If True, 'add' and 'pass' functions are supplied a copy of the
+        Instrument, otherwise a read-only view. (default=True)
     """
 
-    def __init__(self):
+    def __init__(self, copy=True):
+        # supply copies of the instrument to add and pass functions
+        self.copy = copy
         # create a list object to store functions
         self._functions = []
         # type of function stored (add/modify/pass on data)
@@ -53,6 +85,12 @@ class Custom(object):
         self._args = []
         # keyword arguments to functions
         self._kwargs = []
+        # lazily applied functions, (function, kind, args, kwargs, requires)
+        self._lazy = []
+        # index into _lazy of the function providing each variable
+        self._providers = {}
+        # lazy functions being applied
+        self._running = set()
 
     def add(self, function, kind='add', at_pos='end', *args, **kwargs):
         """Add a function to custom processing queue.
@@ -68,12 +106,14 @@ class Custom(object):
             kind : {'add', 'modify', 'pass}
                 add
                     Adds data returned from function to instrument object.
-                    A copy of pysat instrument object supplied to routine.
+                    A copy of pysat instrument object supplied to routine,
+                    or a read-only view if Custom.copy is False.
                 modify
                     pysat instrument object supplied to routine. Any and all
                     changes to object are retained.
                 pass
-                    A copy of pysat object is passed to function. No
+                    A copy of pysat object is passed to function, or a
+                    read-only view if Custom.copy is False. No
                     data is accepted from return.
 
             at_pos : string or int
@@ -119,6 +159,96 @@ class Custom(object):
             raise TypeError('Must enter an index between 0 and %i' %
                             len(self._functions))
 
+    def add_lazy(self, function, provides, requires=None, kind='add',
+                 *args, **kwargs):
+        """Add a function that is applied when its variables are accessed.
+
+        Parameters
+        ----------
+            function : function object
+                function to be applied
+            provides : string or list of strings
+                names of the variables added by the function
+            requires : string, list of strings, or NoneType
+                names of the variables used by the function. Any provided by
+                other lazy functions are calculated first. (default=None)
+            kind : {'add', 'modify'}
+                how the function is applied, see Custom.add (default='add')
+            args : extra arguments
+                extra arguments are passed to the custom function
+            kwargs : extra keyword arguments
+                extra keyword args are passed to the custom function
+
+        Note
+        ----
+        The function is applied when a provided variable that is missing
+        from the loaded data is accessed as inst[name], or when
+        Custom.evaluate is called. Data accessed as inst.data[name] does not
+        trigger the function. Lazy functions are applied to the data as
+        it is, after any padding has been removed.
+
+        """
+
+        kind = kind.lower()
+        if kind not in ['add', 'modify']:
+            raise ValueError("Lazy functions must be of kind 'add' or " +
+                             "'modify'.")
+        if isinstance(provides, basestring):
+            provides = [provides]
+        if requires is None:
+            requires = []
+        elif isinstance(requires, basestring):
+            requires = [requires]
+
+        self._lazy.append((function, kind, args, kwargs, list(requires)))
+        for name in provides:
+            self._providers[name] = len(self._lazy) - 1
+
+    def evaluate(self, sat, names=None):
+        """Apply the lazy functions providing variables missing from sat.
+
+        Parameters
+        ----------
+        sat : pysat.Instrument
+            Instrument to add variables to
+        names : string, list of strings, or NoneType
+            names of the variables to calculate. If None, every variable
+            provided by a lazy function is calculated. (default=None)
+
+        """
+
+        if names is None:
+            names = list(self._providers.keys())
+        self._derive(sat, names)
+
+    def _derive(self, sat, key):
+        """Apply lazy functions for variables within an Instrument key."""
+
+        if isinstance(key, tuple):
+            # (rows, variables) access
+            key = key[-1]
+        if isinstance(key, basestring):
+            names = [key]
+        elif isinstance(key, list):
+            names = key
+        else:
+            return
+
+        for name in names:
+            ind = self._providers.get(name) \
+                if isinstance(name, basestring) else None
+            if (ind is None) or (ind in self._running) or (name in sat.data):
+                continue
+
+            func, kind, arg, kwarg, requires = self._lazy[ind]
+            self._running.add(ind)
+            try:
+                self._derive(sat, requires)
+                if not sat.empty:
+                    self._apply(sat, func, arg, kwarg, kind)
+            finally:
+                self._running.discard(ind)
+
     def _apply_all(self, sat):
         """
         Apply all of the custom functions to the satellite data object.
@@ -127,112 +257,123 @@ class Custom(object):
             for func, arg, kwarg, kind in zip(self._functions, self._args,
                                               self._kwargs, self._kind):
                 if not sat.empty:
-                    if kind == 'add':
-                        # apply custom functions that add data to the
-                        # instrument object
-                        tempd = sat.copy()
-                        newData = func(tempd, *arg, **kwarg)
-                        del tempd
-
-                        # process different types of data returned by the
-                        # function if a dict is returned, data in 'data'
-                        if isinstance(newData, dict):
-                            # if DataFrame returned, add Frame to existing
-                            # frame
-                            if isinstance(newData['data'], pds.DataFrame):
-                                sat[newData['data'].columns] = newData
-                            # if a series is returned, add it as a column
-                            elif isinstance(newData['data'], pds.Series):
-                                # look for name attached to series first
-                                if newData['data'].name is not None:
-                                    sat[newData['data'].name] = newData
-                                # look if name is provided as part of dict
-                                # returned from function
-                                elif 'name' in newData.keys():
-                                    name = newData.pop('name')
-                                    sat[name] = newData
-                                # couldn't find name information
-                                else:
-                                    raise ValueError('Must assign a name to ' +
-                                                     'Series or return a ' +
-                                                     '"name" in dictionary.')
-                            # xarray returned
-                            elif isinstance(newData['data'], xr.DataArray):
-                                sat[newData['data'].name] = newData['data']
-
-                            # some kind of iterable was returned
-                            elif hasattr(newData['data'], '__iter__'):
-                                # look for name in returned dict
-                                if 'name' in newData.keys():
-                                    name = newData.pop('name')
-                                    sat[name] = newData
-                                else:
-                                    raise ValueError(''.join(('Must include ',
-                                                              '"name" in ',
-                                                              'returned ',
-                                                              'dictionary.')))
-
-                        # bare DataFrame is returned
-                        elif isinstance(newData, pds.DataFrame):
-                            sat[newData.columns] = newData
-                        # bare Series is returned, name must be attached to
-                        # Series
-                        elif isinstance(newData, pds.Series):
-                            sat[newData.name] = newData
-
-                        # xarray returned
-                        elif isinstance(newData, xr.DataArray):
-                            sat[newData.name] = newData
-
-                        # some kind of iterable returned,
-                        # presuming (name, data)
-                        # or ([name1,...], [data1,...])
-                        elif hasattr(newData, '__iter__'):
-                            # falling back to older behavior
-                            # unpack tuple/list that was returned
-                            newName = newData[0]
-                            newData = newData[1]
-                            if len(newData) > 0:
-                                # doesn't really check ensure data, there could
-                                # be multiple empty arrays returned, [[],[]]
-                                if isinstance(newName, basestring):
-                                    # one item to add
-                                    sat[newName] = newData
-                                else:
-                                    # multiple items
-                                    for name, data in zip(newName, newData):
-                                        if len(data) > 0:
-                                            # fixes up the incomplete check
-                                            # from before
-                                            sat[name] = data
-                        else:
-                            raise ValueError(''.join(("kernel doesn't know",
-                                                      " what to do with",
-                                                      " returned data.")))
-
-                    # modifying loaded data
-                    if kind == 'modify':
-                        t = func(sat, *arg, **kwarg)
-                        if t is not None:
-                            raise ValueError(''.join(('Modified functions',
-                                                      ' should not return',
-                                                      ' any information via',
-                                                      ' return. Information ',
-                                                      'may only be propagated',
-                                                      ' back by modifying ',
-                                                      'supplied pysat object.'
-                                                      )))
-
-                    # pass function (function runs, no data allowed back)
-                    if kind == 'pass':
-                        tempd = sat.copy()
-                        t = func(tempd, *arg, **kwarg)
-                        del tempd
-                        if t is not None:
-                            raise ValueError(''.join(('Pass functions should',
-                                                      ' not return any ',
-                                                      'information via ',
-                                                      'return.')))
+                    self._apply(sat, func, arg, kwarg, kind)
+
+    def _apply(self, sat, func, arg, kwarg, kind):
+        """Apply a single custom function to the satellite data object."""
+        if kind == 'add':
+            # apply custom functions that add data to the
+            # instrument object
+            tempd = self._supplied(sat, func)
+            newData = func(tempd, *arg, **kwarg)
+            del tempd
+
+            # process different types of data returned by the
+            # function if a dict is returned, data in 'data'
+            if isinstance(newData, dict):
+                # if DataFrame returned, add Frame to existing
+                # frame
+                if isinstance(newData['data'], pds.DataFrame):
+                    sat[newData['data'].columns] = newData
+                # if a series is returned, add it as a column
+                elif isinstance(newData['data'], pds.Series):
+                    # look for name attached to series first
+                    if newData['data'].name is not None:
+                        sat[newData['data'].name] = newData
+                    # look if name is provided as part of dict
+                    # returned from function
+                    elif 'name' in newData.keys():
+                        name = newData.pop('name')
+                        sat[name] = newData
+                    # couldn't find name information
+                    else:
+                        raise ValueError('Must assign a name to ' +
+                                         'Series or return a ' +
+                                         '"name" in dictionary.')
+                # xarray returned
+                elif isinstance(newData['data'], xr.DataArray):
+                    sat[newData['data'].name] = newData['data']
+
+                # some kind of iterable was returned
+                elif hasattr(newData['data'], '__iter__'):
+                    # look for name in returned dict
+                    if 'name' in newData.keys():
+                        name = newData.pop('name')
+                        sat[name] = newData
+                    else:
+                        raise ValueError(''.join(('Must include ',
+                                                  '"name" in ',
+                                                  'returned ',
+                                                  'dictionary.')))
+
+            # bare DataFrame is returned
+            elif isinstance(newData, pds.DataFrame):
+                sat[newData.columns] = newData
+            # bare Series is returned, name must be attached to
+            # Series
+            elif isinstance(newData, pds.Series):
+                sat[newData.name] = newData
+
+            # xarray returned
+            elif isinstance(newData, xr.DataArray):
+                sat[newData.name] = newData
+
+            # some kind of iterable returned,
+            # presuming (name, data)
+            # or ([name1,...], [data1,...])
+            elif hasattr(newData, '__iter__'):
+                # falling back to older behavior
+                # unpack tuple/list that was returned
+                newName = newData[0]
+                newData = newData[1]
+                if len(newData) > 0:
+                    # doesn't really check ensure data, there could
+                    # be multiple empty arrays returned, [[],[]]
+                    if isinstance(newName, basestring):
+                        # one item to add
+                        sat[newName] = newData
+                    else:
+                        # multiple items
+                        for name, data in zip(newName, newData):
+                            if len(data) > 0:
+                                # fixes up the incomplete check
+                                # from before
+                                sat[name] = data
+            else:
+                raise ValueError(''.join(("kernel doesn't know",
+                                          " what to do with",
+                                          " returned data.")))
+
+        # modifying loaded data
+        if kind == 'modify':
+            t = func(sat, *arg, **kwarg)
+            if t is not None:
+                raise ValueError(''.join(('Modified functions',
+                                          ' should not return',
+                                          ' any information via',
+                                          ' return. Information ',
+                                          'may only be propagated',
+                                          ' back by modifying ',
+                                          'supplied pysat object.'
+                                          )))
+
+        # pass function (function runs, no data allowed back)
+        if kind == 'pass':
+            tempd = self._supplied(sat, func)
+            t = func(tempd, *arg, **kwarg)
+            del tempd
+            if t is not None:
+                raise ValueError(''.join(('Pass functions should',
+                                          ' not return any ',
+                                          'information via ',
+                                          'return.')))
+
+    def _supplied(self, sat, func):
+        """Return the Instrument supplied to an 'add' or 'pass' function."""
+
+        if self.copy or getattr(func, 'mutates_input', False):
+            return sat.copy()
+        return _InstrumentView(sat)
 
     def clear(self):
         """Clear custom function list."""
@@ -240,7 +381,92 @@ class Custom(object):
         self._args = []
         self._kwargs = []
         self._kind = []
+        self._lazy = []
+        self._providers = {}
 
 #################################################
 # END CUSTOM CLASS ##############################
 #################################################
+
+
+class _InstrumentView(object):
+    """Read-only view of an Instrument supplied to custom functions.
+
+    Attributes are read from the underlying Instrument without copying.
+    .data is a shallow copy and .meta a copy, each made once when first
+    used, so columns may be added to .data, and read back through the
+    view, without changing the Instrument. Assigning data or attributes
+    raises a ValueError. Existing data must not be changed in place.
+
+    Parameters
+    ----------
+    sat : pysat.Instrument
+        Instrument being viewed
+
+    """
+
+    def __init__(self, sat):
+        object.__setattr__(self, '_sat', sat)
+        object.__setattr__(self, '_data', None)
+        object.__setattr__(self, '_meta', None)
+
+    def __getattr__(self, name):
+        return getattr(self._sat, name)
+
+    def __getitem__(self, key):
+        if self._data is None:
+            # no data added to the view, read straight from the Instrument
+            return self._sat[key]
+
+        # lazy variables are calculated and kept by the Instrument
+        if len(self._sat.custom._providers) > 0:
+            self._sat.custom._derive(self._sat, key)
+            for name in self._sat.variables:
+                if name not in self._data:
+                    self._data[name] = self._sat.data[name]
+        return type(self._sat).__getitem__(self, key)
+
+    def __getitem_xarray__(self, key):
+        return type(self._sat).__getitem_xarray__(self, key)
+
+    def __setitem__(self, key, new):
+        raise ValueError(_view_estr)
+
+    def __setattr__(self, name, value):
+        raise ValueError(_view_estr)
+
+    def __delattr__(self, name):
+        raise ValueError(_view_estr)
+
+    @property
+    def data(self):
+        """Shallow copy of the Instrument data."""
+        if self._data is None:
+            object.__setattr__(self, '_data', self._sat.data.copy(deep=False))
+        return self._data
+
+    @property
+    def meta(self):
+        """Copy of the Instrument metadata."""
+        if self._meta is None:
+            object.__setattr__(self, '_meta', self._sat.meta.copy())
+        return self._meta
+
+    @property
+    def index(self):
+        """Time index of the viewed data."""
+        if self._data is None:
+            return self._sat.index
+        return self._sat._index(self._data)
+
+    @property
+    def variables(self):
+        """Variables within the viewed data."""
+        if self._data is None:
+            return self._sat.variables
+        return type(self._sat).variables.fget(self)
+
+
+_view_estr = ''.join(('Custom functions supplied a read-only Instrument ',
+                      'may not change it. Set function.mutates_input = ',
+                      'True to supply a copy instead.'))
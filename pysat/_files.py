@@ -169,6 +169,14 @@ class Files(object):
                 # couldn't find stored info, load file list and then store
                 self.refresh()
 
+    def __getstate__(self):
+        """Support copy and pickle, the Instrument reference is restored by
+        the Instrument that owns this object."""
+
+        state = self.__dict__.copy()
+        del state['_sat']
+        return state
+
     def _attach_files(self, files_info):
         """Attach results of instrument list_files routine to Instrument object
 
@@ -10,11 +10,13 @@ except NameError:
 import string
 import os
 import copy
+import inspect
 import sys
 import pandas as pds
 import numpy as np
 import xarray as xr
 import warnings
+import weakref
 
 from . import _custom
 from . import _files
@@ -23,6 +25,20 @@ from . import _meta
 from . import utils
 from pysat import DataFrame
 
+# weak references to Instruments with background load threads, so the
+# threads are released once the Instrument is garbage collected
+_prefetch_refs = set()
+
+
+def _release_prefetch_pool(pool):
+    """Return a weakref callback that releases a background load pool."""
+
+    def release(ref):
+        _prefetch_refs.discard(ref)
+        pool.close()
+
+    return release
+
 
 # main class for users
 class Instrument(object):
@@ -47,7 +63,8 @@ class Instrument(object):
         pandas DateOffset.
     orbit_info : dict
         Orbit information, {'index':index, 'kind':kind, 'period':period}.
-        See pysat.Orbits for more information.
+        Include 'copy':False to take orbits as slices of the loaded day rather
+        than of a copy. See pysat.Orbits for more information.
     inst_module : module, optional
         Provide instrument module directly.
         Takes precedence over platform/name.
@@ -99,6 +116,26 @@ class Instrument(object):
     fill_label : str
         label to use for fill values. Defaults to 'fill' but some
         implementations will use 'FillVal'
+    prefetch : int
+        Number of upcoming days/files from the iteration bounds to load on a
+        background thread while the current data is being processed. If 0,
+        all data is loaded when requested. (default=0)
+    cache : pysat.LoadCache, pysat.DiskCache, or NoneType
+        Cache for data returned by the instrument load routine, either in
+        memory (LoadCache) or on disk (DiskCache). The same cache may be
+        shared by many Instrument objects and is shared by Instrument copies.
+        If None, no caching is performed. (default=None)
+    variables : list or NoneType
+        Names of the variables to load. Passed to instrument load routines
+        with a `variables` keyword so other variables are not read from
+        file. Data and meta from other load routines are trimmed to these
+        variables after loading. Any variables used by the clean routine or
+        custom functions must be included. If None, all variables are
+        loaded. (default=None)
+    multi_day_load : boolean, optional
+        Set to True if the instrument load routine accepts files from many
+        days at once. Time windows spanning several days are then loaded
+        with a single call to the load routine rather than one per day.
 
     Attributes
     ----------
@@ -176,7 +213,8 @@ class Instrument(object):
                  notes_label='notes', desc_label='desc',
                  plot_label='label', axis_label='axis', scale_label='scale',
                  min_label='value_min', max_label='value_max',
-                 fill_label='fill', *arg, **kwargs):
+                 fill_label='fill', prefetch=0, cache=None, variables=None,
+                 multi_day_load=None, *arg, **kwargs):
 
         if inst_module is None:
             # use strings to look up module name
@@ -247,15 +285,7 @@ class Instrument(object):
                 raise ValueError(estr)
 
         # set up empty data and metadata
-        # check if pandas or xarray format
-        if self.pandas_format:
-            self._null_data = DataFrame(None)
-            self._data_library = DataFrame
-        else:
-            self._null_data = xr.Dataset(None)
-            self._data_library = xr.Dataset
-        # assign null data for user selected data type
-        self.data = self._null_data.copy()
+        self._set_null_data()
 
         # create Meta instance with appropriate labels
         self.units_label = units_label
@@ -281,17 +311,25 @@ class Instrument(object):
 
         # function processing class, processes data on load
         self.custom = _custom.Custom()
-        # create arrays to store data around loaded day
+        # track data stored around loaded day
         # enables padding across day breaks with minimal loads
-        self._next_data = self._null_data.copy()
         self._next_data_track = []
-        self._prev_data = self._null_data.copy()
         self._prev_data_track = []
-        self._curr_data = self._null_data.copy()
+
+        # support for loading upcoming days/files in the background
+        # loads are serialized through a single worker thread
+        self.prefetch = int(prefetch) if prefetch is not None else 0
+        self._prefetch_pool = None
+        self._prefetch_queue = {}
+        # optional cache of loaded data, shared across Instrument copies
+        self.cache = cache
 
         # multi file day, default set by assign_funcs
         if multi_file_day is not None:
             self.multi_file_day = multi_file_day
+        # multi day load, default set by assign_funcs
+        if multi_day_load is not None:
+            self.multi_day_load = multi_day_load
 
         # arguments for padding
         if isinstance(pad, pds.DateOffset):
@@ -344,12 +382,18 @@ class Instrument(object):
         self._export_meta_post_processing = None
 
         # store kwargs, passed to load routine
+        if variables is not None:
+            kwargs['variables'] = list(variables)
         self.kwargs = kwargs
 
         # run instrument init function, a basic pass function is used
         # if user doesn't supply the init function
         self._init_rtn(self)
 
+        # init may select the data format, such as from the kwargs
+        if self.pandas_format != isinstance(self._null_data, DataFrame):
+            self._set_null_data()
+
         # store base attributes, used in particular by Meta class
         self._base_attr = dir(self)
 
@@ -376,6 +420,10 @@ class Instrument(object):
 
         """
 
+        # calculate variables provided by lazy custom functions, if needed
+        if len(self.custom._providers) > 0:
+            self.custom._derive(self, key)
+
         if self.pandas_format:
             if isinstance(key, str):
                 return self.data[key]
@@ -697,6 +745,22 @@ class Instrument(object):
 
         return copy.deepcopy(self)
 
+    def __getstate__(self):
+        """Support copy and pickle while excluding background load threads.
+        """
+
+        state = self.__dict__.copy()
+        state['_prefetch_pool'] = None
+        state['_prefetch_queue'] = {}
+        return state
+
+    def __setstate__(self, state):
+        """Restore Instrument from copy or pickle."""
+
+        self.__dict__.update(state)
+        # Files holds a weak reference back to the Instrument
+        self.files._sat = weakref.proxy(self)
+
     def concat_data(self, data, *args, **kwargs):
         """Concats data1 and data2 for xarray or pandas as needed"""
 
@@ -708,6 +772,26 @@ class Instrument(object):
     def _pass_func(*args, **kwargs):
         pass
 
+    def _set_null_data(self):
+        """Set empty data, and the data stored around the loaded day, using
+        the pandas or xarray format as selected."""
+
+        # check if pandas or xarray format
+        if self.pandas_format:
+            self._null_data = DataFrame(None)
+            self._data_library = DataFrame
+        else:
+            self._null_data = xr.Dataset(None)
+            self._data_library = xr.Dataset
+
+        # assign null data for user selected data type
+        self.data = self._null_data.copy()
+
+        # create arrays to store data around loaded day
+        self._next_data = self._null_data.copy()
+        self._prev_data = self._null_data.copy()
+        self._curr_data = self._null_data.copy()
+
     def _assign_funcs(self, by_name=False, inst_module=None):
         """Assign all external science instrument methods to Instrument object.
         """
@@ -725,6 +809,7 @@ class Instrument(object):
         self.directory_format = None
         self.file_format = None
         self.multi_file_day = False
+        self.multi_day_load = False
         self.orbit_info = None
         self.pandas_format = True
 
@@ -774,6 +859,10 @@ class Instrument(object):
             self.multi_file_day = inst.multi_file_day
         except AttributeError:
             pass
+        try:
+            self.multi_day_load = inst.multi_day_load
+        except AttributeError:
+            pass
         try:
             self.orbit_info = inst.orbit_info
         except AttributeError:
@@ -932,7 +1021,323 @@ class Instrument(object):
 
         return self.today() - pds.DateOffset(days=1)
 
-    def _load_data(self, date=None, fid=None):
+    def _get_load_fnames(self, date=None, fid=None, start=None, stop=None):
+        """Return filenames that would be loaded for a given date or fid.
+
+        Parameters
+        ----------
+        date : (dt.datetime.date object or NoneType)
+            file date
+        fid : (int or NoneType)
+            filename index value
+        start : (dt.datetime or NoneType)
+            start of a time window, used if date and fid are None
+        stop : (dt.datetime or NoneType)
+            exclusive end of a time window, used if date and fid are None
+
+        Returns
+        -------
+        fname : (pds.Series)
+            filenames, relative to the instrument data path
+
+        """
+
+        if fid is not None:
+            # get filename based off of index value
+            fname = self.files[fid:fid+1]
+        elif date is not None:
+            fname = self.files[date:date+pds.DateOffset(days=1)]
+        elif (start is not None) and (stop is not None):
+            if self.multi_file_day:
+                # files may hold data from the neighbouring days
+                start = start - pds.DateOffset(days=1)
+                stop = stop + pds.DateOffset(days=1)
+            index = self.files.files.index
+            # the last file beginning before the window may hold its start,
+            # though files only hold data from the day they are listed on
+            start_day = start.replace(hour=0, minute=0, second=0,
+                                      microsecond=0)
+            first = max(index.searchsorted(start, side='right') - 1,
+                        index.searchsorted(start_day, side='left'))
+            last = index.searchsorted(stop, side='left')
+            # files listed later on the day the window ends may still hold
+            # data from the start of that day
+            stop_day = stop.replace(hour=0, minute=0, second=0,
+                                    microsecond=0)
+            if stop_day < stop:
+                day_first = index.searchsorted(stop_day, side='left')
+                day_last = index.searchsorted(stop_day
+                                              + pds.DateOffset(days=1),
+                                              side='left')
+                last = max(last, min(day_first + 1, day_last))
+            fname = self.files.files.iloc[first:last]
+        else:
+            raise ValueError('Must supply either a date or file id number.')
+        return fname
+
+    def _call_load_rtn(self, load_fname, start=None, stop=None):
+        """Run the instrument load routine, using cached or prefetched data.
+
+        Parameters
+        ----------
+        load_fname : (list)
+            list of full path filenames to be loaded
+        start : (dt.datetime or NoneType)
+            start of the time window required, passed to load routines
+            supporting start and stop keywords
+        stop : (dt.datetime or NoneType)
+            exclusive end of the time window required
+
+        Returns
+        --------
+        data : (pds.DataFrame or xr.Dataset)
+            pysat data
+        meta : (pysat.Meta)
+            pysat meta data
+
+        Note
+        ----
+        When prefetch is enabled all loads are performed by the background
+        worker thread, so the instrument load routine is never run on more
+        than one file set at the same time. Loads restricted to a time window
+        only hold part of the files and are not cached. Data outside of the
+        window may still be returned.
+
+        """
+
+        key = tuple(load_fname)
+        if self.cache is not None:
+            cache_key = self.cache.make_key(self, load_fname)
+            output = self.cache.get(cache_key)
+            if output is not None:
+                # any background load of the same files is redundant
+                self._prefetch_queue.pop(key, None)
+                return output
+
+        if key in self._prefetch_queue:
+            # errors raised by the load routine are raised again by get
+            output = self._prefetch_queue.pop(key).get()
+        elif (start is not None) and self._load_window_rtn():
+            if self.prefetch > 0:
+                return self._submit_load(load_fname, start, stop).get()
+            return self._load_rtn(load_fname,
+                                  **self._load_kwargs(start, stop))
+        elif self.prefetch > 0:
+            output = self._submit_load(load_fname).get()
+        else:
+            output = self._load_rtn(load_fname, **self._load_kwargs())
+
+        if self.cache is not None:
+            self.cache.put(cache_key, output[0], output[1])
+        return output
+
+    def _submit_load(self, load_fname, start=None, stop=None):
+        """Queue the instrument load routine on the background worker thread.
+
+        Parameters
+        ----------
+        load_fname : (list)
+            list of full path filenames to be loaded
+        start : (dt.datetime or NoneType)
+            start of the time window to load, if any
+        stop : (dt.datetime or NoneType)
+            exclusive end of the time window to load, if any
+
+        Returns
+        -------
+        multiprocessing.pool.AsyncResult
+            pending (data, meta) output from the load routine
+
+        """
+
+        if self._prefetch_pool is None:
+            from multiprocessing.pool import ThreadPool
+            self._prefetch_pool = ThreadPool(processes=1)
+            _prefetch_refs.add(weakref.ref(self, _release_prefetch_pool(
+                self._prefetch_pool)))
+        return self._prefetch_pool.apply_async(self._load_rtn, (load_fname,),
+                                               self._load_kwargs(start, stop))
+
+    def _stop_prefetch(self):
+        """Discard pending background loads and release the worker thread.
+
+        A new worker thread is started if data are prefetched again.
+
+        """
+
+        self._prefetch_queue = {}
+        if self._prefetch_pool is not None:
+            # pending loads finish before the threads exit, without blocking
+            self._prefetch_pool.close()
+            self._prefetch_pool = None
+
+    def _load_kwargs(self, start=None, stop=None):
+        """Return the keyword arguments for the instrument load routine.
+
+        Parameters
+        ----------
+        start : (dt.datetime or NoneType)
+            start of the time window to load, if any
+        stop : (dt.datetime or NoneType)
+            exclusive end of the time window to load, if any
+
+        Returns
+        -------
+        kwargs : (dict)
+            Instrument kwargs along with tag and sat_id. The variables
+            selection is only included if the load routine has a variables
+            keyword, and the time window is included if given.
+
+        """
+
+        kwargs = self.kwargs.copy()
+        kwargs['tag'] = self.tag
+        kwargs['sat_id'] = self.sat_id
+        if 'variables' in kwargs:
+            if not _has_keyword(self._load_rtn, 'variables'):
+                del kwargs['variables']
+        if start is not None:
+            kwargs['start'] = start
+            kwargs['stop'] = stop
+        return kwargs
+
+    def _load_window_rtn(self):
+        """Return True if the load routine can read just a time window."""
+
+        return (_has_keyword(self._load_rtn, 'start') and
+                _has_keyword(self._load_rtn, 'stop'))
+
+    def _select_variables(self, data, mdata):
+        """Trim loaded data and meta to the requested variables.
+
+        Load routines supporting the variables keyword select variables
+        while reading, data from other routines is trimmed here.
+
+        Parameters
+        ----------
+        data : (pds.DataFrame or xr.Dataset)
+            pysat data
+        mdata : (pysat.Meta)
+            pysat meta data
+
+        Returns
+        --------
+        data : (pds.DataFrame or xr.Dataset)
+            pysat data with only the requested variables
+        mdata : (pysat.Meta)
+            pysat meta data with only the requested variables
+
+        """
+
+        variables = self.kwargs.get('variables', None)
+        if (variables is None) or self._empty(data):
+            return data, mdata
+        if _has_keyword(self._load_rtn, 'variables'):
+            return data, mdata
+
+        if self.pandas_format:
+            data = data[[var for var in data.columns if var in variables]]
+        else:
+            data = data[[var for var in data.data_vars if var in variables]]
+        if mdata is not None:
+            mdata.keep(variables)
+        return data, mdata
+
+    def _prefetch_targets(self):
+        """Determine the dates/files the next iterations will need to load.
+
+        Returns
+        -------
+        targets : (list)
+            list of (date, fid) tuples for upcoming loads, ordered by when
+            they will be needed
+        window : (list)
+            list of (date, fid) tuples already held in the loaded data window
+
+        """
+
+        targets = []
+        window = []
+        if not hasattr(self, '_iter_list'):
+            return targets, window
+        # padding and multi_file_day loads also require the next day/file
+        use_window = (self.pad is not None) | self.multi_file_day
+
+        if self._load_by_date and (self._iter_type == 'date'):
+            inc = pds.DateOffset(days=1)
+            window = [(self.date, None)]
+            if use_window:
+                window.extend([(self.date - inc, None),
+                               (self.date + inc, None)])
+            idx, = np.where(self._iter_list == self.date)
+            if len(idx) > 0:
+                upcoming = self._iter_list[idx[0] + 1:
+                                           idx[0] + 1 + self.prefetch]
+                for date in self._filter_datetime_input(upcoming):
+                    targets.append((date, None))
+                    if use_window:
+                        targets.append((date + inc, None))
+        elif (not self._load_by_date) and (self._iter_type == 'file'):
+            window = [(None, self._fid)]
+            if use_window:
+                window.extend([(None, self._fid - 1), (None, self._fid + 1)])
+            fname = self.files[self._fid]
+            if fname in self._iter_list:
+                pos = list(self._iter_list).index(fname)
+                upcoming = self._iter_list[pos + 1:pos + 1 + self.prefetch]
+                for fname in upcoming:
+                    fid = self.files.get_index(fname)
+                    targets.append((None, fid))
+                    if use_window:
+                        targets.append((None, fid + 1))
+
+        return targets, window
+
+    def _schedule_prefetch(self):
+        """Start background loads for the upcoming days/files.
+
+        Pending loads that are no longer expected to be used are discarded.
+
+        """
+
+        if self.prefetch < 1:
+            return
+
+        targets, window = self._prefetch_targets()
+        window_keys = []
+        for date, fid in window:
+            if (fid is not None) and ((fid < 0) or
+                                      (fid >= len(self.files.files))):
+                continue
+            fname = self._get_load_fnames(date=date, fid=fid)
+            window_keys.append(tuple([os.path.join(self.files.data_path, f)
+                                      for f in fname]))
+
+        keys = []
+        for date, fid in targets:
+            if (fid is not None) and (fid >= len(self.files.files)):
+                continue
+            fname = self._get_load_fnames(date=date, fid=fid)
+            if len(fname) == 0:
+                continue
+            load_fname = [os.path.join(self.files.data_path, f)
+                          for f in fname]
+            key = tuple(load_fname)
+            if (key in keys) or (key in window_keys):
+                continue
+            if ((self.cache is not None) and
+                    (self.cache.make_key(self, load_fname) in self.cache)):
+                continue
+            keys.append(key)
+            if key not in self._prefetch_queue:
+                self._prefetch_queue[key] = self._submit_load(load_fname)
+
+        # drop stale loads, e.g. after a jump in time
+        for key in list(self._prefetch_queue.keys()):
+            if key not in keys:
+                del self._prefetch_queue[key]
+
+    def _load_data(self, date=None, fid=None, start=None, stop=None):
         """
         Load data for an instrument on given date or fid, dependng upon input.
 
@@ -942,6 +1347,11 @@ class Instrument(object):
             file date
         fid : (int or NoneType)
             filename index value
+        start : (dt.datetime or NoneType)
+            start of a time window to load, used if date and fid are None
+        stop : (dt.datetime or NoneType)
+            exclusive end of a time window to load, used if date and fid are
+            None
 
         Returns
         --------
@@ -952,19 +1362,18 @@ class Instrument(object):
         """
 
         date = self._filter_datetime_input(date)
-        if fid is not None:
-            # get filename based off of index value
-            fname = self.files[fid:fid+1]
-        elif date is not None:
-            fname = self.files[date:date+pds.DateOffset(days=1)]
-        else:
-            raise ValueError('Must supply either a date or file id number.')
+        fname = self._get_load_fnames(date=date, fid=fid, start=start,
+                                      stop=stop)
+        window = (date is None) and (fid is None) and (start is not None)
 
         if len(fname) > 0:
             load_fname = [os.path.join(self.files.data_path, f) for f in fname]
             try:
-                data, mdata = self._load_rtn(load_fname, tag=self.tag,
-                                             sat_id=self.sat_id, **self.kwargs)
+                if window:
+                    data, mdata = self._load_window(fname, start, stop)
+                else:
+                    data, mdata = self._call_load_rtn(load_fname)
+                    data, mdata = self._select_variables(data, mdata)
                 # ensure units and name are named consistently in new Meta
                 # object as specified by user upon Instrument instantiation
                 mdata.accept_default_labels(self)
@@ -1010,7 +1419,16 @@ class Instrument(object):
 
         # let user know if data was returned or not
         ind = data.index if self.pandas_format else data.indexes
-        if len(ind) > 0:
+        if window:
+            window_str = ' '.join((start.strftime('%d %B %Y %H:%M:%S'), '::',
+                                   stop.strftime('%d %B %Y %H:%M:%S')))
+            if len(ind) > 0:
+                output_str = ' '.join(('Returning', output_str, 'data from',
+                                       window_str))
+            else:
+                output_str = ' '.join(('No', output_str, 'data from',
+                                       window_str))
+        elif len(ind) > 0:
             if date is not None:
                 output_str = ' '.join(('Returning', output_str, 'data for',
                                        date.strftime('%d %B %Y')))
@@ -1036,6 +1454,90 @@ class Instrument(object):
         print(output_str)
         return data, mdata
 
+    def _load_window(self, fname, start, stop):
+        """Load the data within a time window.
+
+        The load routine is called once for each day of files, as for loads
+        by date, unless the instrument sets multi_day_load, in which case all
+        of the files are loaded in a single call. The window is passed to load
+        routines supporting start and stop keywords.
+
+        Parameters
+        ----------
+        fname : (pds.Series)
+            filenames covering the window, relative to the instrument data
+            path
+        start : (dt.datetime)
+            start of the time window
+        stop : (dt.datetime)
+            exclusive end of the time window
+
+        Returns
+        --------
+        data : (pds.DataFrame or xr.Dataset)
+            pysat data from start up to, but not including, stop
+        meta : (pysat.Meta)
+            pysat meta data
+
+        """
+
+        if self.multi_day_load:
+            groups = [fname.values]
+        else:
+            dates = pds.DatetimeIndex(fname.index).normalize()
+            groups = [fname.values[dates == date] for date in dates.unique()]
+
+        data = []
+        mdata = None
+        for group in groups:
+            load_fname = [os.path.join(self.files.data_path, f)
+                          for f in group]
+            ddata, dmeta = self._call_load_rtn(load_fname, start, stop)
+            ddata, dmeta = self._select_variables(ddata, dmeta)
+            ddata = self._select_window(ddata, start, stop)
+            if not self._empty(ddata):
+                if len(data) == 0:
+                    mdata = dmeta
+                data.append(ddata)
+            elif mdata is None:
+                mdata = dmeta
+
+        if len(data) == 0:
+            return self._null_data.copy(), mdata
+        elif len(data) == 1:
+            return data[0], mdata
+        return self.concat_data(data), mdata
+
+    def _select_window(self, data, start, stop):
+        """Return the data within a time window.
+
+        Parameters
+        ----------
+        data : (pds.DataFrame or xr.Dataset)
+            pysat data
+        start : (dt.datetime)
+            start of the time window
+        stop : (dt.datetime)
+            exclusive end of the time window
+
+        Returns
+        --------
+        data : (pds.DataFrame or xr.Dataset)
+            pysat data from start up to, but not including, stop
+
+        """
+
+        if self._empty(data):
+            return data
+        index = self._index(data)
+        idx, = np.where((index >= start) & (index < stop))
+        if len(idx) == len(index):
+            return data
+        if self.pandas_format:
+            return data.iloc[idx]
+        else:
+            return data.isel(indexers={'time': idx})
+
     def _load_next(self):
         """Load the next days data (or file) without incrementing the date.
         Repeated calls will not advance date/file and will produce the same
@@ -1085,7 +1587,7 @@ class Instrument(object):
             self._load_by_date = False
 
     def load(self, yr=None, doy=None, date=None, fname=None, fid=None,
-             verifyPad=False):
+             verifyPad=False, start=None, stop=None):
         """Load instrument data into Instrument object .data.
 
         Parameters
@@ -1100,6 +1602,10 @@ class Instrument(object):
             filename to be loaded
         verifyPad : boolean
             if True, padding data not removed (debug purposes)
+        start : datetime object
+            start of a time window to load, used along with stop
+        stop : datetime object
+            exclusive end of a time window to load, used along with start
 
         Returns
         --------
@@ -1112,9 +1618,24 @@ class Instrument(object):
         are automatically applied to the data before it is available to
         user in .data.
 
+        A time window, which may be any fraction of a day, is loaded from
+        only the files that cover it. Load routines with start and stop
+        keywords are passed the window, including any padding, so that only
+        the required part of each file need be read. Windows may also span
+        many days, with the data combined once and the default, clean, and
+        custom routines applied once to all of it.
+
         """
+        window = False
         # set options used by loading routine based upon user input
-        if date is not None:
+        if (start is not None) or (stop is not None):
+            if (start is None) or (stop is None):
+                raise ValueError('Must supply both start and stop.')
+            if stop <= start:
+                raise ValueError('stop must be later than start.')
+            self._set_load_parameters(date=start, fid=None)
+            window = True
+        elif date is not None:
             # ensure date portion from user is only year, month, day
             self._set_load_parameters(date=date,
                                       fid=None)
@@ -1148,7 +1669,18 @@ class Instrument(object):
         # if pad  or multi_file_day is true, need to have a three day/file load
         loop_pad = self.pad if self.pad is not None \
             else pds.DateOffset(seconds=0)
-        if (self.pad is not None) | self.multi_file_day:
+        if window:
+            # only the window and padding are loaded, any data held for
+            # neighbouring days is left untouched
+            first_time = start
+            first_pad = start - loop_pad
+            last_time = stop
+            last_pad = stop + loop_pad
+            want_last_pad = False
+            self.data, meta = self._load_data(start=first_pad, stop=last_pad)
+            if not self.empty:
+                self.meta = meta
+        elif (self.pad is not None) | self.multi_file_day:
             if self._empty(self._next_data) & self._empty(self._prev_data):
                 # data has not already been loaded for previous and next days
                 # load data for all three
@@ -1273,6 +1805,10 @@ class Instrument(object):
             if not self.empty:
                 self.meta = meta
 
+        # start loading upcoming data while this data is processed
+        if not window:
+            self._schedule_prefetch()
+
         # check if load routine actually returns meta
         if self.meta.data.empty:
             self.meta[self.variables] = {self.name_label: self.variables,
@@ -1677,15 +2213,19 @@ class Instrument(object):
 
         """
 
-        if self._iter_type == 'file':
-            for fname in self._iter_list:
-                self.load(fname=fname)
-                yield self
-
-        elif self._iter_type == 'date':
-            for date in self._iter_list:
-                self.load(date=date)
-                yield self
+        try:
+            if self._iter_type == 'file':
+                for fname in self._iter_list:
+                    self.load(fname=fname)
+                    yield self
+
+            elif self._iter_type == 'date':
+                for date in self._iter_list:
+                    self.load(date=date)
+                    yield self
+        finally:
+            # iteration is over, background loads are no longer needed
+            self._stop_prefetch()
 
     def next(self, verifyPad=False):
         """Manually iterate through the data loaded in Instrument object.
@@ -1704,9 +2244,11 @@ class Instrument(object):
             if self.date is not None:
                 idx, = np.where(self._iter_list == self.date)
                 if (len(idx) == 0):
+                    self._stop_prefetch()
                     raise StopIteration(''.join(('File list is empty. ',
                                                  'Nothing to be done.')))
                 elif idx[-1] + 1 >= len(self._iter_list):
+                    self._stop_prefetch()
                     raise StopIteration('Outside the set date boundaries.')
                 else:
                     idx += 1
@@ -1720,6 +2262,7 @@ class Instrument(object):
                 first = self.files.get_index(self._iter_list[0])
                 last = self.files.get_index(self._iter_list[-1])
                 if (self._fid < first) | (self._fid+1 > last):
+                    self._stop_prefetch()
                     raise StopIteration('Outside the set file boundaries.')
                 else:
                     self.load(fname=self._iter_list[self._fid + 1 - first],
@@ -1744,9 +2287,11 @@ class Instrument(object):
             if self.date is not None:
                 idx, = np.where(self._iter_list == self.date)
                 if len(idx) == 0:
+                    self._stop_prefetch()
                     raise StopIteration(''.join(('File list is empty. ',
                                                  'Nothing to be done.')))
                 elif idx[0] == 0:
+                    self._stop_prefetch()
                     raise StopIteration('Outside the set date boundaries.')
                 else:
                     idx -= 1
@@ -1760,6 +2305,7 @@ class Instrument(object):
                 first = self.files.get_index(self._iter_list[0])
                 last = self.files.get_index(self._iter_list[-1])
                 if (self._fid-1 < first) | (self._fid > last):
+                    self._stop_prefetch()
                     raise StopIteration('Outside the set file boundaries.')
                 else:
                     self.load(fname=self._iter_list[self._fid-1-first],
@@ -1975,7 +2521,7 @@ class Instrument(object):
         return export_dict
 
     def to_netcdf4(self, fname=None, base_instrument=None, epoch_name='Epoch',
-                   zlib=False, complevel=4, shuffle=True):
+                   zlib=False, complevel=4, shuffle=True, chunk_size=None):
         """Stores loaded data into a netCDF4 file.
 
         Parameters
@@ -1996,6 +2542,11 @@ class Instrument(object):
             the HDF5 shuffle filter will be applied before compressing the data
             (default True). This significantly improves compression. Default is
             True. Ignored if zlib=False.
+        chunk_size : int or NoneType
+            Number of times stored in each HDF5 chunk.  Chunks span the whole
+            of any higher order dimension, so reading a range of times reads
+            contiguous chunks.  If None, the netCDF4 library default is used.
+            (default=None)
 
         Note
         ----
@@ -2011,6 +2562,8 @@ class Instrument(object):
          - The index organizing the data stored as a dimension variable
          - from_netcdf4 uses the variable dimensions to reconstruct data
            structure
+         - Each higher order variable is collected into a single
+           (Epoch, dimension) array and written in one call
 
 
         All attributes attached to instrument meta are written to netCDF attrs.
@@ -2062,13 +2615,19 @@ class Instrument(object):
         with netCDF4.Dataset(fname, mode='w', format=file_format) as out_data:
             # number of items, yeah
             num = len(self.index)
+            # chunk along time only, if requested
+            if chunk_size is None or num == 0:
+                epoch_chunks = None
+            else:
+                epoch_chunks = (min(chunk_size, num),)
             # write out the datetime index
             out_data.createDimension(epoch_name, num)
             cdfkey = out_data.createVariable(epoch_name, 'i8',
                                              dimensions=(epoch_name),
                                              zlib=zlib,
                                              complevel=complevel,
-                                             shuffle=shuffle)
+                                             shuffle=shuffle,
+                                             chunksizes=epoch_chunks)
             # grab existing metadata for Epoch or create suitable info
             if epoch_name in self.meta:
                 new_dict = export_meta[self.meta.var_case_name(epoch_name)]
@@ -2131,7 +2690,8 @@ class Instrument(object):
                                                      dimensions=(epoch_name),
                                                      zlib=zlib,
                                                      complevel=complevel,
-                                                     shuffle=shuffle)
+                                                     shuffle=shuffle,
+                                                     chunksizes=epoch_chunks)
                     # attach any meta data, after filtering for standards
                     try:
                         # attach dimension metadata
@@ -2167,11 +2727,13 @@ class Instrument(object):
 
                     if (coltype == type(' ')) or (coltype == type(u' ')):
                         # dealing with a string
-                        cdfkey = out_data.createVariable(key, coltype,
-                                                         dimensions=(epoch_name),
-                                                         zlib=zlib,
-                                                         complevel=complevel,
-                                                         shuffle=shuffle)
+                        cdfkey = \
+                            out_data.createVariable(key, coltype,
+                                                    dimensions=(epoch_name),
+                                                    zlib=zlib,
+                                                    complevel=complevel,
+                                                    shuffle=shuffle,
+                                                    chunksizes=epoch_chunks)
                         # attach any meta data
                         try:
                             # attach dimension metadata
@@ -2219,6 +2781,10 @@ class Instrument(object):
                         # the right dimensions for variables that will
                         # be written to file
                         var_dim = tuple([epoch_name] + obj_dim_names)
+                        if epoch_chunks is None:
+                            obj_chunks = None
+                        else:
+                            obj_chunks = epoch_chunks + (max(dims[0], 1),)
 
                         # We need to do different things if a series or
                         # dataframe stored
@@ -2239,11 +2805,36 @@ class Instrument(object):
                         # has subvariable data (not just empty frame/series)
                         # so we can determine what the real underlying data
                         # types are
+                        frames = self[key].values
                         good_data_loc = 0
-                        for jjj in np.arange(len(self.data)):
-                            if len(self.data[key].iloc[0]) > 0:
-                                data_loc = jjj
+                        for jjj, frame in enumerate(frames):
+                            if len(frame) > 0:
+                                good_data_loc = jjj
                                 break
+                        data_loc = good_data_loc
+
+                        # collect the higher order data into contiguous
+                        # (Epoch, dimension) arrays up front, so each
+                        # variable is written with a single call rather
+                        # than one row at a time
+                        if not is_frame:
+                            sub_data = {iterable[0]: np.stack([frame.values
+                                                               for frame
+                                                               in frames])}
+                        elif len(set(frames[good_data_loc].dtypes)) == 1:
+                            # a single type, stack each frame at once
+                            stacked = np.stack([frame.values
+                                                for frame in frames])
+                            sub_data = dict([(col, stacked[:, :, j])
+                                             for j, col
+                                             in enumerate(iterable)])
+                        else:
+                            sub_data = dict([(col, np.stack([frame[col].values
+                                                             for frame
+                                                             in frames]))
+                                             for col in iterable])
+                        index_data = np.stack([frame.index.values
+                                               for frame in frames])
                         # found a place with data, if there is one
                         # now iterate over the subvariables, get data info
                         # create netCDF4 variables and store the data
@@ -2256,13 +2847,11 @@ class Instrument(object):
                                 idx = self[key].iloc[good_data_loc][col]
                                 data, coltype, _ = \
                                     self._get_data_info(idx, file_format)
-                                cdfkey = \
-                                    out_data.createVariable(key+'_'+col,
-                                                            coltype,
-                                                            dimensions=var_dim,
-                                                            zlib=zlib,
-                                                            complevel=complevel,
-                                                            shuffle=shuffle)
+                                cdfkey = out_data.createVariable(
+                                    key + '_' + col, coltype,
+                                    dimensions=var_dim, zlib=zlib,
+                                    complevel=complevel, shuffle=shuffle,
+                                    chunksizes=obj_chunks)
                                 # attach any meta data
                                 try:
                                     new_dict = export_meta[key+'_'+col]
@@ -2281,18 +2870,8 @@ class Instrument(object):
                                                     'Unable to find MetaData',
                                                     'for', ', '.join((key,
                                                                       col)))))
-                                # attach data
-                                # it may be slow to repeatedly call the store
-                                # method as well astype method below collect
-                                # data into a numpy array, then write the full
-                                # array in one go
-                                temp_cdf_data = \
-                                    np.zeros((num, dims[0])).astype(coltype)
-                                for i in range(num):
-                                    temp_cdf_data[i, :] = \
-                                        self[key].iloc[i][col].values
                                 # write data
-                                cdfkey[:, :] = temp_cdf_data.astype(coltype)
+                                cdfkey[:, :] = sub_data[col].astype(coltype)
 
                             else:
                                 # we are dealing with a Series
@@ -2301,13 +2880,11 @@ class Instrument(object):
                                 idx = self[key].iloc[good_data_loc]
                                 data, coltype, _ = \
                                     self._get_data_info(idx, file_format)
-                                cdfkey = \
-                                    out_data.createVariable(key + '_data',
-                                                            coltype,
-                                                            dimensions=var_dim,
-                                                            zlib=zlib,
-                                                            complevel=complevel,
-                                                            shuffle=shuffle)
+                                cdfkey = out_data.createVariable(
+                                    key + '_data', coltype,
+                                    dimensions=var_dim, zlib=zlib,
+                                    complevel=complevel, shuffle=shuffle,
+                                    chunksizes=obj_chunks)
                                 # attach any meta data
                                 try:
                                     new_dict = export_meta[key]
@@ -2326,13 +2903,8 @@ class Instrument(object):
                                     print(' '.join((str(err), '\n',
                                                     'Unable to find MetaData',
                                                     'for,', key)))
-                                # attach data
-                                temp_cdf_data = \
-                                    np.zeros((num, dims[0])).astype(coltype)
-                                for i in range(num):
-                                    temp_cdf_data[i, :] = self[i, key].values
                                 # write data
-                                cdfkey[:, :] = temp_cdf_data.astype(coltype)
+                                cdfkey[:, :] = sub_data[col].astype(coltype)
 
                         # we are done storing the actual data for the given
                         # higher order variable, now we need to store the index
@@ -2349,7 +2921,8 @@ class Instrument(object):
                                                          dimensions=var_dim,
                                                          zlib=zlib,
                                                          complevel=complevel,
-                                                         shuffle=shuffle)
+                                                         shuffle=shuffle,
+                                                         chunksizes=obj_chunks)
                         # work with metadata
                         new_dict = export_meta[key]
                         new_dict['Depend_0'] = epoch_name
@@ -2370,11 +2943,7 @@ class Instrument(object):
                             # set metadata dict
                             cdfkey.setncatts(new_dict)
                             # set data
-                            temp_cdf_data = np.zeros((num,
-                                                      dims[0])).astype(coltype)
-                            for i in range(num):
-                                temp_cdf_data[i, :] = self[i, key].index.values
-                            cdfkey[:, :] = (temp_cdf_data.astype(coltype) *
+                            cdfkey[:, :] = (index_data.astype(coltype) *
                                             1.E-6).astype(coltype)
 
                         else:
@@ -2390,12 +2959,7 @@ class Instrument(object):
                             # assign metadata dict
                             cdfkey.setncatts(new_dict)
                             # set data
-                            temp_cdf_data = \
-                                np.zeros((num, dims[0])).astype(coltype)
-                            for i in range(num):
-                                temp_cdf_data[i, :] = \
-                                    self[key].iloc[i].index.to_native_types()
-                            cdfkey[:, :] = temp_cdf_data.astype(coltype)
+                            cdfkey[:, :] = index_data.astype(coltype)
 
             # store any non standard attributes
             # compare this Instrument's attributes to base object
@@ -2440,3 +3004,15 @@ class Instrument(object):
             # print('adict', adict)
             out_data.setncatts(adict)
         return
+
+
+def _has_keyword(func, name):
+    """Return True if func has an argument called name."""
+
+    try:
+        if hasattr(inspect, 'signature'):
+            return name in inspect.signature(func).parameters
+        else:
+            return name in inspect.getargspec(func).args
+    except (TypeError, ValueError):
+        return False
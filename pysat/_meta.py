@@ -278,6 +278,10 @@ class Meta(object):
             if name not in keep_names:
                 drop_names.append(name)
         self.drop(drop_names)
+        # drop higher dimension data
+        for name in list(self._ho_data.keys()):
+            if name not in keep_names:
+                _ = self._ho_data.pop(name)
 
     def apply_default_labels(self, other):
         """Applies labels for default meta labels from self onto other.
@@ -2,11 +2,16 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import functools
+import os
+import pickle
 
 import numpy as np
 import pandas as pds
 from pysat import Series
 
+# atomic on all platforms under python 3, and on posix under python 2
+_replace = getattr(os, 'replace', os.rename)
+
 
 class Orbits(object):
     """Determines orbits on the fly and provides orbital data in .data.
@@ -32,6 +37,11 @@ class Orbits(object):
         length of time for orbital period, used to gauge when a break
         in the datetime index (inst.data.index) is large enough to
         consider it a new orbit
+    copy : bool
+        If True, orbits are sliced from a copy of the loaded day of data.
+        If False, orbits are slices of the loaded day itself, avoiding a
+        copy of the full day. In-place changes to orbit data may then be
+        seen when the same orbit is loaded again. (default=True)
 
     Note
     ----
@@ -71,7 +81,8 @@ class Orbits(object):
         vefi.orbits.prev()
     """
 
-    def __init__(self, sat=None, index=None, kind=None, period=None):
+    def __init__(self, sat=None, index=None, kind=None, period=None,
+                 copy=True):
         # create null arrays for storing orbit info
         if sat is None:
             raise ValueError('Must provide a pysat instrument object when ' +
@@ -88,6 +99,7 @@ class Orbits(object):
         if period is None:
             period = pds.Timedelta(np.timedelta64(97, 'm'))
         self.orbit_period = pds.Timedelta(period)
+        self.kind = kind
 
         if (kind == 'local time') or (kind == 'lt'):
             self._detBreaks = functools.partial(self._equaBreaks,
@@ -106,6 +118,12 @@ class Orbits(object):
         self.num = 0
         self._current = 0
         self.orbit_index = index
+        self.copy = copy
+        self._fullDayData = None
+        # optional pysat.OrbitTable, enables loading by mission orbit number
+        self.table = None
+        # mission orbit number loaded from the table, None for a loaded day
+        self._table_orbit = None
 
     @property
     def current(self):
@@ -153,6 +171,7 @@ class Orbits(object):
         self._orbit_breaks = []
         self.num = 0
         self._current = 0
+        self._table_orbit = None
 
     def _calcOrbits(self):
         """Prepares data structure for breaking data into orbits. Not intended
@@ -163,8 +182,11 @@ class Orbits(object):
         if len(self._orbit_breaks) == 0:
             # determine orbit breaks
             self._detBreaks()
-            # store a copy of data
-            self._fullDayData = self.sat.data.copy()
+            # store the data, copied unless orbits are views of the day
+            if self.copy:
+                self._fullDayData = self.sat.data.copy()
+            else:
+                self._fullDayData = self.sat.data
             # set current orbit counter to zero (default)
             self._current = 0
 
@@ -217,32 +239,33 @@ class Orbits(object):
 
             # check for large positive gradients around the break that would
             # suggest not a true orbit break, but rather bad orbit_index values
-            new_ind = []
-            for idx in ind:
-                tidx, = np.where(lt_diff[idx - 5:idx + 6] > 0.1)
-
-                if len(tidx) != 0:
-                    # there are large changes, suggests a false alarm
-                    # iterate over samples and check
-                    for tidx in tidx:
-                        # look at time change vs local time change
-                        if(ut_diff[idx - 5:idx + 6].iloc[tidx] <
-                           lt_diff[idx - 5:idx + 6].iloc[tidx] /
-                           orbit_index_period * self.orbit_period):
-                            # change in ut is small compared to the change in
-                            # the orbit index this is flagged as a false alarm,
-                            # or dropped from consideration
-                            pass
-                        else:
-                            # change in UT is significant, keep orbit break
-                            new_ind.append(idx)
-                            break
-                else:
-                    # no large positive gradients, current orbit break passes
-                    # the first test
-                    new_ind.append(idx)
-            # replace all breaks with those that are 'good'
-            ind = np.array(new_ind)
+            large = (lt_diff > 0.1).values
+            # look at time change vs local time change, when the change in
+            # ut is small compared to the change in the orbit index a large
+            # gradient is flagged as a false alarm, otherwise the change in
+            # UT is significant and the orbit break is kept
+            ut_check = (ut_diff < lt_diff.values / orbit_index_period *
+                        self.orbit_period).values
+            significant = large & np.logical_not(ut_check)
+
+            # count flagged samples within [idx - 5, idx + 6) of each break,
+            # windows that begin before the first sample follow python slice
+            # rules and wrap around to the end
+            num = len(lt_diff)
+            start = ind - 5
+            start = np.where(start < 0, np.maximum(start + num, 0), start)
+            stop = np.minimum(ind + 6, num)
+            large_sum = np.hstack((0, np.cumsum(large)))
+            significant_sum = np.hstack((0, np.cumsum(significant)))
+            has_window = start < stop
+            num_large = np.where(has_window,
+                                 large_sum[stop] - large_sum[start], 0)
+            num_significant = np.where(has_window,
+                                       significant_sum[stop] -
+                                       significant_sum[start], 0)
+            # keep breaks without large positive gradients around them, or
+            # where at least one of those gradients has a significant UT change
+            ind = ind[(num_large == 0) | (num_significant > 0)]
 
         # now, assemble some orbit breaks that are not triggered by changes in
         # the orbit index
@@ -375,12 +398,13 @@ class Orbits(object):
                                           'Provided orbit index does not ',
                                           'appear to exist in loaded data')))
 
-        # determine where the orbit index changes from one value to the next
-        uniq_vals = np.unique(self.sat[self.orbit_index].values)
-        orbit_index = []
-        for val in uniq_vals:
-            idx, = np.where(val == self.sat[self.orbit_index].values)
-            orbit_index.append(idx[0])
+        # determine where the orbit index changes from one value to the next,
+        # first location of each unique value, in order of value. Samples
+        # without an orbit number do not start a new orbit
+        values = self.sat[self.orbit_index].values
+        good, = np.where(pds.notnull(values))
+        _, orbit_index = np.unique(values[good], return_index=True)
+        orbit_index = good[orbit_index]
 
         # create orbitbreak index, ensure first element is always 0
         if len(orbit_index) > 0:
@@ -397,6 +421,27 @@ class Orbits(object):
         # set number of orbits for the day
         self.num = num_orbits
 
+    def _boundary_buffer(self, data, start=None, stop=None):
+        """Return the times of data between start and stop, inclusive.
+
+        Used to keep the part of an orbit that spans a day boundary without
+        copying the whole Instrument. Not intended for end user.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame or xarray.Dataset
+            orbit data
+        start : datetime or NoneType
+            first time kept, None for the start of data
+        stop : datetime or NoneType
+            last time kept, None for the end of data
+
+        """
+        if self.sat.pandas_format:
+            return data.loc[start:stop]
+        else:
+            return data.sel(time=slice(start, stop))
+
     def _getBasicOrbit(self, orbit=None):
         """Load a particular orbit into .data for loaded day.
 
@@ -455,21 +500,35 @@ class Orbits(object):
             else:
                 raise ValueError('Must set an orbit')
 
-    def load(self, orbit=None):
+    def load(self, orbit=None, orbit_number=None):
         """Load a particular orbit into .data for loaded day.
 
         Parameters
         ----------
         orbit : int
             orbit number, 1 indexed
+        orbit_number : int or NoneType
+            mission orbit number, 0 indexed, from the OrbitTable assigned to
+            inst.orbits.table. Only the files that hold the orbit are loaded,
+            no day needs to be loaded first. (default=None)
 
         Note
         ----
         A day of data must be loaded before this routine functions properly.
         If the last orbit of the day is requested, it will automatically be
         padded with data from the next day. The orbit counter will be
-        reset to 1.
+        reset to 1. After loading by orbit_number, next and prev move to
+        the neighbouring mission orbits in the table until a day or file is
+        loaded again.
         """
+        if orbit_number is not None:
+            if self.table is None:
+                raise ValueError('Loading by mission orbit number requires ' +
+                                 'a pysat.OrbitTable assigned to ' +
+                                 'inst.orbits.table')
+            self.table.load(orbit_number)
+            return
+
         if not self.sat.empty:  # ensure data exists
             # set up orbit metadata
             self._calcOrbits()
@@ -587,8 +646,16 @@ class Orbits(object):
         ----
         Forms complete orbits across day boundaries. If no data loaded
         then the first orbit from the first date of data is returned.
+        If the current orbit was loaded by mission orbit number, the next
+        mission orbit in the table is loaded.
         """
 
+        if self._table_orbit is not None:
+            if self._table_orbit + 1 >= len(self.table):
+                raise StopIteration('Outside the orbit table.')
+            self.table.load(self._table_orbit + 1)
+            return
+
         # first, check if data exists
         if not self.sat.empty:
             # set up orbit metadata
@@ -612,7 +679,7 @@ class Orbits(object):
                     # the end of the user's desired orbit occurs tomorrow, need
                     # to form a complete orbit save this current orbit, load
                     # the next day, combine data, select the correct orbit
-                    temp_orbit_data = self.sat.copy()
+                    temp_orbit_data = self.sat.data
                     try:
                         # loading next day/file clears orbit breaks info
                         self.sat.next()
@@ -622,7 +689,8 @@ class Orbits(object):
                             final_val = self.sat.index[0] \
                                 - pds.DateOffset(microseconds=1)
                             self.sat.data = self.sat.concat_data(
-                                [temp_orbit_data[:final_val],
+                                [self._boundary_buffer(temp_orbit_data,
+                                                       stop=final_val),
                                  self.sat.data])
                             self._getBasicOrbit(orbit=1)
                         else:
@@ -639,8 +707,7 @@ class Orbits(object):
             elif self._current == (self.num):
                 # at the last orbit, need to be careful about getting the next
                 # orbit save this current orbit and load the next day
-                # temp_orbit_data = self.sat.data.copy()
-                temp_orbit_data = self.sat.copy()
+                temp_orbit_data = self.sat.data
                 # load next day, which clears orbit breaks info
                 self.sat.next()
                 # combine this next day orbit with previous last orbit to
@@ -650,7 +717,8 @@ class Orbits(object):
                     # check if data padding is really needed, only works when
                     # loading by date
                     if self.sat._iter_type == 'date':
-                        delta = self.sat.date - temp_orbit_data.index[-1]
+                        delta = self.sat.date \
+                            - self.sat._index(temp_orbit_data)[-1]
                         if delta >= self.orbit_period:
                             # the end of the previous orbit is more than an
                             # orbit away from today we don't have to worry
@@ -659,9 +727,11 @@ class Orbits(object):
                     if pad_next:
                         # orbit went across day break, stick old orbit onto new
                         # data and grab second orbit (first is old)
+                        final_val = self.sat.index[0] \
+                            - pds.DateOffset(microseconds=1)
                         self.sat.data = self.sat.concat_data(
-                            [temp_orbit_data[:self.sat.index[0] -
-                                             pds.DateOffset(microseconds=1)],
+                            [self._boundary_buffer(temp_orbit_data,
+                                                   stop=final_val),
                              self.sat.data])
                         # select second orbit of combined data
                         self._getBasicOrbit(orbit=2)
@@ -732,8 +802,16 @@ class Orbits(object):
         ----
         Forms complete orbits across day boundaries. If no data loaded
         then the last orbit of data from the last day is loaded into .data.
+        If the current orbit was loaded by mission orbit number, the previous
+        mission orbit in the table is loaded.
         """
 
+        if self._table_orbit is not None:
+            if self._table_orbit == 0:
+                raise StopIteration('Outside the orbit table.')
+            self.table.load(self._table_orbit - 1)
+            return
+
         # first, check if data exists
         if not self.sat.empty:
             # set up orbit metadata
@@ -761,7 +839,8 @@ class Orbits(object):
 
                 if load_prev:
                     # need to save this current orbit and load the prev day
-                    temp_orbit_data = self.sat[self.sat.date:]
+                    temp_orbit_data = self._boundary_buffer(
+                        self.sat.data, start=self.sat.date)
                     # load previous day, which clears orbit breaks info
 
                     try:
@@ -795,7 +874,8 @@ class Orbits(object):
                 # first, load prev orbit data
                 self._getBasicOrbit(orbit=1)
                 # need to save this current orbit and load the prev day
-                temp_orbit_data = self.sat[self.sat.date:]
+                temp_orbit_data = self._boundary_buffer(self.sat.data,
+                                                        start=self.sat.date)
                 # load previous day, which clears orbit breaks info
                 self.sat.prev()
                 # combine this next day orbit with previous last orbit
@@ -875,3 +955,243 @@ class Orbits(object):
                 yield self.sat
             except StopIteration:
                 return
+
+
+class OrbitTable(object):
+    """Persistent table of the orbits within every file of an Instrument.
+
+    The Instrument archive is scanned once, file by file, to find the start
+    and stop time of every orbit along with the files holding its data.
+    Orbits that span files are stitched together as in Orbits.next. The
+    table is stored along with the times covered by each file, so later
+    updates only scan new files and the files near them.
+
+    Parameters
+    ----------
+    sat : pysat.Instrument
+        instrument, with orbit_info set, to determine orbits for
+    fname : str or NoneType
+        File used to store the table. If None, the table is stored in the
+        pysat directory next to the stored file list for sat, or only kept
+        in memory if the file list is not written to disk. (default=None)
+    update : bool
+        If True, the table is updated with any new files when created.
+        (default=True)
+
+    Attributes
+    ----------
+    data : pandas.DataFrame
+        'start' and 'stop' time and tuple of 'files' for each orbit, indexed
+        by mission orbit number beginning with zero
+
+    Note
+    ----
+    Files are loaded into sat while the table is updated. The last orbit in
+    the table may be incomplete and is redetermined by the next update.
+
+    Examples
+    --------
+    ::
+
+        info = {'index': 'mlt', 'kind': 'local time'}
+        ivm = pysat.Instrument('cnofs', 'ivm', orbit_info=info)
+        ivm.orbits.table = pysat.OrbitTable(ivm)
+        print(ivm.orbits.table.data)
+
+        # load mission orbit 1000 without loading the surrounding days
+        ivm.orbits.load(orbit_number=1000)
+
+        # later, after new files have been downloaded
+        ivm.orbits.table.update()
+
+    """
+
+    def __init__(self, sat, fname=None, update=True):
+        self.sat = sat
+        if (fname is None) and sat.files.write_to_disk:
+            fname = os.path.join(sat.files.home_path,
+                                 ''.join((sat.platform, '_', sat.name, '_',
+                                          sat.tag, '_', sat.sat_id,
+                                          '_orbit_table.pkl')))
+        self.fname = fname
+        self.params = repr([sat.platform, sat.name, sat.tag, sat.sat_id,
+                            sat.orbits.orbit_index, sat.orbits.kind,
+                            str(sat.orbits.orbit_period)])
+        self.data = pds.DataFrame({'start': pds.DatetimeIndex([]),
+                                   'stop': pds.DatetimeIndex([]),
+                                   'files': pds.Series([], dtype=object)})
+        self.data.index.name = 'orbit'
+        # first and last time of data within each scanned file, NaT if empty
+        self._spans = pds.DataFrame({'first': pds.DatetimeIndex([]),
+                                     'last': pds.DatetimeIndex([])})
+
+        if (fname is not None) and os.path.isfile(fname):
+            with open(fname, 'rb') as fin:
+                stored = pickle.load(fin)
+            if stored['params'] == self.params:
+                self.data = stored['data']
+                self._spans = stored['spans']
+            else:
+                print('Orbit table ' + fname + ' was created with different ' +
+                      'orbit parameters and will be rebuilt.')
+
+        if update:
+            self.update()
+
+    def __len__(self):
+        return len(self.data)
+
+    def save(self):
+        """Write the table to file, if there is one."""
+
+        if self.fname is None:
+            return
+
+        stored = {'params': self.params, 'data': self.data,
+                  'spans': self._spans}
+        temp_name = self.fname + '.tmp'
+        with open(temp_name, 'wb') as fout:
+            pickle.dump(stored, fout, protocol=pickle.HIGHEST_PROTOCOL)
+        # the previous table is only replaced by a complete one
+        _replace(temp_name, self.fname)
+
+    def update(self):
+        """Add orbits from files that have not been scanned to the table.
+
+        Orbits that end before the first new file are kept, except for the
+        last of them, which may continue into the new file. Scanning resumes
+        from the start of that orbit.
+
+        """
+
+        files = self.sat.files.files
+        new = np.logical_not(files.isin(self._spans.index)).values
+        if not np.any(new):
+            return
+
+        # resume from the start of the last orbit that is kept as is
+        first_new = files.index[new][0]
+        keep = np.sum((self.data['stop'] < first_new).values) - 1
+        resume = None
+        if keep >= 0:
+            resume = self.data['start'].iloc[keep]
+            # rescan every file with data from resume onward
+            spans = self._spans.reindex(files.values)
+            rescan = (spans['last'] >= resume).values
+            if np.any(rescan):
+                first_new = min(first_new, files.index[rescan][0])
+        else:
+            # no orbit is known to be complete, rescan everything
+            keep = 0
+            first_new = files.index[0]
+        self.data = self.data.iloc[:keep]
+        scan = files[files.index >= first_new]
+        self._spans = self._spans.drop(scan.values, errors='ignore')
+
+        rows = self._scan(scan.values, resume)
+        if len(rows) > 0:
+            rows = pds.DataFrame(rows, columns=['start', 'stop', 'files'])
+            rows.index = np.arange(keep, keep + len(rows))
+            rows.index.name = 'orbit'
+            self.data = pds.concat([self.data, rows])
+        self.save()
+
+    def _scan(self, fnames, resume=None):
+        """Determine the orbits within files. Not intended for end user.
+
+        Parameters
+        ----------
+        fnames : list-like
+            filenames to scan, in time order
+        resume : datetime or NoneType
+            data before resume is ignored, the start of an orbit
+
+        Returns
+        -------
+        list
+            (start, stop, files) for each orbit
+
+        """
+
+        sat = self.sat
+        rows = []
+        tail = None
+        tail_files = []
+        for fname in fnames:
+            sat.load(fname=fname)
+            if sat.empty:
+                self._spans.loc[fname] = [pds.NaT, pds.NaT]
+                continue
+            self._spans.loc[fname] = [sat.index[0], sat.index[-1]]
+
+            data = sat.data
+            if resume is not None:
+                data = sat.orbits._boundary_buffer(data, start=resume)
+                if sat._empty(data):
+                    continue
+            if tail is not None:
+                data = sat.concat_data([tail, data])
+            tail_files.append(fname)
+
+            # determine orbit breaks within combined data
+            sat.data = data
+            sat.orbits._reset()
+            sat.orbits._detBreaks()
+            breaks = list(sat.orbits._orbit_breaks) + [len(sat.index)]
+            for start, stop in zip(breaks[:-2], breaks[1:-1]):
+                rows.append(self._row(sat.index[start], sat.index[stop - 1],
+                                      tail_files))
+            # the last orbit may continue in the next file
+            tail = sat[breaks[-2]:]
+            tail_files = [fname for fname in tail_files
+                          if self._spans.loc[fname, 'last'] >=
+                          sat.index[breaks[-2]]]
+
+        if tail is not None:
+            index = sat._index(tail)
+            rows.append(self._row(index[0], index[-1], tail_files))
+        return rows
+
+    def _row(self, start, stop, fnames):
+        """Return (start, stop, files) for an orbit. Not intended for end
+        user."""
+
+        spans = self._spans.loc[fnames]
+        overlap = ((spans['first'] <= stop) & (spans['last'] >= start)).values
+        return (start, stop, tuple(np.asarray(fnames)[overlap]))
+
+    def load(self, orbit_number):
+        """Load a mission orbit into sat.data.
+
+        Parameters
+        ----------
+        orbit_number : int
+            mission orbit number, 0 indexed, negative numbers count back from
+            the last orbit
+
+        Note
+        ----
+        Only the files holding the orbit are loaded. The day based orbit
+        state of sat.orbits is reset, so sat.orbits.next and prev continue
+        from this orbit through the table.
+
+        """
+
+        if (orbit_number >= len(self)) or (orbit_number < -len(self)):
+            raise ValueError('Requested an orbit past total orbits in table')
+        start, stop, fnames = self.data.iloc[orbit_number]
+
+        sat = self.sat
+        data = []
+        for fname in fnames:
+            sat.load(fname=fname)
+            data.append(sat.orbits._boundary_buffer(sat.data, start=start,
+                                                    stop=stop))
+        if len(data) > 1:
+            sat.data = sat.concat_data(data)
+        else:
+            sat.data = data[0]
+        # orbit breaks found by the file loads do not apply to a single orbit
+        sat.orbits._reset()
+        sat.orbits._table_orbit = orbit_number % len(self)
+        print('Loaded mission orbit:%i' % (orbit_number % len(self)))
@@ -49,6 +49,7 @@ import sys
 
 import netCDF4
 import pysat
+from pysat.instruments.methods import general
 
 platform = 'cosmic'
 name = 'gps'
@@ -62,6 +63,9 @@ test_dates = {'': {'ionprf': pysat.datetime(2008, 1, 1),
                    'wetprf': pysat.datetime(2008, 1, 1),
                    'atmprf': pysat.datetime(2008, 1, 1)}}
 
+# the load routine accepts files spanning several days
+multi_day_load = True
+
 
 def list_files(tag=None, sat_id=None, data_path=None, format_str=None):
     """Return a Pandas Series of every file for chosen satellite data.
@@ -128,7 +132,7 @@ def list_files(tag=None, sat_id=None, data_path=None, format_str=None):
         return pysat.Series(None)
 
 
-def load(fnames, tag=None, sat_id=None):
+def load(fnames, tag=None, sat_id=None, variables=None, workers=1):
     """Load COSMIC GPS files.
 
     Parameters
@@ -139,6 +143,13 @@ def load(fnames, tag=None, sat_id=None):
         tag or None (default=None)
     sat_id : (str or NoneType)
         satellite id or None (default=None)
+    variables : (list or NoneType)
+        Names of the profile variables to read, see load_files. File
+        attributes are always read. (default=None)
+    workers : (int or NoneType)
+        Number of processes reading files at once. A day holds thousands of
+        small files, so reading several at once reduces load times. If None,
+        the number of CPUs is used. (default=1)
 
     Returns
     -------
@@ -152,9 +163,10 @@ def load(fnames, tag=None, sat_id=None):
     num = len(fnames)
     # make sure there are files to read
     if num != 0:
-        # call separate load_files routine, segemented for possible
-        # multiprocessor load, not included and only benefits about 20%
-        output = pysat.DataFrame(load_files(fnames, tag=tag, sat_id=sat_id))
+        # call separate load_files routine, which may read many files at once
+        output = pysat.DataFrame(load_files(fnames, tag=tag, sat_id=sat_id,
+                                            variables=variables,
+                                            workers=workers))
         utsec = output.hour * 3600. + output.minute * 60. + output.second
         output.index = \
             pysat.utils.time.create_datetime_index(year=output.year,
@@ -176,6 +188,8 @@ def load(fnames, tag=None, sat_id=None):
                     meta[d] = {'units': '', 'long_name': d}
                 keys = data.variables.keys()
                 for key in keys:
+                    if (variables is not None) and (key not in variables):
+                        continue
                     profile_meta[key] = {'units': data.variables[key].units,
                                          'long_name':
                                          data.variables[key].long_name}
@@ -190,15 +204,11 @@ def load(fnames, tag=None, sat_id=None):
         return pysat.DataFrame(None), pysat.Meta()
 
 
-# seperate routine for doing actual loading. This was broken off from main load
-# becuase I was playing around with multiprocessor loading
-# yielded about 20% improvement in execution time
-def load_files(files, tag=None, sat_id=None, altitude_bin=None):
+def load_files(files, tag=None, sat_id=None, altitude_bin=None,
+               variables=None, workers=1):
     """Load COSMIC data files directly from a given list.
 
-    May be directly called by user, but in general is called by load.  This is
-    separate from the main load function for future support of multiprocessor
-    loading.
+    May be directly called by user, but in general is called by load.
 
     Parameters
     ----------
@@ -211,6 +221,13 @@ def load_files(files, tag=None, sat_id=None, altitude_bin=None):
     altitude_bin : integer
         Number of kilometers to bin altitude profiles by when loading.
         Currently only supported for tag='ionprf'.
+    variables : (list or NoneType)
+        Names of the netCDF variables to read into each profile, other
+        variables are not read. MSL_alt is always read for tag='ionprf'.
+        If None, all variables are read. (default=None)
+    workers : (int or NoneType)
+        Number of processes reading files at once, see
+        pysat.instruments.methods.general.map_files. (default=1)
 
     Returns
     -------
@@ -218,41 +235,14 @@ def load_files(files, tag=None, sat_id=None, altitude_bin=None):
         Object containing satellite data
 
     """
-    output = [None] * len(files)
-    drop_idx = []
-    for (i, file) in enumerate(files):
-        try:
-            data = netCDF4.Dataset(file)
-            # build up dictionary will all ncattrs
-            new = {}
-            # get list of file attributes
-            ncattrsList = data.ncattrs()
-            for d in ncattrsList:
-                new[d] = data.getncattr(d)
-            # load all of the variables in the netCDF
-            loadedVars = {}
-            keys = data.variables.keys()
-            for key in keys:
-                if data.variables[key][:].dtype.byteorder != '=':
-                    loadedVars[key] = \
-                        data.variables[key][:].byteswap().newbyteorder()
-                else:
-                    loadedVars[key] = data.variables[key][:]
-
-            new['profiles'] = pysat.DataFrame(loadedVars)
-
-            output[i] = new
-            data.close()
-        except RuntimeError:
-            # some of the files have zero bytes, which causes a read error
-            # this stores the index of these zero byte files so I can drop
-            # the Nones the gappy file leaves behind
-            drop_idx.append(i)
+    if (variables is not None) and (tag == 'ionprf'):
+        # altitude is used to index profiles
+        variables = list(variables) + ['MSL_alt']
+    output = general.map_files(load_file, files, workers=workers,
+                               variables=variables)
 
     # drop anything that came from the zero byte files
-    drop_idx.reverse()
-    for i in drop_idx:
-        del output[i]
+    output = [out for out in output if out is not None]
 
     if tag == 'ionprf':
         if altitude_bin is not None:
@@ -268,6 +258,54 @@ def load_files(files, tag=None, sat_id=None, altitude_bin=None):
     return output
 
 
+def load_file(fname, variables=None):
+    """Load a single COSMIC data file.
+
+    Parameters
+    ----------
+    fname : (str)
+        Filename
+    variables : (list or NoneType)
+        Names of the netCDF variables to read into the profile, other
+        variables are not read. If None, all variables are read.
+        (default=None)
+
+    Returns
+    -------
+    output : (dict or NoneType)
+        File attributes along with the profile DataFrame under 'profiles'.
+        None if the file could not be read.
+
+    """
+    try:
+        data = netCDF4.Dataset(fname)
+        # build up dictionary will all ncattrs
+        new = {}
+        # get list of file attributes
+        ncattrsList = data.ncattrs()
+        for d in ncattrsList:
+            new[d] = data.getncattr(d)
+        # load all of the variables in the netCDF
+        loadedVars = {}
+        keys = data.variables.keys()
+        if variables is not None:
+            keys = [key for key in keys if key in variables]
+        for key in keys:
+            if data.variables[key][:].dtype.byteorder != '=':
+                loadedVars[key] = \
+                    data.variables[key][:].byteswap().newbyteorder()
+            else:
+                loadedVars[key] = data.variables[key][:]
+
+        new['profiles'] = pysat.DataFrame(loadedVars)
+        data.close()
+    except RuntimeError:
+        # some of the files have zero bytes, which causes a read error
+        return None
+
+    return new
+
+
 def download(date_array, tag, sat_id, data_path=None,
              user=None, password=None):
     """Download COSMIC GPS data.
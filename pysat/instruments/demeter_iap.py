@@ -53,6 +53,9 @@ apid = {'survey': 1140, 'burst': 1139}
 
 multi_file_day = True
 
+# the load routine accepts files spanning several days
+multi_day_load = True
+
 # Use default demeter download method
 download = demeter.download
 
@@ -114,7 +117,7 @@ def list_files(tag="survey", sat_id='', data_path=None, format_str=None,
     return pysat.Files.from_os(data_path=data_path, format_str=format_str)
 
 
-def load(fnames, tag='survey', sat_id=''):
+def load(fnames, tag='survey', sat_id='', start=None, stop=None):
     """ Load DEMETER IAP data
 
     Parameters
@@ -127,6 +130,13 @@ def load(fnames, tag='survey', sat_id=''):
     sat_id : (string or NoneType)
         Specifies the satellite ID for a constellation.  Not used.
         (default='')
+    start : (datetime or NoneType)
+        Start of the time window to load, earlier records are skipped
+        without being decoded.  If None, all earlier records are loaded.
+        (default=None)
+    stop : (datetime or NoneType)
+        Exclusive end of the time window to load.  If None, all later
+        records are loaded. (default=None)
 
     Returns
     -------
@@ -143,36 +153,57 @@ def load(fnames, tag='survey', sat_id=''):
 
     # Load the desired data and cast as a DataFrame
     data = list()
+    meta_dict = dict()
     for fname in fnames:
-        fdata, fmeta = demeter.load_binary_file(fname,
-                                                load_experiment_data)
-        data.extend(fdata)
+        fdata, fmeta = demeter.load_binary_file(fname, experiment_dtype,
+                                                load_experiment_data,
+                                                start=start, stop=stop)
+        data.append(fdata)
+        if len(fmeta) > 0:
+            meta_dict = fmeta
 
-    data = np.vstack(data)
-    data = pysat.DataFrame(data, index=data[:, 3], columns=fmeta['data names'])
+    data = pds.concat(data)
+    if len(data.columns) == 0:
+        data = pysat.DataFrame(None, columns=meta_dict.get('data names'))
 
     # Assign metadata
     if len(data.columns) > 0:
-        meta = demeter.set_metadata(name, fmeta)
+        meta = demeter.set_metadata(name, meta_dict)
     else:
         meta = pysat.Meta(None)
 
     return data, meta
 
 
-def load_experiment_data(fhandle):
-    """ Load survey mode binary file
+experiment_names = ['H+_density', 'He+_density', 'O+_density',
+                    'Ion_temperature', 'iv_Oz', 'iv_negOz_angle',
+                    'iv_xOy_Ox_angle', 'satellite_potential']
+
+# Big-endian layout of the survey mode experiment data block
+experiment_dtype = np.dtype([('data type', 'S10'),
+                             ('status_flag', 'u1', (32,)),
+                             ('time_resolution', '>f4'),
+                             ('density units', 'S6'),
+                             ('temperature units', 'S6'),
+                             ('velocity units', 'S6'),
+                             ('potential units', 'S6'),
+                             ('angle units', 'S6')]
+                            + [(ename, '>f4') for ename in experiment_names])
+
+
+def load_experiment_data(block):
+    """ Decode survey mode experiment data
 
     Parameters
     ----------
-    fhandle : (file)
-        file handle
+    block : np.ndarray
+        Structured array of experiment data blocks, with experiment_dtype
 
     Returns
     -------
-    data : np.ndarray
-        Numpy array of data values containing: housekeeping and status,
-        H+ density, He+ density, O+ density, Ion tempearture,
+    data : dict
+        Dictionary of data arrays for keys: housekeeping and status,
+        time resolution, H+ density, He+ density, O+ density, Ion tempearture,
         ion velocity along Oz axis, angle between ion velocity and -Oz axis,
         angle between projection of ion velocity on the xOy plane and Ox axis,
         satellite potential
@@ -181,48 +212,49 @@ def load_experiment_data(fhandle):
         'data names'
 
     """
-    import codecs  # ensures encode is python 2/3 compliant
 
-    chunk = fhandle.read(108)
-
-    data = list()
+    data = dict()
     data_names = list()
     data_units = dict()
+
     # Load the house-keeping and status flags
+    flags = block['status_flag'].astype(np.int64)
     for i in range(32):
-        data.append(int(codecs.encode(chunk[10+i], 'hex'), 16))
         data_names.append('status_flag_{:02d}'.format(i))
+        data[data_names[-1]] = flags[:, i]
         data_units[data_names[-1]] = "N/A"
 
-    data.append(demeter.bytes_to_float(chunk[42:46]))  # Time resolution
     data_names.append('time_resolution')
+    data[data_names[-1]] = block['time_resolution'].astype(np.float64)
     data_units[data_names[-1]] = "s"
 
     # Load the rest of the data
-    i = 76
-    exp_data = ['H+_density', 'He+_density', 'O+_density', 'Ion_temperature',
-                'iv_Oz', 'iv_negOz_angle', 'iv_xOy_Ox_angle',
-                'satellite_potential']
-    while i < 108:
-        data.append(demeter.bytes_to_float(chunk[i:i+4]))
-        i += 4
-    data_names.extend(exp_data)
-
-    for dname in exp_data:
+    for dname in experiment_names:
+        data[dname] = block[dname].astype(np.float64)
+    data_names.extend(experiment_names)
+
+    # Load the metadata, which is the same for every record
+    meta = {'data names': data_names, 'data units': data_units}
+    if len(block) == 0:
+        return data, meta
+
+    units = {ukey: block[ukey][0].decode('ascii', 'replace').strip()
+             for ukey in ['density units', 'temperature units',
+                          'velocity units', 'potential units', 'angle units']}
+    for dname in experiment_names:
         if dname.find('density') > 0:
-            data_units[dname] = chunk[46:52]
+            data_units[dname] = units['density units']
         elif dname.find('temperature') > 0:
-            data_units[dname] = chunk[52:58]
+            data_units[dname] = units['temperature units']
         elif dname.find('potential') > 0:
-            data_units[dname] = chunk[64:70]
+            data_units[dname] = units['potential units']
         elif dname.find('angle') > 0:
-            data_units[dname] = chunk[70:76]
+            data_units[dname] = units['angle units']
         elif dname.find('iv') == 0:
-            data_units[dname] = chunk[58:64]
+            data_units[dname] = units['velocity units']
 
-    # Load the metadata
-    meta = {'data type': chunk[0:10], 'data names': data_names,
-            'data units': data_units}
+    meta['data type'] = block['data type'][0].decode('ascii',
+                                                     'replace').strip()
 
     return data, meta
 
@@ -50,6 +50,9 @@ tags = {'level_2': 'Level 2 public geophysical data'}
 sat_ids = {'': ['level_2']}
 test_dates = {'': {'level_2': pysat.datetime(2017, 5, 27)}}
 
+# the load routine accepts files spanning several days
+multi_day_load = True
+
 
 def init(self):
     """Initializes the Instrument object with instrument specific values.
@@ -128,7 +131,8 @@ def default(inst):
     icivm.remove_icon_names(inst, target='ICON_L2_FUV_Daytime_ON2_')
 
 
-def load(fnames, tag=None, sat_id=None):
+def load(fnames, tag=None, sat_id=None, variables=None, start=None,
+         stop=None):
     """Loads ICON FUV data using pysat into pandas.
 
     This routine is called as needed by pysat. It is not intended
@@ -145,6 +149,16 @@ def load(fnames, tag=None, sat_id=None):
     sat_id : string
         Satellite ID used to identify particular data set to be loaded.
         This input is nominally provided by pysat itself.
+    variables : list-like or NoneType
+        Names of the file variables to load. If None, all variables
+        are loaded. (default=None)
+    start : datetime or NoneType
+        Start of the time window to load, only records within the window
+        are read. If None, records from the start of each file are loaded.
+        (default=None)
+    stop : datetime or NoneType
+        Exclusive end of the time window to load. If None, records to the
+        end of each file are loaded. (default=None)
     **kwargs : extra keywords
         Passthrough for additional keyword arguments specified when
         instantiating an Instrument object. These additional keywords
@@ -179,7 +193,9 @@ def load(fnames, tag=None, sat_id=None):
                                     scale_label='ScaleTyp',
                                     min_label='ValidMin',
                                     max_label='ValidMax',
-                                    fill_label='FillVal')
+                                    fill_label='FillVal',
+                                    variables=variables,
+                                    start=start, stop=stop)
 
 
 def list_files(tag=None, sat_id=None, data_path=None, format_str=None):
@@ -54,6 +54,9 @@ sat_ids = {'a': ['level_2'],
 test_dates = {'a': {'level_2': pysat.datetime(2018, 1, 1)},
               'b': {'level_2': pysat.datetime(2018, 1, 1)}}
 
+# the load routine accepts files spanning several days
+multi_day_load = True
+
 
 def init(self):
     """Initializes the Instrument object with instrument specific values.
@@ -95,7 +98,8 @@ def default(inst):
     remove_icon_names(inst)
 
 
-def load(fnames, tag=None, sat_id=None):
+def load(fnames, tag=None, sat_id=None, variables=None, start=None,
+         stop=None):
     """Loads ICON IVM data using pysat into pandas.
 
     This routine is called as needed by pysat. It is not intended
@@ -112,6 +116,16 @@ def load(fnames, tag=None, sat_id=None):
     sat_id : string
         Satellite ID used to identify particular data set to be loaded.
         This input is nominally provided by pysat itself.
+    variables : list-like or NoneType
+        Names of the file variables to load. If None, all variables
+        are loaded. (default=None)
+    start : datetime or NoneType
+        Start of the time window to load, only records within the window
+        are read. If None, records from the start of each file are loaded.
+        (default=None)
+    stop : datetime or NoneType
+        Exclusive end of the time window to load. If None, records to the
+        end of each file are loaded. (default=None)
     **kwargs : extra keywords
         Passthrough for additional keyword arguments specified when
         instantiating an Instrument object. These additional keywords
@@ -146,7 +160,9 @@ def load(fnames, tag=None, sat_id=None):
                                     scale_label='ScaleTyp',
                                     min_label='ValidMin',
                                     max_label='ValidMax',
-                                    fill_label='FillVal')
+                                    fill_label='FillVal',
+                                    variables=variables,
+                                    start=start, stop=stop)
 
 
 def list_files(tag=None, sat_id=None, data_path=None, format_str=None):
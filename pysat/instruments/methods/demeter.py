@@ -3,7 +3,11 @@
 
 from __future__ import absolute_import, division, print_function
 
+import os
+
 import numpy as np
+import pandas as pds
+
 import pysat
 
 
@@ -41,44 +45,78 @@ def list_remote_files(tag, sat_id):
     return
 
 
-def bytes_to_float(chunk):
-    """ Convert a chunk of bytes to a float
+# Each time in a DEMETER level 1 file is a fixed size record of big-endian
+# blocks: the general header, the orbital and geomagnetic parameters, the
+# attitude parameters, and the experiment data, which depends on the
+# instrument.  The record layout is described by numpy structured dtypes, so
+# that a file may be memory-mapped and decoded a column at a time.
+general_header_names = ['P_field', 'epoch_time', 'time_of_day', 'UT',
+                        'orbit_number', 'orbit_type']
+general_header_units = {'P_field': 'N/A',
+                        'epoch_time': 'days since 1/1/1950',
+                        'time_of_day': 'ms', 'UT': 'datetime',
+                        'orbit_number': 'N/A', 'orbit_type': 'N/A'}
+general_header_dtype = np.dtype([('P_field', 'u1'),
+                                 ('epoch_time', 'u1', (3,)),
+                                 ('time_of_day', '>u4'),
+                                 ('year', '>u2'),
+                                 ('month', '>u2'),
+                                 ('day', '>u2'),
+                                 ('hour', '>u2'),
+                                 ('minute', '>u2'),
+                                 ('second', '>u2'),
+                                 ('millisecond', '>u2'),
+                                 ('orbit_number', '>u2'),
+                                 ('orbit_type', '>u2'),
+                                 ('telemetry station', 'S8'),
+                                 ('software processing version', 'u1'),
+                                 ('software processing subversion', 'u1'),
+                                 ('calibration file version', 'u1'),
+                                 ('calibration file subversion', 'u1')])
+
+location_names = ['glat', 'glon', 'altitude', 'LT', 'mlat', 'mlon', 'MLT',
+                  'ilat', 'L', 'glat_conj', 'glon_conj', 'glat_conj_N_110km',
+                  'glon_conj_N_110km', 'glat_conj_S_110km',
+                  'glon_conj_S_110km', 'mag_comp_1', 'mag_comp_2',
+                  'mag_comp_3', 'proton_gyrofreq', 'Xs', 'Ys', 'Zs']
+location_units = {'glat': 'degrees', 'glon': 'degrees', 'altitude': 'km',
+                  'LT': 'h', 'mlat': 'degrees', 'mlon': 'degrees', 'MLT': 'h',
+                  'ilat': 'degrees', 'L': 'Earth_Radii',
+                  'glat_conj': 'degrees', 'glon_conj': 'degrees',
+                  'glat_conj_N_110km': 'degrees',
+                  'glon_conj_N_110km': 'degrees',
+                  'glat_conj_S_110km': 'degrees',
+                  'glon_conj_S_110km': 'degrees', 'mag_comp_1': 'nT',
+                  'mag_comp_2': 'nT', 'mag_comp_3': 'nT',
+                  'proton_gyrofreq': 'Hz', 'Xs': 'N/A', 'Ys': 'N/A',
+                  'Zs': 'N/A'}
+location_dtype = np.dtype([(lname, '>f4') for lname in location_names]
+                          + [('software processing version', 'u1'),
+                             ('software processing subversion', 'u1')])
+
+attitude_names = ['{:s}_{:d}{:d}'.format(mname, j, k)
+                  for mname in ['sat2geo', 'geo2lgm']
+                  for j in range(1, 4) for k in range(1, 4)]
+attitude_names.append('attitude_flag')
+attitude_units = {aname: 'unitless' for aname in attitude_names}
+attitude_dtype = np.dtype([(aname, '>f4') for aname in attitude_names[:-1]]
+                          + [('attitude_flag', '>u2'),
+                             ('software processing version', 'u1'),
+                             ('software processing subversion', 'u1')])
+
+
+def decode_general_header(block):
+    """ Decode the general header block (block 1 for each time)
 
     Parameters
     ------------
-    chunk : string or bytes
-       A chunk of bytes
-
-    Returns
-    --------
-    value : float
-        A 32 bit float
-
-    """
-    import sys
-    import struct
-    import codecs
-
-    if sys.version_info.major == 2:
-        decoded = codecs.encode(chunk, 'hex').decode('hex')
-    else:
-        decoded = bytes.fromhex(codecs.encode(chunk, 'hex'))
-
-    return struct.unpack("!f", decoded)[0]
-
-
-def load_general_header(fhandle):
-    """ Load the general header block (block 1 for each time)
-
-    Parameters
-    ------------
-    fhandle : (file handle)
-        File handle
+    block : np.ndarray
+        Structured array of general header blocks, with general_header_dtype
 
     Returns
     ----------
-    data : list
-        List of data values containing: P field,
+    data : dict
+        Dictionary of data arrays for keys: P field,
         Number of days from 01/01/1950, number of miliseconds in the day,
         UT as datetime, Orbit number, downward (False) upward (True) indicator
     meta : dict
@@ -88,64 +126,44 @@ def load_general_header(fhandle):
         'data names', 'data units'
 
     """
-    import codecs  # ensures encode is python 2/3 compliant
-    import datetime as dt
-
-    block_size = 38  # Position block is 38 bytes
-    chunk = fhandle.read(block_size)
-
-    if len(chunk) != block_size:
-        return list(), dict()
-
-    # Extract UT timestamp for conversion into datetime object
-    year = int(codecs.encode(chunk[8:10], 'hex'), 16)
-    month = int(codecs.encode(chunk[10:12], 'hex'), 16)
-    day = int(codecs.encode(chunk[12:14], 'hex'), 16)
-    hour = int(codecs.encode(chunk[14:16], 'hex'), 16)
-    minute = int(codecs.encode(chunk[16:18], 'hex'), 16)
-    sec = int(codecs.encode(chunk[18:20], 'hex'), 16)
-    microsec = int(codecs.encode(chunk[20:22], 'hex'), 16) * 1000
-    dtime = dt.datetime(year, month, day, hour, minute, sec, microsec)
-
-    data = [int(codecs.encode(chunk[0], 'hex'), 16),  # P field
-            int(codecs.encode(chunk[1:4], 'hex'), 16),  # Days since 1/1/1950
-            int(codecs.encode(chunk[4:8], 'hex'), 16),  # Millisec in day
-            dtime,  # UT timestamp
-            int(codecs.encode(chunk[22:24], 'hex'), 16),  # Orbit number
-            bool(int(codecs.encode(chunk[24:26], 'hex'), 16))]  # Orbit type
-
-    meta = {'telemetry station': chunk[26:34],
-            'software processing version': int(codecs.encode(chunk[34], 'hex'),
-                                               16),
-            'software processing subversion': int(codecs.encode(chunk[35],
-                                                                'hex'), 16),
-            'calibration file version': int(codecs.encode(chunk[36], 'hex'),
-                                            16),
-            'calibration file subversion': int(codecs.encode(chunk[37], 'hex'),
-                                               16),
-            'data names': ['P_field', 'epoch_time', 'time_of_day', 'UT',
-                           'orbit_number', 'orbit_type'],
-            'data units': {'P_field': 'N/A',
-                           'epoch_time': 'days since 1/1/1950',
-                           'time_of_day': 'ms', 'UT': 'datetime',
-                           'orbit_number': 'N/A', 'orbit_type': 'N/A'}}
+
+    # The number of days since 1/1/1950 is a three byte integer
+    epoch = block['epoch_time'].astype(np.int64)
+
+    data = {'P_field': block['P_field'].astype(np.int64),
+            'epoch_time': (epoch[:, 0] << 16) + (epoch[:, 1] << 8)
+            + epoch[:, 2],
+            'time_of_day': block['time_of_day'].astype(np.int64),
+            'UT': record_times(block),
+            'orbit_number': block['orbit_number'].astype(np.int64),
+            'orbit_type': block['orbit_type'].astype(bool)}
+
+    meta = {'data names': list(general_header_names),
+            'data units': dict(general_header_units)}
+    if len(block) > 0:
+        meta['telemetry station'] = _decode_string(block['telemetry station'])
+        for mkey in ['software processing version',
+                     'software processing subversion',
+                     'calibration file version',
+                     'calibration file subversion']:
+            meta[mkey] = int(block[mkey][0])
 
     return data, meta
 
 
-def load_location_parameters(fhandle):
-    """ Load the orbital and geomagnetic parameter block (block 1 for each
+def decode_location_parameters(block):
+    """ Decode the orbital and geomagnetic parameter block (block 2 for each
     time)
 
     Parameters
     ------------
-    fhandle : (file handle)
-        File handle
+    block : np.ndarray
+        Structured array of location blocks, with location_dtype
 
     Returns
     ----------
-    data : list
-        List of data values containing: geoc lat, geoc lon, alt, lt, geom
+    data : dict
+        Dictionary of data arrays for keys: geoc lat, geoc lon, alt, lt, geom
         lat, geom lon, mlt, inv lat, L-shell, geoc lat of conj point, geoc
         lon of conj point, geoc lat of N conj point at 110 km, geoc lon of
         N conj point at 110 km, geoc lat of S conj point at 110 km, geoc
@@ -156,200 +174,213 @@ def load_location_parameters(fhandle):
         'software processing subversion', 'data names', 'data units'
 
     """
-    import codecs  # ensures encode is python 2/3 compliant
-
-    block_size = 90  # Position block is 90 bytes
-    chunk = fhandle.read(block_size)
-
-    if len(chunk) != block_size:
-        return list(), dict()
-
-    data = [bytes_to_float(chunk[0:4]),  # geocentric latitude
-            bytes_to_float(chunk[4:8]),  # geocentric longitude
-            bytes_to_float(chunk[8:12]),  # altitude
-            bytes_to_float(chunk[12:16]),  # LT hours of day
-            bytes_to_float(chunk[16:20]),  # geomagnetic latitude
-            bytes_to_float(chunk[20:24]),  # geomagnetic longitude
-            bytes_to_float(chunk[24:28]),  # MLT in hours
-            bytes_to_float(chunk[28:32]),  # invariant latitude
-            bytes_to_float(chunk[32:36]),  # Mc Ilwain parameter L
-            bytes_to_float(chunk[36:40]),  # geocentric latitude of conj point
-            bytes_to_float(chunk[40:44]),  # geocentric longitude of conj point
-            bytes_to_float(chunk[44:48]),  # geoc lat of N conj point at 110 km
-            bytes_to_float(chunk[48:52]),  # geoc lon of N conj point at 110 km
-            bytes_to_float(chunk[52:56]),  # geoc lat of S conj point at 110 km
-            bytes_to_float(chunk[56:60]),  # geoc lon of S conj point at 110 km
-            bytes_to_float(chunk[60:64]),  # mag field component at sat point
-            bytes_to_float(chunk[64:68]),  # mag field component at sat point
-            bytes_to_float(chunk[68:72]),  # mag field component at sat point
-            bytes_to_float(chunk[72:76]),  # Proton gyrofrequency at sat oint
-            bytes_to_float(chunk[76:80]),  # Xs in geographic coordinate system
-            bytes_to_float(chunk[80:84]),  # Ys in geographic coordinate system
-            bytes_to_float(chunk[84:88])]  # Zs in geographic coordinate system
-
-    meta = {'software processing version': int(codecs.encode(chunk[88], 'hex'),
-                                               16),
-            'software processing subversion': int(codecs.encode(chunk[89],
-                                                                'hex'), 16),
-            'data names': ['glat', 'glon', 'altitude', 'LT', 'mlat', 'mlon',
-                           'MLT', 'ilat', 'L', 'glat_conj', 'glon_conj',
-                           'glat_conj_N_110km', 'glon_conj_N_110km',
-                           'glat_conj_S_110km', 'glon_conj_S_110km',
-                           'mag_comp_1', 'mag_comp_2', 'mag_comp_3',
-                           'proton_gyrofreq', 'Xs', 'Ys', 'Zs'],
-            'data units': {'glat': 'degrees',
-                           'glon': 'degrees',
-                           'altitude': 'km',
-                           'LT': 'h',
-                           'mlat': 'degrees',
-                           'mlon': 'degrees',
-                           'MLT': 'h',
-                           'ilat': 'degrees',
-                           'L': 'Earth_Radii',
-                           'glat_conj': 'degrees',
-                           'glon_conj': 'degrees',
-                           'glat_conj_N_110km': 'degrees',
-                           'glon_conj_N_110km': 'degrees',
-                           'glat_conj_S_110km': 'degrees',
-                           'glon_conj_S_110km': 'degrees',
-                           'mag_comp_1': 'nT',
-                           'mag_comp_2': 'nT',
-                           'mag_comp_3': 'nT',
-                           'proton_gyrofreq': 'Hz',
-                           'Xs': 'N/A',
-                           'Ys': 'N/A',
-                           'Zs': 'N/A'}}
+
+    data = {lname: block[lname].astype(np.float64)
+            for lname in location_names}
+    meta = {'data names': list(location_names),
+            'data units': dict(location_units)}
+    if len(block) > 0:
+        for mkey in ['software processing version',
+                     'software processing subversion']:
+            meta[mkey] = int(block[mkey][0])
 
     return data, meta
 
 
-def load_attitude_parameters(fhandle):
-    """ Load the attitude parameter block (block 1 for each time)
+def decode_attitude_parameters(block):
+    """ Decode the attitude parameter block (block 3 for each time)
 
     Parameters
     ------------
-    fhandle : (file handle)
-        File handle
+    block : np.ndarray
+        Structured array of attitude blocks, with attitude_dtype
 
     Returns
     ----------
-    data : list
-        list of data values containing: matrix elements from satellite coord
-        system to geographic coordinate system, matrix elements from geographic
-        coordinate system to local geomagnetic coordinate system, quality
-        index of attitude parameters.
+    data : dict
+        Dictionary of data arrays for keys: matrix elements from satellite
+        coord system to geographic coordinate system, matrix elements from
+        geographic coordinate system to local geomagnetic coordinate system,
+        quality index of attitude parameters.
     meta : dict
         Dictionary with meta data for keys: 'software processing version',
         'software processing subversion', 'data names', 'data units'
 
     """
-    import codecs  # ensures encode is python 2/3 compliant
-
-    block_size = 76  # Position block is 76 bytes
-    chunk = fhandle.read(block_size)
-    data = list()
-
-    if len(chunk) != block_size:
-        return data, dict()
-
-    i = 0
-    j = 1
-    k = 1
-    data_names = list()
-    data_units = dict()
-    while i < 72:
-        data.append(bytes_to_float(chunk[i:i+4]))  # Matrix element
-
-        # Save data name and units
-        data_names.append("{:s}_{:d}{:d}".format("sat2geo" if i <= 32
-                                                 else "geo2lgm", j, k))
-        data_units[data_names[-1]] = 'unitless'
-
-        # Cycle to next chunk of data
-        i += 4
-
-        # Determine the next matrix index
-        if k == 3:
-            k = 1
-            j = j + 1 if j < 3 else 1
-        else:
-            k += 1
 
-    # Save quality flag
-    data.append(int(codecs.encode(chunk[72:74], 'hex'), 16))
-    data_names.append('attitude_flag')
-    data_units[data_names[-1]] = 'unitless'
-
-    meta = {'software processing version': int(codecs.encode(chunk[74], 'hex'),
-                                               16),
-            'software processing subversion': int(codecs.encode(chunk[75],
-                                                                'hex'), 16),
-            'data names': data_names, 'data units': data_units}
+    data = {aname: block[aname].astype(np.float64)
+            for aname in attitude_names[:-1]}
+    data['attitude_flag'] = block['attitude_flag'].astype(np.int64)
+    meta = {'data names': list(attitude_names),
+            'data units': dict(attitude_units)}
+    if len(block) > 0:
+        for mkey in ['software processing version',
+                     'software processing subversion']:
+            meta[mkey] = int(block[mkey][0])
 
     return data, meta
 
 
-def load_binary_file(fname, load_experiment_data):
+def load_binary_file(fname, experiment_dtype, load_experiment_data,
+                     start=None, stop=None):
     """ Load the binary data from a DEMETER file
 
     Parameters
     ------------
     fname : string
         Filename
+    experiment_dtype : np.dtype
+        Structured dtype of the experiment data block, with big-endian fields
     load_experiment_data : function
-        Function to load experiment data, taking the file handle as input
+        Function to decode the experiment data, taking a structured array of
+        experiment data blocks as input and returning a dict of data arrays
+        and a dict of meta data, as decode_location_parameters does
+    start : datetime or NoneType
+        Start of the time window to load. Records before the window are
+        skipped without being decoded.  If None, records are loaded from the
+        start of the file. (default=None)
+    stop : datetime or NoneType
+        Exclusive end of the time window to load.  If None, records are
+        loaded to the end of the file. (default=None)
 
     Returns
     ----------
-    data : np.array
-        Data from file stored in a numpy array
+    data : pds.DataFrame
+        Data from file, indexed by UT
     meta : dict
-        Meta data for file, including data names and units
+        Meta data for file, including data names and units.  Empty if the
+        file contains no records.
+
+    Note
+    ----
+    The file is memory-mapped, so only the records within the time window
+    are read from disk.  Records are time ordered and have a fixed size, so
+    the window is found by bisection.
+
     """
 
-    data = list()
-    meta = dict()
+    record_dtype = np.dtype([('header', general_header_dtype),
+                             ('location', location_dtype),
+                             ('attitude', attitude_dtype),
+                             ('experiment', experiment_dtype)])
+    nrecords = os.path.getsize(fname) // record_dtype.itemsize
+    if nrecords == 0:
+        return pysat.DataFrame(None), dict()
+
+    records = np.memmap(fname, dtype=record_dtype, mode='r',
+                        shape=(nrecords,))
+
+    first = 0 if start is None else bisect_records(records['header'], start)
+    last = nrecords if stop is None else bisect_records(records['header'],
+                                                        stop)
+    if first < last:
+        window = records[first:last]
+    else:
+        # Only decode the first record, to obtain the meta data
+        window = records[:1]
 
-    with open(fname, "rb") as f:
-        # Cycle through teach time, which consists of four blocks
-        gdata, meta = load_general_header(f)
-
-        while len(gdata) > 0:
-            ldata, lmeta = load_location_parameters(f)
-            adata, ameta = load_attitude_parameters(f)
-            edata, emeta = load_experiment_data(f)
-
-            # Combine and save the meta data
-            if len(data) == 0:
-                meta['data names'].extend(lmeta['data names'])
-                meta['data units'].update(lmeta['data units'])
-                meta['data names'].extend(ameta['data names'])
-                meta['data units'].update(ameta['data units'])
-
-                for ekey in emeta.keys():
-                    if ekey == 'data names':
-                        meta[ekey].extend(emeta[ekey])
-                    elif ekey == 'data units':
-                        meta[ekey].update(emeta[ekey])
-                    else:
-                        meta[ekey] = emeta[ekey]
-
-            # Combine and save the data
-            gdata.extend(ldata)
-            gdata.extend(adata)
-            gdata.extend(edata)
-            data.append(gdata)
-
-            # Cycle to the next time chunk
-            gdata, _ = load_general_header(f)
-
-        # Having read the file, close file handle and recast the data
-        f.close()
-        data = np.array(data)
+    # Decode each block of the records and combine the meta data
+    data = dict()
+    meta = dict()
+    for bname, decode in [('header', decode_general_header),
+                          ('location', decode_location_parameters),
+                          ('attitude', decode_attitude_parameters),
+                          ('experiment', load_experiment_data)]:
+        bdata, bmeta = decode(window[bname])
+        data.update(bdata)
+
+        for mkey in bmeta.keys():
+            if mkey == 'data names':
+                meta.setdefault(mkey, list()).extend(bmeta[mkey])
+            elif mkey == 'data units':
+                meta.setdefault(mkey, dict()).update(bmeta[mkey])
+            elif bname in ['header', 'experiment']:
+                meta[mkey] = bmeta[mkey]
+
+    # Release the memory map, the decoded data are copies
+    del records, window
+
+    data = pysat.DataFrame(data, index=data['UT'],
+                           columns=meta['data names'])
+    if first >= last:
+        data = data.iloc[:0]
 
     return data, meta
 
 
+def record_times(block):
+    """ Get the UT of each record from the general header
+
+    Parameters
+    ------------
+    block : np.ndarray
+        Structured array of general header blocks, with general_header_dtype
+
+    Returns
+    ----------
+    times : pds.DatetimeIndex
+        UT of each record, with millisecond resolution
+
+    """
+
+    days = (block['year'].astype(np.int64) - 1970).astype('datetime64[Y]')
+    days = days + (block['month'].astype(np.int64)
+                   - 1).astype('timedelta64[M]')
+    days = days.astype('datetime64[D]') + (block['day'].astype(np.int64)
+                                           - 1).astype('timedelta64[D]')
+
+    msec = block['hour'].astype(np.int64) * 3600000 \
+        + block['minute'].astype(np.int64) * 60000 \
+        + block['second'].astype(np.int64) * 1000 \
+        + block['millisecond'].astype(np.int64)
+
+    times = days.astype('datetime64[ms]') + msec.astype('timedelta64[ms]')
+
+    return pds.DatetimeIndex(times.astype('datetime64[ns]'))
+
+
+def bisect_records(block, time):
+    """ Find the first record at or after a given time
+
+    Parameters
+    ------------
+    block : np.ndarray
+        Time ordered structured array of general header blocks, with
+        general_header_dtype
+    time : datetime
+        Time of the desired record
+
+    Returns
+    ----------
+    index : int
+        Index of the first record at or after time, or the number of records
+        if all records are before time
+
+    Note
+    ----
+    Only the general header of the records examined is decoded.
+
+    """
+
+    lower = 0
+    upper = len(block)
+
+    while lower < upper:
+        middle = (lower + upper) // 2
+        if record_times(block[middle:middle + 1])[0] < time:
+            lower = middle + 1
+        else:
+            upper = middle
+
+    return lower
+
+
+def _decode_string(field):
+    """ Decode the first value of a fixed width byte string field"""
+
+    return field[0].decode('ascii', 'replace').strip()
+
+
 def set_metadata(name, meta_dict):
     """ Set metadata for each DEMETER instrument, using dict containing
     metadata
@@ -370,58 +401,58 @@ def set_metadata(name, meta_dict):
     """
 
     # Define the acknowledgements and references
-    ackn = {'iap': ' '.join("This work is based on observations with the",
-                            "plasma analyser IAP embarked on the satellite",
-                            "DEMETER launched by CNES (Centre National",
-                            "d'Etudes Spatiales). The author thanks J.J.",
-                            "Berthelier the PI of this instrument for the use",
-                            "of the data, and CDPP (Centre des Données de la",
-                            "Physique des Plasmas) for the provision of these",
-                            "data."),
-            'ice': ' '.join("This work is based on observations with the",
-                            "electric field instrument ICE embarked on the",
-                            "satellite DEMETER launched by CNES (Centre",
-                            "National d'Etudes Spatiales). The author thanks",
-                            "J.J. Berthelier the PI of this instrument for",
-                            "the use of the data, and CDPP (Centre des",
-                            "Données de la Physique des Plasmas) for the",
-                            "provision of these data."),
-            'imsc': ' '.join("This work is based on observations with the",
-                             "magnetic field instrument IMSC embarked on the",
+    ackn = {'iap': ' '.join(("This work is based on observations with the",
+                             "plasma analyser IAP embarked on the satellite",
+                             "DEMETER launched by CNES (Centre National",
+                             "d'Etudes Spatiales). The author thanks J.J.",
+                             "Berthelier the PI of this instrument for the",
+                             "use of the data, and CDPP (Centre des Données",
+                             "de la Physique des Plasmas) for the provision",
+                             "of these data.")),
+            'ice': ' '.join(("This work is based on observations with the",
+                             "electric field instrument ICE embarked on the",
                              "satellite DEMETER launched by CNES (Centre",
                              "National d'Etudes Spatiales). The author thanks",
-                             "M. Parrot the PI of this instrument for the use",
+                             "J.J. Berthelier the PI of this instrument for",
+                             "the use of the data, and CDPP (Centre des",
+                             "Données de la Physique des Plasmas) for the",
+                             "provision of these data.")),
+            'imsc': ' '.join(("This work is based on observations with the",
+                              "magnetic field instrument IMSC embarked on the",
+                              "satellite DEMETER launched by CNES (Centre",
+                              "National d'Etudes Spatiales). The author",
+                              "thanks M. Parrot the PI of this instrument for",
+                              "the use of the data, and CDPP (Centre des",
+                              "Données de la Physique des Plasmas) for the",
+                              "provision of these data.")),
+            'rnf': ' '.join(("This work is based on observations with the",
+                             "neural network RNF embarked on the satellite",
+                             "DEMETER launched by CNES (Centre National",
+                             "d'Etudes Spatiales). The author thanks J.L.",
+                             "Pinçon the PI of this instrument for the use",
+                             "of the data, and CDPP (Centre des Données de",
+                             "la Physique des Plasmas) for the provision of",
+                             "these data.")),
+            'idp': ' '.join(("This work is based on observations with the",
+                             "particle spectrometer instrument IDP embarked",
+                             "on the satellite DEMETER launched by CNES",
+                             "(Centre National d'Etudes Spatiales). The",
+                             "author thanks J.A. Sauvaud the PI of this",
+                             "instrument for the use of the data, and CDPP",
+                             "(Centre des Données de la Physique des Plasmas)",
+                             "for the provision of these data.")),
+            'isl': ' '.join(("This work is based on observations with the",
+                             "Langmuir probe ISL embarked on the satellite",
+                             "DEMETER launched by CNES (Centre National",
+                             "d'Etudes Spatiales). The author thanks J.P.",
+                             "Lebreton the PI of this instrument for the use",
                              "of the data, and CDPP (Centre des Données de la",
                              "Physique des Plasmas) for the provision of",
-                             "these data."),
-            'rnf': ' '.join("This work is based on observations with the",
-                            "neural network RNF embarked on the satellite",
-                            "DEMETER launched by CNES (Centre National",
-                            "d'Etudes Spatiales). The author thanks J.L.",
-                            "Pinçon the PI of this instrument for the use",
-                            "of the data, and CDPP (Centre des Données de",
-                            "la Physique des Plasmas) for the provision of",
-                            "these data."),
-            'idp': ' '.join("This work is based on observations with the",
-                            "particle spectrometer instrument IDP embarked on",
-                            "the satellite DEMETER launched by CNES (Centre",
-                            "National d'Etudes Spatiales). The author thanks",
-                            "J.A. Sauvaud the PI of this instrument for the",
-                            "use of the data, and CDPP (Centre des Données",
-                            "de la Physique des Plasmas) for the provision of",
-                            "these data."),
-            'isl': ' '.join("This work is based on observations with the",
-                            "Langmuir probe ISL embarked on the satellite",
-                            "DEMETER launched by CNES (Centre National",
-                            "d'Etudes Spatiales). The author thanks J.P.",
-                            "Lebreton the PI of this instrument for the use",
-                            "of the data, and CDPP (Centre des Données de la",
-                            "Physique des Plasmas) for the provision of these",
-                            "data.")}
-
-    refs = {'iap': ' '.join('Berthelier at al., 2006. IAP, the thermal plasma',
-                            'analyzer on DEMETER, Planet. and Space Sci.,',
-                            '54(5), pp 487-501.')}
+                             "these data."))}
+
+    refs = {'iap': ' '.join(('Berthelier at al., 2006. IAP, the thermal',
+                             'plasma analyzer on DEMETER, Planet. and Space',
+                             'Sci., 54(5), pp 487-501.'))}
 
     if name not in refs.keys():
         refs[name] = 'Instrument reference information available at ' + \
@@ -443,68 +474,69 @@ def set_metadata(name, meta_dict):
                  'MLT': 'Magnetic Local Time',
                  'ilat': 'Invarient Latitude',
                  'L': 'Mc Ilwain Parameter L',
-                 'glat_conj': ' '.join('Geocentric latitude of the conjugate',
-                                       'point at the satellite altitude'),
-                 'glon_conj': ' '.join('Geocentric longitude of the conjugate',
-                                       'point at the satellite altitude'),
-                 'glat_conj_N_110km': ' '.join('Geocentric latitude of North',
-                                               'conjugate point at altitude',
-                                               '110 km'),
-                 'glon_conj_N_110km': ' '.join('Geocentric longitude of North',
-                                               'conjugate point at altitude',
-                                               '110 km'),
-                 'glat_conj_S_110km': ' '.join('Geocentric latitude of South',
-                                               'conjugate point at altitude',
-                                               '110 km'),
-                 'glon_conj_S_110km': ' '.join('Geocentric longitude of South',
-                                               'conjugate point at altitude',
-                                               '110 km'),
-                 'mag_comp_1': ' '.join('Component of the magnetic field',
-                                        'model at the satellite point'),
-                 'mag_comp_2': ' '.join('Component of the magnetic field',
-                                        'model at the satellite point'),
-                 'mag_comp_3': ' '.join('Component of the magnetic field',
-                                        'model at the satellite point'),
+                 'glat_conj': ' '.join(('Geocentric latitude of the conjugate',
+                                        'point at the satellite altitude')),
+                 'glon_conj': ' '.join(('Geocentric longitude of the',
+                                        'conjugate point at the satellite',
+                                        'altitude')),
+                 'glat_conj_N_110km': ' '.join(('Geocentric latitude of North',
+                                                'conjugate point at altitude',
+                                                '110 km')),
+                 'glon_conj_N_110km': ' '.join(('Geocentric longitude of',
+                                                'North conjugate point at',
+                                                'altitude 110 km')),
+                 'glat_conj_S_110km': ' '.join(('Geocentric latitude of South',
+                                                'conjugate point at altitude',
+                                                '110 km')),
+                 'glon_conj_S_110km': ' '.join(('Geocentric longitude of',
+                                                'South conjugate point at',
+                                                'altitude 110 km')),
+                 'mag_comp_1': ' '.join(('Component of the magnetic field',
+                                         'model at the satellite point')),
+                 'mag_comp_2': ' '.join(('Component of the magnetic field',
+                                         'model at the satellite point')),
+                 'mag_comp_3': ' '.join(('Component of the magnetic field',
+                                         'model at the satellite point')),
                  'proton_gyrofreq': 'Proton gyrofrequency at satellite point',
                  'Xs': 'Solar position in geographic coordinate system',
                  'Ys': 'Solar position in geographic coordinate system',
                  'Zs': 'Solar position in geographic coordinate system',
-                 'sat2geo_11': ' '.join('Conversion matrix from satellite to',
-                                        'geographic coordinate system'),
-                 'sat2geo_12': ' '.join('Conversion matrix from satellite to',
-                                        'geographic coordinate system'),
-                 'sat2geo_13': ' '.join('Conversion matrix from satellite to',
-                                        'geographic coordinate system'),
-                 'sat2geo_21': ' '.join('Conversion matrix from satellite to',
-                                        'geographic coordinate system'),
-                 'sat2geo_22': ' '.join('Conversion matrix from satellite to',
-                                        'geographic coordinate system'),
-                 'sat2geo_23': ' '.join('Conversion matrix from satellite to',
-                                        'geographic coordinate system'),
-                 'sat2geo_31': ' '.join('Conversion matrix from satellite to',
-                                        'geographic coordinate system'),
-                 'sat2geo_32': ' '.join('Conversion matrix from satellite to',
-                                        'geographic coordinate system'),
-                 'sat2geo_33': ' '.join('Conversion matrix from satellite to',
-                                        'geographic coordinate system'),
-                 'geo2lgm_11': ' '.join('Conversion matrix from geographic to',
-                                        'geomagnetic coordinate system'),
-                 'geo2lgm_12': ' '.join('Conversion matrix from geographic to',
-                                        'geomagnetic coordinate system'),
-                 'geo2lgm_13': ' '.join('Conversion matrix from geographic to',
-                                        'geomagnetic coordinate system'),
-                 'geo2lgm_21': ' '.join('Conversion matrix from geographic to',
-                                        'geomagnetic coordinate system'),
-                 'geo2lgm_22': ' '.join('Conversion matrix from geographic to',
-                                        'geomagnetic coordinate system'),
-                 'geo2lgm_23': ' '.join('Conversion matrix from geographic to',
-                                        'geomagnetic coordinate system'),
-                 'geo2lgm_31': ' '.join('Conversion matrix from geographic to',
-                                        'geomagnetic coordinate system'),
-                 'geo2lgm_32': ' '.join('Conversion matrix from geographic to',
-                                        'geomagnetic coordinate system'),
-                 'geo2lgm_33': ' '.join('Conversion matrix from geographic to',
-                                        'geomagnetic coordinate system'),
+                 'sat2geo_11': ' '.join(('Conversion matrix from satellite to',
+                                         'geographic coordinate system')),
+                 'sat2geo_12': ' '.join(('Conversion matrix from satellite to',
+                                         'geographic coordinate system')),
+                 'sat2geo_13': ' '.join(('Conversion matrix from satellite to',
+                                         'geographic coordinate system')),
+                 'sat2geo_21': ' '.join(('Conversion matrix from satellite to',
+                                         'geographic coordinate system')),
+                 'sat2geo_22': ' '.join(('Conversion matrix from satellite to',
+                                         'geographic coordinate system')),
+                 'sat2geo_23': ' '.join(('Conversion matrix from satellite to',
+                                         'geographic coordinate system')),
+                 'sat2geo_31': ' '.join(('Conversion matrix from satellite to',
+                                         'geographic coordinate system')),
+                 'sat2geo_32': ' '.join(('Conversion matrix from satellite to',
+                                         'geographic coordinate system')),
+                 'sat2geo_33': ' '.join(('Conversion matrix from satellite to',
+                                         'geographic coordinate system')),
+                 'geo2lgm_11': ' '.join(('Conversion matrix from geographic',
+                                         'to geomagnetic coordinate system')),
+                 'geo2lgm_12': ' '.join(('Conversion matrix from geographic',
+                                         'to geomagnetic coordinate system')),
+                 'geo2lgm_13': ' '.join(('Conversion matrix from geographic',
+                                         'to geomagnetic coordinate system')),
+                 'geo2lgm_21': ' '.join(('Conversion matrix from geographic',
+                                         'to geomagnetic coordinate system')),
+                 'geo2lgm_22': ' '.join(('Conversion matrix from geographic',
+                                         'to geomagnetic coordinate system')),
+                 'geo2lgm_23': ' '.join(('Conversion matrix from geographic',
+                                         'to geomagnetic coordinate system')),
+                 'geo2lgm_31': ' '.join(('Conversion matrix from geographic',
+                                         'to geomagnetic coordinate system')),
+                 'geo2lgm_32': ' '.join(('Conversion matrix from geographic',
+                                         'to geomagnetic coordinate system')),
+                 'geo2lgm_33': ' '.join(('Conversion matrix from geographic',
+                                         'to geomagnetic coordinate system')),
                  'attitude_flag': 'Quality index of attitude parameters',
                  'status_flag_00': 'Housekeeping and status',
                  'status_flag_01': 'Housekeeping and status',
@@ -544,15 +576,15 @@ def set_metadata(name, meta_dict):
                          'O+_density': 'O+ density',
                          'Ion_temperature': 'Ion temperature',
                          'iv_Oz': 'Ion velocity along the satellite z axis',
-                         'iv_negOz_angle': ' '.join('Angle between the ion',
-                                                    'velocity and -z axis',
-                                                    '(ram direction) of',
-                                                    'satellite'),
-                         'iv_xOy_Ox_angle': ' '.join('Angle between',
-                                                     'projection of the ion',
-                                                     'velocity on the x-y',
-                                                     'plane and satellite',
-                                                     'x axis'),
+                         'iv_negOz_angle': ' '.join(('Angle between the ion',
+                                                     'velocity and -z axis',
+                                                     '(ram direction) of',
+                                                     'satellite')),
+                         'iv_xOy_Ox_angle': ' '.join(('Angle between',
+                                                      'projection of the ion',
+                                                      'velocity on the x-y',
+                                                      'plane and satellite',
+                                                      'x axis')),
                          'satellite_potential': 'Satellite potential'}}
 
     if name not in long_inst.keys():
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-.
+"""Provides routines shared by the load functions of many instruments
+
+"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+import functools
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+
+def map_files(func, fnames, workers=1, use_threads=False, *args, **kwargs):
+    """Apply a function to each file, reading many files at once
+
+    Parameters
+    ----------
+    func : (function)
+        Called as func(fname, *args, **kwargs) for each filename.  Must be
+        defined at the top level of a module if processes are used.
+    fnames : (list-like)
+        Filenames to process
+    workers : (int or NoneType)
+        Number of files read at once.  If None, the number of CPUs is used.
+        If 1, files are read one at a time within the current process.
+        (default=1)
+    use_threads : (bool)
+        If True, files are read by a pool of threads, otherwise a pool of
+        processes is used.  Threads avoid copying the output between
+        processes, but are only suited to file readers that are thread safe
+        and release the GIL, which excludes netCDF4 and h5py.
+        (default=False)
+    *args : extra arguments
+        passed to func
+    **kwargs : extra keyword arguments
+        passed to func
+
+    Returns
+    -------
+    output : (list)
+        Output of func for each file, in the same order as fnames
+
+    Note
+    ----
+    Files are handed to the workers in consecutive chunks, about four per
+    worker, so per-task overhead stays small for days with thousands of
+    small files.  The output does not depend upon the number of workers.
+
+    """
+
+    fnames = list(fnames)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if workers < 1:
+        raise ValueError('Must have at least one worker.')
+
+    map_func = functools.partial(_apply_func, func=func, args=args,
+                                 kwargs=kwargs)
+    workers = min(workers, len(fnames))
+    if workers <= 1:
+        return [map_func(fname) for fname in fnames]
+
+    chunk_size = int(np.ceil(len(fnames) / (4. * workers)))
+    if use_threads:
+        pool = ThreadPool(processes=workers)
+    else:
+        pool = multiprocessing.Pool(processes=workers)
+    try:
+        # map returns results in the order of fnames
+        output = pool.map(map_func, fnames, chunksize=chunk_size)
+    finally:
+        pool.close()
+        pool.join()
+
+    return output
+
+
+def _apply_func(fname, func, args, kwargs):
+    """Call func for a single file, see map_files"""
+
+    return func(fname, *args, **kwargs)
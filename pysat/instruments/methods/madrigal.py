@@ -28,7 +28,8 @@ def cedar_rules():
 
 
 # support load routine
-def load(fnames, tag=None, sat_id=None, xarray_coords=[]):
+def load(fnames, tag=None, sat_id=None, xarray_coords=[], variables=None,
+         start=None, stop=None):
     """Loads data from Madrigal into Pandas.
 
     This routine is called as needed by pysat. It is not intended
@@ -50,6 +51,17 @@ def load(fnames, tag=None, sat_id=None, xarray_coords=[]):
     xarray_coords : list
         List of keywords to use as coordinates if xarray output is desired
         instead of a Pandas DataFrame (default=[])
+    variables : list or NoneType
+        Lowercase names of the variables to read from the file, along with
+        the time and coordinate variables. If None, all variables are read.
+        (default=None)
+    start : datetime or NoneType
+        Start of the time window to load, only rows of the data table within
+        the window are read. If None, rows from the start of the table are
+        read. (default=None)
+    stop : datetime or NoneType
+        Exclusive end of the time window to load. If None, rows up to the
+        end of the table are read. (default=None)
 
     Returns
     -------
@@ -84,6 +96,26 @@ def load(fnames, tag=None, sat_id=None, xarray_coords=[]):
     meta.info = {'acknowledgements': "See 'meta.Experiment_Notes' for " +
                  "instrument specific acknowledgements\n" + cedar_rules(),
                  'references': "See 'meta.Experiment_Notes' for references"}
+    # variables always read, to form the time index and coordinates
+    time_keys = np.array(['year', 'month', 'day', 'hour', 'min', 'sec'])
+    if ((start is not None) or (stop is not None)) and \
+            (file_data.shape[0] > 0):
+        # find the table rows within the time window from the time fields,
+        # then read only those rows
+        fields = dict([(name.lower(), name)
+                       for name in file_data.dtype.names])
+        if np.all([key in fields for key in time_keys]):
+            tdata = dict([(key, file_data[fields[key]]) for key in time_keys])
+            uts = 3600.0 * tdata['hour'] + 60.0 * tdata['min'] + tdata['sec']
+            ftime = pysat.utils.time.create_datetime_index(
+                year=tdata['year'], month=tdata['month'], day=tdata['day'],
+                uts=uts)
+            file_data = file_data[pysat.utils.time.window_slice(ftime, start,
+                                                                stop)]
+    if variables is not None:
+        variables = [var.lower() for var in variables]
+        variables.extend(list(time_keys))
+        variables.extend([xkey.lower() for xkey in xarray_coords])
     labels = []
     for item in file_meta:
         # handle difference in string output between python 2 and 3
@@ -94,6 +126,8 @@ def load(fnames, tag=None, sat_id=None, xarray_coords=[]):
             name_string = name_string.decode('UTF-8')
             unit_string = unit_string.decode('UTF-8')
             desc_string = desc_string.decode('UTF-8')
+        if (variables is not None) and (name_string.lower() not in variables):
+            continue
         labels.append(name_string)
         meta[name_string.lower()] = {'long_name': name_string,
                                      'units': unit_string,
@@ -107,22 +141,29 @@ def load(fnames, tag=None, sat_id=None, xarray_coords=[]):
         if key != 'Data Parameters':
             setattr(meta, key.replace(' ', '_'), filed['Metadata'][key][:])
     # data into frame, with labels from metadata
-    data = pds.DataFrame.from_records(file_data, columns=labels)
+    if variables is None:
+        data = pds.DataFrame.from_records(file_data, columns=labels)
+    else:
+        # only read the selected fields of the table
+        data = pds.DataFrame(dict([(label, file_data[label])
+                                   for label in labels]), columns=labels)
     # lowercase variable names
     data.columns = [item.lower() for item in data.columns]
     # datetime index from times
-    time_keys = np.array(['year', 'month', 'day', 'hour', 'min', 'sec'])
     if not np.all([key in data.columns for key in time_keys]):
         time_keys = [key for key in time_keys if key not in data.columns]
         raise ValueError("unable to construct time index, missing " +
                          "{:}".format(time_keys))
 
-    uts = 3600.0 * data.loc[:, 'hour'] + 60.0 * data.loc[:, 'min'] \
-        + data.loc[:, 'sec']
-    time = pysat.utils.time.create_datetime_index(year=data.loc[:, 'year'],
-                                                  month=data.loc[:, 'month'],
-                                                  day=data.loc[:, 'day'],
-                                                  uts=uts)
+    if len(data) > 0:
+        uts = 3600.0 * data.loc[:, 'hour'] + 60.0 * data.loc[:, 'min'] \
+            + data.loc[:, 'sec']
+        time = pysat.utils.time.create_datetime_index(
+            year=data.loc[:, 'year'], month=data.loc[:, 'month'],
+            day=data.loc[:, 'day'], uts=uts)
+    else:
+        # no rows within the time window
+        time = pds.DatetimeIndex([])
     # Declare index or recast as xarray
     if len(xarray_coords) > 0:
         if not np.all([xkey.lower() in data.columns
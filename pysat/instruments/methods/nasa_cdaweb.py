@@ -94,7 +94,7 @@ def list_files(tag=None, sat_id=None, data_path=None, format_str=None,
 
 def load(fnames, tag=None, sat_id=None,
          fake_daily_files_from_monthly=False,
-         flatten_twod=True):
+         flatten_twod=True, variables=None):
     """Load NASA CDAWeb CDF files.
 
     This routine is intended to be used by pysat instrument modules supporting
@@ -117,6 +117,10 @@ def load(fnames, tag=None, sat_id=None,
     flatted_twod : bool
         Flattens 2D data into different columns of root DataFrame rather
         than produce a Series of DataFrames
+    variables : (list or NoneType)
+        Names of the CDF variables to return. Flattened 2D variables are
+        selected by the name of the CDF variable. If None, all variables
+        are returned. (default=None)
 
     Returns
     ---------
@@ -157,6 +161,8 @@ def load(fnames, tag=None, sat_id=None,
             fname = fnames[0][0:-11]
             date = pysat.datetime.strptime(fnames[0][-10:], '%Y-%m-%d')
             with pysatCDF.CDF(fname) as cdf:
+                if variables is not None:
+                    _select_cdf_variables(cdf, variables)
                 # convert data to pysat format
                 data, meta = cdf.to_pysat(flatten_twod=flatten_twod)
                 # select data from monthly
@@ -166,9 +172,35 @@ def load(fnames, tag=None, sat_id=None,
         else:
             # basic data return
             with pysatCDF.CDF(fnames[0]) as cdf:
+                if variables is not None:
+                    _select_cdf_variables(cdf, variables)
                 return cdf.to_pysat(flatten_twod=flatten_twod)
 
 
+def _select_cdf_variables(cdf, variables):
+    """Remove unrequested variables from a pysatCDF.CDF before conversion.
+
+    Parameters
+    ----------
+    cdf : (pysatCDF.CDF)
+        open CDF file
+    variables : (list)
+        names of the CDF variables to keep, the time variable is always kept
+
+    Note
+    ----
+    pysatCDF reads every variable when the file is opened. Removing
+    variables before cdf.to_pysat avoids building DataFrame columns and
+    metadata for variables that are not needed.
+
+    """
+
+    for name in list(cdf.data.keys()):
+        if (name not in variables) and (name.lower() != 'epoch'):
+            del cdf.data[name]
+            cdf.meta.pop(name, None)
+
+
 def download(supported_tags, date_array, tag, sat_id,
              remote_site='https://cdaweb.gsfc.nasa.gov',
              data_path=None, user=None, password=None,
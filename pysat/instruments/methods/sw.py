@@ -485,9 +485,7 @@ def calc_daily_Ap(ap_inst, ap_name='3hr_ap', daily_name='Ap',
     ap_pad = pds.Series(np.full(shape=(1,), fill_value=np.nan),
                         index=[ap_mean.index[0] - pds.DateOffset(hours=3)])
     # Extract the mean that only uses data for one day
-    ap_sel = ap_pad.combine_first(ap_mean[[i for i, tt in
-                                           enumerate(ap_mean.index)
-                                           if tt.hour == 21]])
+    ap_sel = ap_pad.combine_first(ap_mean[ap_mean.index.hour == 21])
     # Backfill this data
     ap_data = ap_sel.resample('3H').backfill()
 
@@ -536,35 +534,25 @@ def convert_ap_to_kp(ap_data, fill_val=-1, ap_name='ap'):
     # Ap are keys, Kp returned as double (N- = N.6667, N+=N.3333333)
     one_third = 1.0 / 3.0
     two_third = 2.0 / 3.0
-    ap_to_kp = {0: 0, 2: one_third, 3: two_third, 4: 1, 5: 1.0+one_third,
-                6: 1.0+two_third, 7: 2, 9: 2.0+one_third, 12: 2.0+two_third,
-                15: 3, 18: 3.0+one_third, 22: 3.0+two_third, 27: 4,
-                32: 4.0+one_third, 39: 4.0+two_third, 48: 5, 56: 5.0+one_third,
-                67: 5.0+two_third, 80: 6, 94: 6.0+one_third, 111: 6.0+two_third,
-                132: 7, 154: 7.0+one_third, 179: 7.0+two_third, 207: 8,
-                236: 8.0+one_third, 300: 8.0+two_third, 400: 9}
-    ap_keys = sorted(list(ap_to_kp.keys()))
-
-    # If the ap falls between two Kp indices, assign it to the lower Kp value
-    def round_ap(ap_in, fill_val=fill_val):
-        """ Round an ap value to the nearest Kp value
-        """
-        if not np.isfinite(ap_in):
-            return fill_val
-        
-        i = 0
-        while ap_keys[i] <= ap_in:
-            i += 1
-        i -= 1
-
-        if i >= len(ap_keys) or ap_keys[i] > ap_in:
-            return fill_val
-
-        return ap_to_kp[ap_keys[i]]
-
-    # Convert from ap to Kp
-    kp_data = np.array([ap_to_kp[aa] if aa in ap_keys else
-                        round_ap(aa, fill_val=fill_val) for aa in ap_data])
+    ap_keys = np.array([0, 2, 3, 4, 5, 6, 7, 9, 12, 15, 18, 22, 27, 32, 39,
+                        48, 56, 67, 80, 94, 111, 132, 154, 179, 207, 236, 300,
+                        400])
+    kp_values = np.array([0, one_third, two_third, 1, 1.0+one_third,
+                          1.0+two_third, 2, 2.0+one_third, 2.0+two_third, 3,
+                          3.0+one_third, 3.0+two_third, 4, 4.0+one_third,
+                          4.0+two_third, 5, 5.0+one_third, 5.0+two_third, 6,
+                          6.0+one_third, 6.0+two_third, 7, 7.0+one_third,
+                          7.0+two_third, 8, 8.0+one_third, 8.0+two_third, 9])
+
+    # If the ap falls between two Kp indices, assign it to the lower Kp value.
+    # All of the ap values are looked up at once, and ap values that are not
+    # finite or below the lowest key are filled
+    ap_data = np.asarray(ap_data, dtype=float)
+    ind = np.searchsorted(ap_keys, ap_data, side='right') - 1
+    is_data = np.isfinite(ap_data) & (ind >= 0)
+
+    kp_data = np.full(shape=ap_data.shape, fill_value=fill_val, dtype=float)
+    kp_data[is_data] = np.take(kp_values, ind[is_data])
 
     # Set the metadata
     meta = pysat.Meta()
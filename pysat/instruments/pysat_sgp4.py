@@ -5,6 +5,12 @@ Two Line Elements (TLEs) and SGP4. Satellite position is coupled
 to several space science models to simulate the atmosphere the
 satellite is in.
 
+Many satellites may be simulated together by passing a list of TLE pairs,
+or the name of a file of TLEs, through the `TLEs` keyword when creating the
+Instrument.  All of the satellites are propagated on the same time grid and
+loaded as an xarray Dataset with a 'sat' dimension.  The model couplings
+added to single satellite simulations are not applied in this batch mode.
+
 """
 
 from __future__ import print_function
@@ -16,10 +22,12 @@ try:
     basestring
 except NameError:
     basestring = str
+import collections
 import os
 
 import pandas as pds
 import numpy as np
+import xarray as xr
 import pysat
 
 # pysat required parameters
@@ -45,6 +53,12 @@ def init(self):
 
     """
 
+    # batch simulations of many satellites are loaded as a Dataset with a
+    # sat dimension, which the model couplings below do not support
+    if self.kwargs.get('TLEs', None) is not None:
+        self.pandas_format = False
+        return
+
     self.custom.add(add_quasi_dipole_coordinates, 'modify')
     self.custom.add(add_aacgm_coordinates, 'modify')
     self.custom.add(calculate_ecef_velocity, 'modify')
@@ -68,7 +82,7 @@ def init(self):
 
 
 def load(fnames, tag=None, sat_id=None, obs_long=0., obs_lat=0., obs_alt=0.,
-         TLE1=None, TLE2=None):
+         TLE1=None, TLE2=None, TLEs=None):
     """
     Returns data and metadata in the format required by pysat. Finds position
     of satellite in both ECI and ECEF co-ordinates.
@@ -84,15 +98,21 @@ def load(fnames, tag=None, sat_id=None, obs_long=0., obs_lat=0., obs_alt=0.,
     sat_id : string
         Satellite ID
     obs_long: float
-        Longitude of the observer on the Earth's surface
+        Longitude of the observer on the Earth's surface (degrees)
     obs_lat: float
-        Latitude of the observer on the Earth's surface
+        Latitude of the observer on the Earth's surface (degrees)
     obs_alt: float
-        Altitude of the observer on the Earth's surface
+        Altitude of the observer on the Earth's surface (m)
     TLE1 : string
         First string for Two Line Element. Must be in TLE format
     TLE2 : string
         Second string for Two Line Element. Must be in TLE format
+    TLEs : list-like collection or string
+        Pairs of TLE strings, or the name of a file of TLEs, for many
+        satellites to be simulated together.  If provided, TLE1 and TLE2 are
+        ignored and the data are returned as an xarray Dataset with a 'sat'
+        dimension, labelled by satellite name or catalog number.
+        (default=None)
 
     Example
     -------
@@ -101,30 +121,42 @@ def load(fnames, tag=None, sat_id=None, obs_long=0., obs_lat=0., obs_alt=0.,
               TLE2='2 25544  51.6402 181.0633 0004018  88.8954  22.2246 15.54059185113452')
       inst.load(2018, 1)
 
+      constellation = pysat.Instrument('pysat', 'sgp4',
+                                       TLEs='constellation.tle')
+      constellation.load(2018, 1)
+
     """
 
     # wgs72 is the most commonly used gravity model in satellite tracking
     # community
-    from sgp4.earth_gravity import wgs72
-    from sgp4.io import twoline2rv
-    import ephem
-    import pysatMagVect
+    from sgp4.api import Satrec, SatrecArray, WGS72
+
+    if TLEs is None:
+        # TLEs (Two Line Elements for ISS)
+        # format of TLEs is fixed and available from wikipedia...
+        # lines encode list of orbital elements of an Earth-orbiting object
+        # for a given point in time
+        line1 = ('1 25544U 98067A   18135.61844383  .00002728  00000-0  48567-4 0  9998')
+        line2 = ('2 25544  51.6402 181.0633 0004018  88.8954  22.2246 15.54059185113452')
+        # use ISS defaults if not provided by user
+        if TLE1 is not None:
+            line1 = TLE1
+        if TLE2 is not None:
+            line2 = TLE2
+        names = None
+        lines = [(line1, line2)]
+    elif isinstance(TLEs, basestring):
+        names, lines = read_tle_file(TLEs)
+    else:
+        names = None
+        lines = list(TLEs)
 
-    # TLEs (Two Line Elements for ISS)
-    # format of TLEs is fixed and available from wikipedia...
-    # lines encode list of orbital elements of an Earth-orbiting object
-    # for a given point in time
-    line1 = ('1 25544U 98067A   18135.61844383  .00002728  00000-0  48567-4 0  9998')
-    line2 = ('2 25544  51.6402 181.0633 0004018  88.8954  22.2246 15.54059185113452')
-    # use ISS defaults if not provided by user
-    if TLE1 is not None:
-        line1 = TLE1
-    if TLE2 is not None:
-        line2 = TLE2
-
-    # create satellite from TLEs and assuming a gravity model
+    # create satellites from TLEs and assuming a gravity model
     # according to module webpage, wgs72 is common
-    satellite = twoline2rv(line1, line2, wgs72)
+    satellites = [Satrec.twoline2rv(line1, line2, WGS72)
+                  for line1, line2 in lines]
+    if names is None:
+        names = [str(sat.satnum) for sat in satellites]
 
     # grab date from filename
     parts = os.path.split(fnames[0])[-1].split('-')
@@ -142,72 +174,97 @@ def load(fnames, tag=None, sat_id=None, obs_long=0., obs_lat=0., obs_alt=0.,
     if on_travis:
         times = times[0:100]
 
-    # create list to hold satellite position, velocity
-    position = []
-    velocity = []
-    for time in times:
-        # orbit propagator - computes x,y,z position and velocity
-        pos, vel = satellite.propagate(time.year, time.month, time.day,
-                                       time.hour, time.minute, time.second)
-        position.extend(pos)
-        velocity.extend(vel)
-
-    # put data into DataFrame
-    data = pysat.DataFrame({'position_eci_x': position[::3],
-                            'position_eci_y': position[1::3],
-                            'position_eci_z': position[2::3],
-                            'velocity_eci_x': velocity[::3],
-                            'velocity_eci_y': velocity[1::3],
-                            'velocity_eci_z': velocity[2::3]},
-                           index=times)
-    data.index.name = 'Epoch'
-
-    # add position and velocity in ECEF
-    # add call for GEI/ECEF translation here
-    # instead, since available, I'll use an orbit predictor from another
-    # package that outputs in ECEF
-    # it also supports ground station calculations
-
-    # the observer's (ground station) position on the Earth surface
-    site = ephem.Observer()
-    site.lon = str(obs_long)
-    site.lat = str(obs_lat)
-    site.elevation = obs_alt
-
-    # The first parameter in readtle() is the satellite name
-    sat = ephem.readtle('pysat', line1, line2)
-    output_params = []
-    for time in times:
-        lp = {}
-        site.date = time
-        sat.compute(site)
-        # parameters relative to the ground station
-        lp['obs_sat_az_angle'] = ephem.degrees(sat.az)
-        lp['obs_sat_el_angle'] = ephem.degrees(sat.alt)
-        # total distance away
-        lp['obs_sat_slant_range'] = sat.range
-        # satellite location
-        # sub latitude point
-        lp['glat'] = np.degrees(sat.sublat)
-        # sublongitude point
-        lp['glong'] = np.degrees(sat.sublong)
-        # elevation of sat in m, stored as km
-        lp['alt'] = sat.elevation/1000.
-        # get ECEF position of satellite
-        lp['x'], lp['y'], lp['z'] = pysatMagVect.geodetic_to_ecef(lp['glat'],
-                                                                  lp['glong'],
-                                                                  lp['alt'])
-        output_params.append(lp)
-    output = pds.DataFrame(output_params, index=times)
-    # modify input object to include calculated parameters
-    data[['glong', 'glat', 'alt']] = output[['glong', 'glat', 'alt']]
-    data[['position_ecef_x', 'position_ecef_y', 'position_ecef_z']] = \
-        output[['x', 'y', 'z']]
-    data['obs_sat_az_angle'] = output['obs_sat_az_angle']
-    data['obs_sat_el_angle'] = output['obs_sat_el_angle']
-    data['obs_sat_slant_range'] = output['obs_sat_slant_range']
-    return data, meta.copy()
+    # orbit propagator - computes x,y,z position and velocity for all
+    # satellites and times, arranged here as (time, sat)
+    jd, fr = _julian_dates(times)
+    err, position, velocity = SatrecArray(satellites).sgp4(jd, fr)
+    position[err != 0] = np.nan
+    velocity[err != 0] = np.nan
+    position = np.swapaxes(position, 0, 1)
+    velocity = np.swapaxes(velocity, 0, 1)
+
+    output = {'position_eci_x': position[:, :, 0],
+              'position_eci_y': position[:, :, 1],
+              'position_eci_z': position[:, :, 2],
+              'velocity_eci_x': velocity[:, :, 0],
+              'velocity_eci_y': velocity[:, :, 1],
+              'velocity_eci_z': velocity[:, :, 2]}
+
+    # add position in ECEF by rotating the TEME frame used by SGP4
+    # through the Greenwich sidereal angle, along with geodetic location
+    x, y, z = _teme_to_ecef(output['position_eci_x'],
+                            output['position_eci_y'],
+                            output['position_eci_z'],
+                            jd[:, np.newaxis], fr[:, np.newaxis])
+    output['glat'], output['glong'], output['alt'] = \
+        _ecef_to_geodetic(x, y, z)
+    output['position_ecef_x'] = x
+    output['position_ecef_y'] = y
+    output['position_ecef_z'] = z
+
+    # parameters relative to the ground station
+    output['obs_sat_az_angle'], output['obs_sat_el_angle'], \
+        output['obs_sat_slant_range'] = _observer_look(x, y, z, obs_lat,
+                                                       obs_long,
+                                                       obs_alt/1000.)
+
+    if TLEs is None:
+        data = pysat.DataFrame(dict([(key, output[key][:, 0])
+                                     for key in variables]),
+                               index=times, columns=variables)
+        data.index.name = 'Epoch'
+        return data, meta.copy()
+
+    data = xr.Dataset(dict([(key, (('time', 'sat'), output[key]))
+                            for key in variables]),
+                      coords={'time': times, 'sat': names})
+    batch_meta = meta.copy()
+    batch_meta['sat'] = {'long_name': 'Satellite',
+                         'desc': 'Satellite name or catalog number'}
+    return data, batch_meta
+
+
+def read_tle_file(fname):
+    """Reads the Two Line Elements in a text file
+
+    Parameters
+    ----------
+    fname : string
+        Name of a file of TLEs, in the two or three line (named) format
+
+    Returns
+    -------
+    names : list or NoneType
+        Satellite names, or None if the TLEs are not named
+    lines : list
+        Pairs of TLE strings, one for each satellite
+
+    """
+
+    with open(fname, 'r') as fin:
+        file_lines = [line.rstrip() for line in fin if line.strip()]
+
+    names = list()
+    lines = list()
+    for i, line in enumerate(file_lines):
+        if line.startswith('1 ') and i + 1 < len(file_lines) \
+                and file_lines[i + 1].startswith('2 '):
+            lines.append((line, file_lines[i + 1]))
+            if i > 0 and not file_lines[i - 1].startswith('2 '):
+                names.append(file_lines[i - 1].strip())
+
+    if len(lines) == 0:
+        raise ValueError('No TLEs found in ' + fname)
 
+    return names if len(names) == len(lines) else None, lines
+
+
+# order of the variables output by the load routine just above
+variables = ['position_eci_x', 'position_eci_y', 'position_eci_z',
+             'velocity_eci_x', 'velocity_eci_y', 'velocity_eci_z',
+             'glat', 'glong', 'alt',
+             'position_ecef_x', 'position_ecef_y', 'position_ecef_z',
+             'obs_sat_az_angle', 'obs_sat_el_angle', 'obs_sat_slant_range']
 
 # create metadata corresponding to variables in load routine just above
 # made once here rather than regenerate every load call
@@ -286,6 +343,138 @@ def download(date_array, tag, sat_id, data_path=None, user=None,
     pass
 
 
+# WGS84 semi-major axis (km) and square of the first eccentricity
+earth_a = 6378.137
+earth_e2 = (2. - 1./298.257223563)/298.257223563
+
+
+def _julian_dates(times):
+    """Split times into whole and fractional Julian dates, as used by sgp4
+
+    Parameters
+    ----------
+    times : pds.DatetimeIndex
+        UTC times
+
+    Returns
+    -------
+    jd : np.array
+        Julian date at the start of each day
+    fr : np.array
+        Fraction of the day elapsed at each time
+
+    """
+
+    days = times.values.astype('datetime64[D]')
+    jd = days.astype(np.int64) + 2440587.5
+    fr = (times.values - days) / np.timedelta64(1, 'D')
+    return jd, fr
+
+
+def _teme_to_ecef(x, y, z, jd, fr):
+    """Rotate TEME positions into the Earth fixed frame
+
+    Rotates about the z axis by the Greenwich mean sidereal angle
+    (IAU-82), neglecting polar motion and the UT1-UTC offset.
+
+    Parameters
+    ----------
+    x, y, z : np.array
+        TEME position components (km)
+    jd, fr : np.array
+        Whole and fractional Julian dates, as from _julian_dates
+
+    Returns
+    -------
+    x, y, z : np.array
+        ECEF position components (km)
+
+    """
+
+    tut1 = (jd - 2451545.0 + fr) / 36525.0
+    gmst = (-6.2e-6 * tut1**3 + 0.093104 * tut1**2
+            + (876600.0 * 3600 + 8640184.812866) * tut1 + 67310.54841)
+    gmst = np.radians(np.mod(gmst, 86400.) / 240.)
+
+    cos_g = np.cos(gmst)
+    sin_g = np.sin(gmst)
+    return cos_g * x + sin_g * y, cos_g * y - sin_g * x, z
+
+
+def _ecef_to_geodetic(x, y, z, n_iter=5):
+    """Convert ECEF positions to WGS84 geodetic coordinates
+
+    Parameters
+    ----------
+    x, y, z : np.array
+        ECEF position components (km)
+    n_iter : int
+        Number of iterations used to refine the latitude (default=5)
+
+    Returns
+    -------
+    lat, lon : np.array
+        Geodetic latitude and longitude (degrees)
+    alt : np.array
+        Height above the WGS84 ellipsoid (km)
+
+    """
+
+    p = np.sqrt(x**2 + y**2)
+    lat = np.arctan2(z, p * (1. - earth_e2))
+    for i in range(n_iter):
+        rad = earth_a / np.sqrt(1. - earth_e2 * np.sin(lat)**2)
+        alt = p / np.cos(lat) - rad
+        lat = np.arctan2(z, p * (1. - earth_e2 * rad / (rad + alt)))
+    rad = earth_a / np.sqrt(1. - earth_e2 * np.sin(lat)**2)
+    alt = p / np.cos(lat) - rad
+
+    return np.degrees(lat), np.degrees(np.arctan2(y, x)), alt
+
+
+def _observer_look(x, y, z, obs_lat, obs_long, obs_alt):
+    """Calculate the look angles from a ground station to ECEF positions
+
+    Parameters
+    ----------
+    x, y, z : np.array
+        ECEF position components (km)
+    obs_lat, obs_long : float
+        Geodetic latitude and longitude of the observer (degrees)
+    obs_alt : float
+        Height of the observer above the WGS84 ellipsoid (km)
+
+    Returns
+    -------
+    az, el : np.array
+        Azimuth (east of north) and elevation of the positions (degrees)
+    slant_range : np.array
+        Distance from the observer (km)
+
+    """
+
+    lat = np.radians(obs_lat)
+    lon = np.radians(obs_long)
+    rad = earth_a / np.sqrt(1. - earth_e2 * np.sin(lat)**2)
+
+    # separation between satellite and observer
+    dx = x - (rad + obs_alt) * np.cos(lat) * np.cos(lon)
+    dy = y - (rad + obs_alt) * np.cos(lat) * np.sin(lon)
+    dz = z - (rad * (1. - earth_e2) + obs_alt) * np.sin(lat)
+
+    # express separation in local east, north, up basis
+    east = -np.sin(lon) * dx + np.cos(lon) * dy
+    north = (-np.sin(lat) * np.cos(lon) * dx - np.sin(lat) * np.sin(lon) * dy
+             + np.cos(lat) * dz)
+    up = (np.cos(lat) * np.cos(lon) * dx + np.cos(lat) * np.sin(lon) * dy
+          + np.sin(lat) * dz)
+
+    slant_range = np.sqrt(dx**2 + dy**2 + dz**2)
+    az = np.mod(np.degrees(np.arctan2(east, north)), 360.)
+    el = np.degrees(np.arcsin(up / slant_range))
+    return az, el, slant_range
+
+
 def add_sc_attitude_vectors(inst):
     """
     Add attitude vectors for spacecraft assuming ram pointing.
@@ -591,8 +780,186 @@ def add_aacgm_coordinates(inst, glat_label='glat', glong_label='glong',
     return
 
 
+# results of model runs, keyed by the model and location, so repeated
+# orbits are only simulated once if evaluate_model is asked to use them
+_model_cache = collections.OrderedDict()
+model_cache_size = 100000
+
+
+def clear_model_cache():
+    """Removes all stored model results"""
+    _model_cache.clear()
+    return
+
+
+def evaluate_model(model, inst, glat_label='glat', glong_label='glong',
+                   alt_label='alt', time_res=None, deg_res=None,
+                   alt_res=None, workers=1, use_cache=False):
+    """
+    Runs a model once for each distinct location in an instrument.
+
+    Locations may be snapped to a coarser grid, so that nearby samples
+    share a model run.  Each distinct location is run once, across a pool of
+    processes if requested, and the results are mapped back to every
+    sample.  If use_cache is True, results are stored between calls, up to
+    model_cache_size locations, so repeated orbits are not simulated again.
+    Stored results are matched on the exact time and location, so time_res
+    (and deg_res and alt_res) must be set for runs on a later orbit or day
+    to find them.
+
+    Parameters
+    ----------
+    model : function
+        Called as model((time, lat, lon, alt)) for each distinct location,
+        returning a dict of model values.  Must be defined at the top level
+        of a module if workers > 1.
+    inst : pysat.Instrument
+        Designed with pysat_sgp4 in mind
+    glat_label : string
+        label used in inst to identify WGS84 geodetic latitude (degrees)
+    glong_label : string
+        label used in inst to identify WGS84 geodetic longitude (degrees)
+    alt_label : string
+        label used in inst to identify WGS84 geodetic altitude (km, height
+        above surface)
+    time_res : float or NoneType
+        Times are rounded to this many seconds, if provided (default=None)
+    deg_res : float or NoneType
+        Latitudes and longitudes are rounded to this many degrees, if
+        provided (default=None)
+    alt_res : float or NoneType
+        Altitudes are rounded to this many km, if provided (default=None)
+    workers : int or NoneType
+        Number of processes running the model, passed to
+        pysat.instruments.methods.general.map_files (default=1)
+    use_cache : bool
+        If True, stored results are used and new results are stored. Each
+        stored location holds a dict of model values, so large caches can
+        use a lot of memory; see clear_model_cache (default=False)
+
+    Returns
+    -------
+    output : pds.DataFrame
+        Model values for each sample, indexed by the instrument index
+
+    """
+
+    from pysat.instruments.methods import general
+
+    times = inst.index.values.astype(np.int64)
+    if time_res is not None:
+        step = int(np.round(time_res * 1.e9))
+        times = (times + step // 2) // step * step
+    locs = list()
+    for label, res in [(glat_label, deg_res), (glong_label, deg_res),
+                       (alt_label, alt_res)]:
+        values = np.asarray(inst[label], dtype=np.float64)
+        if res is not None:
+            values = np.round(values / res) * res
+        locs.append(values)
+
+    # identify the distinct locations and where each sample falls among them
+    points = np.empty(len(times), dtype=[('time', np.int64), ('lat', 'f8'),
+                                         ('lon', 'f8'), ('alt', 'f8')])
+    points['time'] = times
+    points['lat'], points['lon'], points['alt'] = locs
+    points, inverse = np.unique(points, return_inverse=True)
+
+    keys = [(model.__name__, ) + tuple(point) for point in points.tolist()]
+    if use_cache:
+        results = [_model_cache.get(key) for key in keys]
+    else:
+        results = [None] * len(keys)
+    missing = [i for i, result in enumerate(results) if result is None]
+
+    # run the model at locations without stored results
+    run_times = pds.to_datetime(points['time'][missing])
+    run_points = [(time, lat, lon, alt) for time, lat, lon, alt
+                  in zip(run_times, points['lat'][missing],
+                         points['lon'][missing], points['alt'][missing])]
+    new_results = general.map_files(model, run_points, workers=workers)
+    for i, result in zip(missing, new_results):
+        results[i] = result
+        if use_cache:
+            _model_cache[keys[i]] = result
+    while len(_model_cache) > model_cache_size:
+        _model_cache.popitem(last=False)
+
+    output = pds.DataFrame(results)
+    output = output.iloc[inverse]
+    output.index = inst.data.index
+    return output
+
+
+def run_iri(point):
+    """Runs IRI at a (time, lat, lon, alt) location, for evaluate_model"""
+
+    from pyglow.pyglow import Point
+
+    # Point class is instantiated. Its parameters are a function of time
+    # and spatial location
+    pt = Point(*point)
+    pt.run_iri()
+    iri = {}
+    # After the model is run, its members like Ti, ni[O+], etc. can be
+    # accessed
+    iri['ion_temp'] = pt.Ti
+    iri['e_temp'] = pt.Te
+    iri['ion_dens'] = pt.ni['O+'] + pt.ni['H+'] + pt.ni['HE+']
+    # pt.ne - pt.ni['NO+'] - pt.ni['O2+'] - pt.ni['HE+']
+    iri['frac_dens_o'] = pt.ni['O+']/iri['ion_dens']
+    iri['frac_dens_h'] = pt.ni['H+']/iri['ion_dens']
+    iri['frac_dens_he'] = pt.ni['HE+']/iri['ion_dens']
+    return iri
+
+
+def run_hwm(point):
+    """Runs HWM at a (time, lat, lon, alt) location, for evaluate_model"""
+
+    import pyglow
+
+    pt = pyglow.Point(*point)
+    pt.run_hwm()
+    return {'zonal_wind': pt.u, 'meridional_wind': pt.v}
+
+
+def run_igrf(point):
+    """Runs IGRF at a (time, lat, lon, alt) location, for evaluate_model"""
+
+    from pyglow.pyglow import Point
+
+    pt = Point(*point)
+    pt.run_igrf()
+    igrf = {}
+    igrf['B'] = pt.B
+    igrf['B_east'] = pt.Bx
+    igrf['B_north'] = pt.By
+    igrf['B_up'] = pt.Bz
+    return igrf
+
+
+def run_msis(point):
+    """Runs MSIS at a (time, lat, lon, alt) location, for evaluate_model"""
+
+    from pyglow.pyglow import Point
+
+    pt = Point(*point)
+    pt.run_msis()
+    msis = {}
+    total = 0
+    for key in pt.nn.keys():
+        total += pt.nn[key]
+    msis['Nn'] = total
+    msis['Nn_N'] = pt.nn['N']
+    msis['Nn_N2'] = pt.nn['N2']
+    msis['Nn_O'] = pt.nn['O']
+    msis['Nn_O2'] = pt.nn['O2']
+    msis['Tn_msis'] = pt.Tn_msis
+    return msis
+
+
 def add_iri_thermal_plasma(inst, glat_label='glat', glong_label='glong',
-                           alt_label='alt'):
+                           alt_label='alt', **kwargs):
     """
     Uses IRI (International Reference Ionosphere) model to simulate an
     ionosphere.
@@ -617,6 +984,9 @@ def add_iri_thermal_plasma(inst, glat_label='glat', glong_label='glong',
     alt_label : string
         label used in inst to identify WGS84 geodetic altitude (km, height
         above surface)
+    **kwargs : extra keyword arguments
+        passed to evaluate_model, to round locations to a coarser grid,
+        run the model across many processes, or reuse stored results
 
     Returns
     -------
@@ -631,29 +1001,9 @@ def add_iri_thermal_plasma(inst, glat_label='glat', glong_label='glong',
 
     """
 
-    import pyglow
-    from pyglow.pyglow import Point
-
-    iri_params = []
-    for time, lat, lon, alt in zip(inst.data.index, inst[glat_label],
-                                   inst[glong_label], inst[alt_label]):
-        # Point class is instantiated. Its parameters are a function of time
-        # and spatial location
-        pt = Point(time, lat, lon, alt)
-        pt.run_iri()
-        iri = {}
-        # After the model is run, its members like Ti, ni[O+], etc. can be
-        # accessed
-        iri['ion_temp'] = pt.Ti
-        iri['e_temp'] = pt.Te
-        iri['ion_dens'] = pt.ni['O+'] + pt.ni['H+'] + pt.ni['HE+']
-        # pt.ne - pt.ni['NO+'] - pt.ni['O2+'] - pt.ni['HE+']
-        iri['frac_dens_o'] = pt.ni['O+']/iri['ion_dens']
-        iri['frac_dens_h'] = pt.ni['H+']/iri['ion_dens']
-        iri['frac_dens_he'] = pt.ni['HE+']/iri['ion_dens']
-        iri_params.append(iri)
-    iri = pds.DataFrame(iri_params)
-    iri.index = inst.data.index
+    iri = evaluate_model(run_iri, inst, glat_label=glat_label,
+                         glong_label=glong_label, alt_label=alt_label,
+                         **kwargs)
     inst[iri.keys()] = iri
 
     inst.meta['ion_temp'] = {'units': 'Kelvin', 'long_name': 'Ion Temperature'}
@@ -667,7 +1017,8 @@ def add_iri_thermal_plasma(inst, glat_label='glat', glong_label='glong',
 
 
 def add_hwm_winds_and_ecef_vectors(inst, glat_label='glat',
-                                   glong_label='glong', alt_label='alt'):
+                                   glong_label='glong', alt_label='alt',
+                                   **kwargs):
     """
     Uses HWM (Horizontal Wind Model) model to obtain neutral wind details.
 
@@ -691,6 +1042,9 @@ def add_hwm_winds_and_ecef_vectors(inst, glat_label='glat',
     alt_label : string
         label used in inst to identify WGS84 geodetic altitude (km, height
         above surface)
+    **kwargs : extra keyword arguments
+        passed to evaluate_model, to round locations to a coarser grid,
+        run the model across many processes, or reuse stored results
 
     Returns
     -------
@@ -707,22 +1061,11 @@ def add_hwm_winds_and_ecef_vectors(inst, glat_label='glat',
 
     """
 
-    import pyglow
     import pysatMagVect
 
-    hwm_params = []
-    for time, lat, lon, alt in zip(inst.data.index, inst[glat_label],
-                                   inst[glong_label], inst[alt_label]):
-        # Point class is instantiated.
-        # Its parameters are a function of time and spatial location
-        pt = pyglow.Point(time, lat, lon, alt)
-        pt.run_hwm()
-        hwm = {}
-        hwm['zonal_wind'] = pt.u
-        hwm['meridional_wind'] = pt.v
-        hwm_params.append(hwm)
-    hwm = pds.DataFrame(hwm_params)
-    hwm.index = inst.data.index
+    hwm = evaluate_model(run_hwm, inst, glat_label=glat_label,
+                         glong_label=glong_label, alt_label=alt_label,
+                         **kwargs)
     inst[['zonal_wind', 'meridional_wind']] = hwm[['zonal_wind',
                                                    'meridional_wind']]
 
@@ -788,7 +1131,8 @@ def add_hwm_winds_and_ecef_vectors(inst, glat_label='glat',
     return
 
 
-def add_igrf(inst, glat_label='glat', glong_label='glong', alt_label='alt'):
+def add_igrf(inst, glat_label='glat', glong_label='glong', alt_label='alt',
+             **kwargs):
     """
     Uses International Geomagnetic Reference Field (IGRF) model to obtain
     geomagnetic field values.
@@ -812,6 +1156,9 @@ def add_igrf(inst, glat_label='glat', glong_label='glong', alt_label='alt'):
     alt_label : string
         label used in inst to identify WGS84 geodetic altitude (km, height
         above surface)
+    **kwargs : extra keyword arguments
+        passed to evaluate_model, to round locations to a coarser grid,
+        run the model across many processes, or reuse stored results
 
     Returns
     -------
@@ -829,23 +1176,11 @@ def add_igrf(inst, glat_label='glat', glong_label='glong', alt_label='alt'):
 
     """
 
-    import pyglow
-    from pyglow.pyglow import Point
     import pysatMagVect
 
-    igrf_params = []
-    for time, lat, lon, alt in zip(inst.data.index, inst[glat_label],
-                                   inst[glong_label], inst[alt_label]):
-        pt = Point(time, lat, lon, alt)
-        pt.run_igrf()
-        igrf = {}
-        igrf['B'] = pt.B
-        igrf['B_east'] = pt.Bx
-        igrf['B_north'] = pt.By
-        igrf['B_up'] = pt.Bz
-        igrf_params.append(igrf)
-    igrf = pds.DataFrame(igrf_params)
-    igrf.index = inst.data.index
+    igrf = evaluate_model(run_igrf, inst, glat_label=glat_label,
+                          glong_label=glong_label, alt_label=alt_label,
+                          **kwargs)
     inst[igrf.keys()] = igrf
 
     # convert magnetic field in East/north/up to ECEF basis
@@ -886,7 +1221,8 @@ def add_igrf(inst, glat_label='glat', glong_label='glong', alt_label='alt'):
     return
 
 
-def add_msis(inst, glat_label='glat', glong_label='glong', alt_label='alt'):
+def add_msis(inst, glat_label='glat', glong_label='glong', alt_label='alt',
+             **kwargs):
     """
     Uses MSIS model to obtain thermospheric values.
 
@@ -909,6 +1245,9 @@ def add_msis(inst, glat_label='glat', glong_label='glong', alt_label='alt'):
     alt_label : string
         label used in inst to identify WGS84 geodetic altitude (km, height
         above surface)
+    **kwargs : extra keyword arguments
+        passed to evaluate_model, to round locations to a coarser grid,
+        run the model across many processes, or reuse stored results
 
     Returns
     -------
@@ -923,27 +1262,9 @@ def add_msis(inst, glat_label='glat', glong_label='glong', alt_label='alt'):
 
     """
 
-    import pyglow
-    from pyglow.pyglow import Point
-
-    msis_params = []
-    for time, lat, lon, alt in zip(inst.data.index, inst[glat_label],
-                                   inst[glong_label], inst[alt_label]):
-        pt = Point(time, lat, lon, alt)
-        pt.run_msis()
-        msis = {}
-        total = 0
-        for key in pt.nn.keys():
-            total += pt.nn[key]
-        msis['Nn'] = total
-        msis['Nn_N'] = pt.nn['N']
-        msis['Nn_N2'] = pt.nn['N2']
-        msis['Nn_O'] = pt.nn['O']
-        msis['Nn_O2'] = pt.nn['O2']
-        msis['Tn_msis'] = pt.Tn_msis
-        msis_params.append(msis)
-    msis = pds.DataFrame(msis_params)
-    msis.index = inst.data.index
+    msis = evaluate_model(run_msis, inst, glat_label=glat_label,
+                          glong_label=glong_label, alt_label=alt_label,
+                          **kwargs)
     inst[msis.keys()] = msis
 
     # metadata
@@ -26,6 +26,9 @@ sat_ids = {'': ['']}
 # good day to download test data for. Downloads aren't currently supported
 test_dates = {'': {'': pysat.datetime(2019, 1, 1)}}
 
+# the load routine accepts files spanning several days
+multi_day_load = True
+
 
 def init(self):
     """Initializes the Instrument object with instrument specific values.
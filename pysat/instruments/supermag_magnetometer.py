@@ -17,6 +17,10 @@ Note
 Files must be downloaded from the website, and is freely available after
 registration.
 
+Magnetometer data are loaded as a DataFrame with a row for each station at
+each time.  Setting `xarray_output=True` when creating the Instrument loads
+them as an xarray Dataset with 'time' and 'station' dimensions instead.
+
 This material is based upon work supported by the
 National Science Foundation under Grant Number 1259508.
 
@@ -43,6 +47,7 @@ import numpy as np
 from os import path
 import functools
 import warnings
+import xarray as xr
 
 import pysat
 
@@ -80,6 +85,10 @@ def init(self):
         psplit = path.split(self.files.data_path[:-1])
         self.files.data_path = path.join(psplit[0], "all", "")
 
+    # data may be loaded as a Dataset with a station dimension
+    if self.kwargs.get('xarray_output', False):
+        self.pandas_format = False
+
     # reset the list_remote_files routine to include the data path
     # now conveniently included with instrument object
     self._list_remote_rtn = \
@@ -244,7 +253,7 @@ def list_files(tag='', sat_id=None, data_path=None, format_str=None):
         return pysat.Files.from_os(data_path=data_path, format_str=format_str)
 
 
-def load(fnames, tag='', sat_id=None):
+def load(fnames, tag='', sat_id=None, xarray_output=False):
     """ Load the SuperMAG files
 
     Parameters
@@ -256,10 +265,15 @@ def load(fnames, tag='', sat_id=None):
         'stations', and '' (for just magnetometer measurements). (default='')
     sat_id : (str or NoneType)
         Satellite ID for constellations, not used. (default=None)
+    xarray_output : (bool)
+        If True, the data are returned as an xarray Dataset with 'time' and
+        'station' dimensions rather than a DataFrame with a row for each
+        station at each time.  Set when creating the Instrument.
+        (default=False)
 
     Returns
     --------
-    data : (pandas.DataFrame)
+    data : (pandas.DataFrame or xarray.Dataset)
         Object containing satellite data
     meta : (pysat.Meta)
         Object containing metadata such as column names and units
@@ -300,13 +314,19 @@ def load(fnames, tag='', sat_id=None):
 
     # If data was loaded, update the meta data
     if len(data.columns) > 0:
+        if xarray_output:
+            data = station_dataset(data)
+
         meta = pysat.Meta()
-        for cc in data.columns:
-            meta[cc] = update_smag_metadata(cc)
+        for cc in data.keys():
+            if cc not in ['time', 'station']:
+                meta[cc] = update_smag_metadata(cc)
 
         meta.info = {'baseline': format_baseline_list(baseline)}
     else:
         meta = pysat.Meta(None)
+        if xarray_output:
+            data = xr.Dataset(None)
 
     return data, meta
 
@@ -397,7 +417,6 @@ def load_ascii_data(fname, tag):
         baselines for each file.  None of not present or not applicable.
 
     """
-    import re
     ndata = {"indices": 2, "": 4, "all": 4, "stations": 8}
     dkeys = {'stations': list(), '': ['IAGA', 'N', 'E', 'Z']}
     data = pds.DataFrame(None)
@@ -411,127 +430,243 @@ def load_ascii_data(fname, tag):
     # magnetometer data (as desired)
     with open(fname, "r") as fopen:
         # Set the processing flags
-        hflag = True  # header lines
         pflag = False  # parameter line
-        dflag = False if tag == "stations" else True  # date line
-        snum = 0      # number of magnetometer stations
-        ddict = dict()
-        date_list = list()
+        fline = fopen.readline()
+
+        # Cycle past the header, the line is used instead of iteration so that
+        # the rest of the file may be read from the current position
+        while len(fline) > 0:
+            line_len = len(fline)
 
+            if pflag:
+                pflag = False  # Unset the flag
+                if fline.find("-mlt") > 0:
+                    dkeys[''].extend(['MLT', 'MLAT'])
+                if fline.find("-sza") > 0:
+                    dkeys[''].append('SZA')
+                if fline.find("-decl") > 0:
+                    dkeys[''].append('IGRF_DECL')
+                if tag == "indices" and fline.find("-envelope") < 0:
+                    # Indices not included in this file
+                    return data, baseline
+
+                # Save the baseline information
+                lsplit = fline.split()
+                idelta = lsplit.index('-delta') + 1
+                ibase = lsplit.index('-baseline') + 1
+                isd = lsplit.index('-sd') + 1
+                ist = lsplit.index('-st') + 1
+                iex = lsplit.index('-ex') + 1
+                baseline = " ".join([lsplit[ibase], lsplit[idelta],
+                                     lsplit[isd], lsplit[ist],
+                                     lsplit[iex]])
+
+            if fline.find("Selected parameters:") >= 0:
+                pflag = True
+            if fline.count("=") == line_len - 1 and line_len > 2:
+                break
+
+            fline = fopen.readline()
+
+        # Load the desired data
         if tag == "stations":
             dtime = pds.datetime.strptime(fname.split("_")[-1].split(".")[0],
                                           "%Y")
+            data = load_ascii_stations(fopen, dtime, ndata[tag])
+        else:
+            data = load_ascii_measurements(fopen, tag, dkeys[''])
 
-        for fline in fopen.readlines():
-            # Cycle past the header
-            line_len = len(fline)
+    return data, baseline
+
+
+def load_ascii_stations(fopen, dtime, ndata):
+    """Load the station lines from a self-documenting ASCII SuperMAG file
+
+    Parameters
+    ------------
+    fopen : (file)
+        ASCII SuperMAG file, positioned after the header
+    dtime : (datetime)
+        Year of the station file
+    ndata : (int)
+        Minimum number of columns in a station line
 
-            if hflag:
-                if pflag:
-                    pflag = False  # Unset the flag
-                    if fline.find("-mlt") > 0:
-                        ndata[''] += 2
-                        dkeys[''].extend(['MLT', 'MLAT'])
-                    if fline.find("-sza") > 0:
-                        ndata[''] += 1
-                        dkeys[''].append('SZA')
-                    if fline.find("-decl") > 0:
-                        ndata[''] += 1
-                        dkeys[''].append('IGRF_DECL')
-                    if tag == "indices" and fline.find("-envelope") < 0:
-                        # Indices not included in this file
-                        break
-
-                    # Save the baseline information
-                    lsplit = fline.split()
-                    idelta = lsplit.index('-delta') + 1
-                    ibase = lsplit.index('-baseline') + 1
-                    isd = lsplit.index('-sd') + 1
-                    ist = lsplit.index('-st') + 1
-                    iex = lsplit.index('-ex') + 1
-                    baseline = " ".join([lsplit[ibase], lsplit[idelta],
-                                         lsplit[isd], lsplit[ist],
-                                         lsplit[iex]])
-
-                if fline.find("Selected parameters:") >= 0:
-                    pflag = True
-                if fline.count("=") == line_len - 1 and line_len > 2:
-                    hflag = False
+    Returns
+    --------
+    data : (pandas.DataFrame)
+        Pandas DataFrame
+
+    """
+    import re
+
+    dkeys = list()
+    ddict = dict()
+    date_list = list()
+
+    for fline in fopen:
+        lsplit = [ll for ll in re.split(r'[\t\n]+', fline) if len(ll) > 0]
+
+        if len(lsplit) >= ndata:
+            if len(dkeys) == 0:
+                # Station files include column names and data files
+                # do not.  Read in the column names here
+                for ll in lsplit:
+                    ll = re.sub("-", "_", ll)
+                    dkeys.append(ll)
+                    ddict[ll] = list()
             else:
-                # Load the desired data
-                lsplit = [ll for ll in re.split(r'[\t\n]+', fline)
-                          if len(ll) > 0]
-
-                if dflag:
-                    dflag = False  # Unset the date flag
-                    dstring = " ".join(lsplit[:6])
-                    dtime = pysat.datetime.strptime(dstring,
-                                                    "%Y %m %d %H %M %S")
-                    snum = int(lsplit[6])  # Set the number of stations
-
-                    # Load the times
-                    if tag == "indices":
-                        date_list.append(dtime)
+                # Because stations can have multiple operators,
+                # ndata supplies the minimum number of columns
+                date_list.append(dtime)
+                for i, ll in enumerate(lsplit):
+                    if i >= 1 and i <= 4:
+                        ddict[dkeys[i]].append(float(ll))
+                    elif i == 6:
+                        ddict[dkeys[i]].append(int(ll))
+                    elif i < len(dkeys):
+                        ddict[dkeys[i]].append(ll)
                     else:
-                        date_list.extend([dtime for i in range(snum)])
-                elif len(lsplit) == ndata['indices']:
-                    if tag is not '':
-                        if lsplit[0] not in ddict.keys():
-                            ddict[lsplit[0]] = list()
-
-                        if tag == "indices":
-                            ddict[lsplit[0]].append(int(lsplit[1]))
-                        else:
-                            # This works because indices occur before
-                            # magnetometer measurements
-                            ddict[lsplit[0]].extend([int(lsplit[1])
-                                                     for i in range(snum)])
-                else:
-                    if tag == "stations" and len(lsplit) >= ndata[tag]:
-                        if len(dkeys[tag]) == 0:
-                            # Station files include column names and data files
-                            # do not.  Read in the column names here
-                            for ll in lsplit:
-                                ll = re.sub("-", "_", ll)
-                                dkeys[tag].append(ll)
-                                ddict[ll] = list()
-                        else:
-                            # Because stations can have multiple operators,
-                            # ndata supplies the minimum number of columns
-                            date_list.append(dtime)
-                            for i, ll in enumerate(lsplit):
-                                if i >= 1 and i <= 4:
-                                    ddict[dkeys[tag][i]].append(float(ll))
-                                elif i == 6:
-                                    ddict[dkeys[tag][i]].append(int(ll))
-                                elif i < len(dkeys[tag]):
-                                    ddict[dkeys[tag][i]].append(ll)
-                                else:
-                                    ddict[dkeys[tag][-1]][-1] += \
-                                                            " {:s}".format(ll)
-                    elif len(lsplit) == ndata['']:
-                        snum -= 1  # Mark the ingestion of a station
-                        if tag != "indices":
-                            if len(ddict.keys()) < ndata['']:
-                                for kk in dkeys['']:
-                                    ddict[kk] = list()
-                            for i, kk in enumerate(dkeys['']):
-                                if i == 0:
-                                    ddict[kk].append(lsplit[i])
-                                else:
-                                    ddict[kk].append(float(lsplit[i]))
-
-                if tag != "stations" and snum == 0 and len(ddict.items()) >= 2:
-                    # The previous value was the last value, prepare for
-                    # next block
-                    dflag = True
+                        ddict[dkeys[-1]][-1] += " {:s}".format(ll)
 
-        # Create a data frame for this file
-        data = pds.DataFrame(ddict, index=date_list, columns=ddict.keys())
+    # Create a data frame for this file
+    data = pds.DataFrame(ddict, index=date_list, columns=ddict.keys())
 
-        fopen.close()
+    return data
 
-    return data, baseline
+
+def load_ascii_measurements(fopen, tag, station_keys):
+    """Load the indices and magnetometer data from a self-documenting ASCII
+    SuperMAG file
+
+    Parameters
+    ------------
+    fopen : (file)
+        ASCII SuperMAG file, positioned after the header
+    tag : (str)
+        Denotes type of file to load.  Accepted types are 'indices', 'all',
+        and '' (for just magnetometer measurements).
+    station_keys : (list)
+        Names of the columns in each magnetometer station line
+
+    Returns
+    --------
+    data : (pandas.DataFrame)
+        Pandas DataFrame
+
+    Note
+    ----
+    The data are a series of blocks, each with a date line, a line for each
+    index, and a line for each station.  Every line is read into columns in
+    a single pass of the pandas C parser, after which the date, index, and
+    station lines are identified and converted without looping over lines.
+
+    """
+
+    # Read every line, shorter lines are padded with NaN.  Only the first
+    # column, which holds the station and index names, is kept as strings
+    ncols = max(7, len(station_keys))
+    raw = pds.read_csv(fopen, sep=r'\s+', header=None,
+                       names=list(range(ncols)), dtype={0: str},
+                       keep_default_na=False,
+                       na_values={i: [''] for i in range(1, ncols)})
+    if len(raw) == 0:
+        return pds.DataFrame(None)
+
+    # Date lines have seven numbers, index lines have a name and a value, and
+    # the remaining lines hold the station data
+    nfields = raw.iloc[:, 1:].notnull().sum(axis=1).values + 1
+    is_date = raw[0].str.isdigit().values & (nfields == 7)
+    is_index = ~is_date & (nfields == 2)
+    is_station = ~is_date & ~is_index
+
+    # Find the block each line belongs to and the time of each block
+    block = np.cumsum(is_date) - 1
+    is_index &= block >= 0
+    is_station &= block >= 0
+    dates = raw.loc[is_date, list(range(7))].values.astype(np.int64)
+    uts = dates[:, 3] * 3600 + dates[:, 4] * 60 + dates[:, 5]
+    times = pysat.utils.time.create_datetime_index(year=dates[:, 0],
+                                                   month=dates[:, 1],
+                                                   day=dates[:, 2], uts=uts)
+
+    # Fill the index values for each block
+    ddict = dict()
+    if tag != '':
+        iblock = block[is_index]
+        inames = raw.loc[is_index, 0].values
+        ivalues = raw.loc[is_index, 1].values
+        for iname in pds.unique(inames):
+            imask = inames == iname
+            ddict[iname] = np.full(shape=len(times), fill_value=np.nan)
+            ddict[iname][iblock[imask]] = ivalues[imask]
+            if np.isfinite(ddict[iname]).all():
+                ddict[iname] = ddict[iname].astype(np.int64)
+
+    if tag == "indices":
+        return pds.DataFrame(ddict, index=times, columns=ddict.keys())
+
+    # Repeat the indices and time for each station
+    sblock = block[is_station]
+    for iname in ddict.keys():
+        ddict[iname] = ddict[iname][sblock]
+
+    for i, kk in enumerate(station_keys):
+        ddict[kk] = raw.loc[is_station, i].values
+
+    data = pds.DataFrame(ddict, index=times[sblock], columns=ddict.keys())
+
+    return data
+
+
+def station_dataset(data):
+    """Convert SuperMAG data to an xarray Dataset indexed by time and station
+
+    Parameters
+    ------------
+    data : (pandas.DataFrame)
+        SuperMAG data, with a row for each station at each time and the
+        station code in the 'IAGA' column
+
+    Returns
+    --------
+    data : (xarray.Dataset)
+        Dataset with a 'time' dimension and a 'station' dimension, labelled by
+        the station codes.  The SMU and SML indices only vary with time.
+        Stations without data at a given time are filled with NaN, or an
+        empty string for strings.
+
+    """
+
+    times, tind = np.unique(data.index.values, return_inverse=True)
+    stations, sind = np.unique(data['IAGA'].values.astype(str),
+                               return_inverse=True)
+
+    data_vars = dict()
+    for cc in data.columns:
+        if cc == 'IAGA':
+            continue
+
+        values = data[cc].values
+        if cc in ['SMU', 'SML']:
+            dims = ('time',)
+            ind = (tind,)
+        else:
+            dims = ('time', 'station')
+            ind = (tind, sind)
+
+        # Allocate the output once and fill it by index
+        shape = tuple([len(times) if dd == 'time' else len(stations)
+                       for dd in dims])
+        if values.dtype.kind in 'iuf':
+            out = np.full(shape=shape, fill_value=np.nan)
+        else:
+            out = np.full(shape=shape, fill_value='', dtype=object)
+        out[ind] = values
+        if values.dtype.kind in 'iu' and np.isfinite(out).all():
+            out = out.astype(values.dtype)
+        data_vars[cc] = (dims, out)
+
+    return xr.Dataset(data_vars, coords={'time': times, 'station': stations})
 
 
 def update_smag_metadata(col_name):
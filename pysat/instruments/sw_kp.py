@@ -145,8 +145,8 @@ def load(fnames, tag=None, sat_id=None):
         # now, Kp comes in non-user friendly values
         # 2-, 2o, and 2+ relate to 1.6, 2.0, 2.3
         # will convert for user friendliness
-        first = np.array([float(x[0]) for x in s])
-        flag = np.array([x[1] for x in s])
+        first = s.str[0].astype(float).values
+        flag = s.str[1].values
 
         ind, = np.where(flag == '+')
         first[ind] += 1.0 / 3.0
@@ -501,23 +501,38 @@ def convert_3hr_kp_to_ap(kp_inst):
 
     """
 
-    # Kp are keys, where n.3 = n+ and n.6 = (n+1)-. E.g., 0.6 = 1-
-    kp_to_ap = {0: 0, 0.3: 2, 0.6: 3, 1: 4, 1.3: 5, 1.6: 6, 2: 7, 2.3: 9,
-                2.6: 12, 3: 15, 3.3: 18, 3.6: 22, 4: 27, 4.3: 32, 4.6: 39,
-                5: 48, 5.3: 56, 5.6: 67, 6: 80, 6.3: 94, 6.6: 111, 7: 132,
-                7.3: 154, 7.6: 179, 8: 207, 8.3: 236, 8.6: 300, 9: 400}
-
-    def ap(kk): return kp_to_ap[np.floor(kk*10.0) / 10.0] \
-        if np.isfinite(kk) else np.nan
+    # Kp in tenths are keys, where n.3 = n+ and n.6 = (n+1)-. E.g., 0.6 = 1-
+    kp_keys = np.array([0, 3, 6, 10, 13, 16, 20, 23, 26, 30, 33, 36, 40, 43,
+                        46, 50, 53, 56, 60, 63, 66, 70, 73, 76, 80, 83, 86,
+                        90])
+    ap_values = np.array([0, 2, 3, 4, 5, 6, 7, 9, 12, 15, 18, 22, 27, 32, 39,
+                          48, 56, 67, 80, 94, 111, 132, 154, 179, 207, 236,
+                          300, 400])
 
     # Test the input
     if 'Kp' not in kp_inst.data.columns:
         raise ValueError('unable to locate Kp data')
 
-    # Convert from Kp to ap
+    # Convert from Kp to ap, looking up all of the Kp values at once
     fill_val = kp_inst.meta['Kp'][kp_inst.meta.fill_label]
-    ap_data = np.array([ap(kp) if kp != fill_val else fill_val
-                        for kp in kp_inst['Kp']])
+    kp = np.asarray(kp_inst['Kp'], dtype=float)
+    is_fill = kp == fill_val
+    is_data = np.isfinite(kp) & ~is_fill
+
+    kp_tenths = np.floor(kp[is_data] * 10.0)
+    ind = np.searchsorted(kp_keys, kp_tenths).clip(max=len(kp_keys) - 1)
+    if np.any(kp_keys[ind] != kp_tenths):
+        bad_kp = np.unique(kp[is_data][kp_keys[ind] != kp_tenths])
+        raise ValueError('unknown Kp values: {:}'.format(bad_kp))
+
+    ap_data = np.full(shape=kp.shape, fill_value=np.nan)
+    ap_data[is_fill] = fill_val
+    ap_data[is_data] = np.take(ap_values, ind)
+
+    # Keep integer ap unless there are NaN or float fill values
+    if (is_data | is_fill).all() and (not is_fill.any() or
+                                      isinstance(fill_val, (int, np.integer))):
+        ap_data = ap_data.astype(int)
 
     # Append the output to the pysat instrument
     kp_inst['3hr_ap'] = pds.Series(ap_data, index=kp_inst.index)
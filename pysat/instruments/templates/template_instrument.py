@@ -77,6 +77,10 @@ test_dates = {'': {'': pysat.datetime(2019, 1, 1)}}
 # Set to True if data will be returned via a pandas DataFrame
 pandas_format = False
 
+# Set to True if the load routine accepts files spanning several days, so
+# that time windows over many days are loaded with a single call
+# multi_day_load = True
+
 
 def init(self):
     """Initializes the Instrument object with instrument specific values.
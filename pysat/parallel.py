@@ -0,0 +1,189 @@
+"""
+pysat.parallel - parallel processing of Instrument data over a season
+=====================================================================
+
+Main Features
+-------------
+- Map a function over every day/file within Instrument.bounds using a pool
+  of worker processes, each with an independent copy of the Instrument.
+- Combine the results across the season using a user supplied reducer.
+"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+import functools
+import multiprocessing
+
+import numpy as np
+
+
+def map_season(inst, func, reducer=None, workers=None, chunk_size=None,
+               *args, **kwargs):
+    """Apply func to each day/file of data within Instrument bounds.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument with bounds set to the season of interest. Any custom
+        functions, padding, and load keywords attached to inst are used by
+        every worker.
+    func : function
+        Called as func(inst, *args, **kwargs) for each day/file with loaded
+        data. Return values of None are ignored.
+    reducer : function or NoneType
+        Called as reducer(result1, result2) to combine two results into one.
+        Must be associative, results are always combined in time order. If
+        None, a list of the results from each day/file is returned.
+        (default=None)
+    workers : int or NoneType
+        Number of worker processes. If None, the number of CPUs is used.
+        If 1, data is processed within the current process. (default=None)
+    chunk_size : int or NoneType
+        Number of consecutive days/files processed by a worker at a time.
+        If None, the season is split into about four chunks per worker.
+        (default=None)
+    *args : extra arguments
+        passed to func
+    **kwargs : extra keyword arguments
+        passed to func
+
+    Returns
+    -------
+    output
+        result of reducing func outputs over the season, None if there was
+        no data. If reducer is None, a list of func outputs in time order.
+
+    Note
+    ----
+    Each worker receives a pickled copy of inst, so inst (including custom
+    functions and load routines), func, and reducer must be picklable. In
+    particular, they must be defined at the top level of a module rather than
+    as lambda functions. Consecutive days are kept together within a chunk so
+    data padding only requires extra loads at chunk edges.
+
+    Examples
+    --------
+    ::
+
+        def day_sum(inst, label):
+            return np.array([inst[label].sum(), inst[label].count()])
+
+        def add(first, second):
+            return first + second
+
+        ivm = pysat.Instrument('cnofs', 'ivm')
+        start = pysat.datetime(2009, 1, 1)
+        stop = pysat.datetime(2009, 12, 31)
+        ivm.bounds = (start, stop)
+        total, count = pysat.parallel.map_season(ivm, day_sum, add,
+                                                 workers=8,
+                                                 label='ionVelmeridional')
+        mean = total / count
+
+    """
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if workers < 1:
+        raise ValueError('Must have at least one worker.')
+
+    iter_list = list(inst._iter_list)
+    if len(iter_list) == 0:
+        return _reduce_partials([], reducer)
+    if chunk_size is None:
+        chunk_size = int(np.ceil(len(iter_list) / (4. * workers)))
+    chunks = [iter_list[i:i + chunk_size]
+              for i in np.arange(0, len(iter_list), chunk_size)]
+
+    # copy instrument without any loaded data, reduces pickling costs
+    base = inst.copy()
+    base.data = base._null_data.copy()
+    base._prev_data = base._null_data.copy()
+    base._curr_data = base._null_data.copy()
+    base._next_data = base._null_data.copy()
+    base.orbits._reset()
+    base.orbits._fullDayData = None
+
+    map_func = functools.partial(_map_chunk, base, func, reducer, args, kwargs)
+    if workers == 1:
+        partials = [map_func(chunk) for chunk in chunks]
+    else:
+        pool = multiprocessing.Pool(processes=workers)
+        try:
+            partials = pool.map(map_func, chunks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    return _reduce_partials(partials, reducer)
+
+
+def _map_chunk(inst, func, reducer, args, kwargs, chunk):
+    """Apply func to each day/file in chunk and reduce the results.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument used to load data
+    func : function
+        function applied to each day/file of data
+    reducer : function or NoneType
+        function used to combine results, see map_season
+    args : tuple
+        extra arguments passed to func
+    kwargs : dict
+        extra keyword arguments passed to func
+    chunk : list
+        list of dates or filenames to process
+
+    Returns
+    -------
+    output
+        reduced result for chunk, None if there was no data. If reducer is
+        None, a list of results in time order.
+
+    """
+
+    inst.bounds = (chunk, chunk)
+    results = []
+    for inst in inst:
+        if not inst.empty:
+            result = func(inst, *args, **kwargs)
+            if result is not None:
+                results.append(result)
+
+    if reducer is None:
+        return results
+    return _reduce_partials(results, reducer)
+
+
+def _reduce_partials(partials, reducer):
+    """Combine ordered partial results.
+
+    Parameters
+    ----------
+    partials : list
+        list of partial results, None entries indicate no data
+    reducer : function or NoneType
+        function used to combine results, see map_season. If None,
+        partials are lists that are concatenated.
+
+    Returns
+    -------
+    output
+        reduced result, or None if there was no data. A list if reducer
+        is None.
+
+    """
+
+    if reducer is None:
+        output = []
+        for part in partials:
+            output.extend(part)
+        return output
+
+    partials = [part for part in partials if part is not None]
+    if len(partials) == 0:
+        return None
+    return functools.reduce(reducer, partials)
@@ -0,0 +1,248 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+"""Binning kernel shared by the seasonal analysis routines.
+
+Samples are assigned a single flat bin index, computed once per load using
+numpy.digitize and numpy.ravel_multi_index, so that per-bin quantities may be
+found in one pass with numpy.bincount or a stable sort rather than by
+searching for the samples within every bin.
+
+"""
+
+import numpy as np
+
+
+def bin_index(data, labels, bins):
+    """Return the flat bin index of every sample within bins.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        Data being binned
+    labels : list
+        Data labels that set the bin along each dimension
+    bins : list
+        Bin edges along each dimension, in the same order as labels
+
+    Returns
+    -------
+    index : np.array
+        Flat index, see numpy.ravel_multi_index, for each sample that lies
+        within the bins along every dimension
+    good : np.array
+        Boolean array flagging the samples within the bins
+
+    Note
+    ----
+    Samples are assigned bins as with np.digitize(data[label], edges) - 1,
+    samples outside of the edges or with NaN values are not binned.
+
+    """
+
+    shape = tuple([len(edges) - 1 for edges in bins])
+    inds = [np.digitize(data[label], edges) - 1
+            for label, edges in zip(labels, bins)]
+    good = np.ones(len(data), dtype=bool)
+    for ind, num in zip(inds, shape):
+        good &= (ind >= 0) & (ind < num)
+    index = np.ravel_multi_index([ind[good] for ind in inds], shape)
+    return index, good
+
+
+def bin_groups(index, size):
+    """Group samples by bin, keeping the original order within each bin.
+
+    Parameters
+    ----------
+    index : np.array
+        Flat bin index of each sample, see bin_index
+    size : int
+        Total number of bins
+
+    Returns
+    -------
+    order : np.array
+        Positions of the samples sorted by bin
+    bounds : np.array
+        order[bounds[i]:bounds[i + 1]] are the samples in bin i
+
+    """
+
+    order = np.argsort(index, kind='mergesort')
+    bounds = np.zeros(size + 1, dtype=int)
+    np.cumsum(np.bincount(index, minlength=size), out=bounds[1:])
+    return order, bounds
+
+
+def bin_any(index, flag, size):
+    """Return True for every bin with at least one flagged sample.
+
+    Parameters
+    ----------
+    index : np.array
+        Flat bin index of each sample, see bin_index
+    flag : np.array
+        Boolean array flagging samples
+    size : int
+        Total number of bins
+
+    Returns
+    -------
+    np.array
+        Boolean array of length size
+
+    """
+
+    return np.bincount(index[flag], minlength=size) > 0
+
+
+class BinAccumulator(object):
+    """Collects finite values by bin in growable numpy buffers.
+
+    Values are stored alongside their flat bin index and only sorted by bin
+    when statistics are requested, so exact medians may be calculated
+    without storing a separate Python object per bin.
+
+    Parameters
+    ----------
+    size : int
+        Total number of bins
+
+    Attributes
+    ----------
+    dtype : np.dtype
+        Type of the stored values, promoted as values are added
+
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.num = 0
+        self._index = np.empty(0, dtype=np.int64)
+        # boolean is promoted to the type of any numbers added
+        self._values = np.empty(0, dtype=bool)
+
+    def __len__(self):
+        return self.num
+
+    @property
+    def dtype(self):
+        return self._values.dtype
+
+    def __getstate__(self):
+        """Pickle only the filled part of the buffers."""
+
+        state = self.__dict__.copy()
+        state['_index'] = self._index[:self.num]
+        state['_values'] = self._values[:self.num]
+        return state
+
+    def add(self, index, values):
+        """Add values to the accumulator, non-finite values are dropped.
+
+        Parameters
+        ----------
+        index : np.array
+            Flat bin index of each value, see bin_index
+        values : array-like
+            Numeric (boolean, integer, or float) values
+
+        """
+
+        values = np.asarray(values)
+        if values.dtype.kind not in 'biuf':
+            raise ValueError(''.join(('Only numeric values may be binned ',
+                                      'by a BinAccumulator, not ',
+                                      str(values.dtype))))
+        finite = np.isfinite(values)
+        index = np.asarray(index)[finite]
+        values = values[finite]
+
+        end = self.num + len(values)
+        dtype = np.result_type(self._values.dtype, values.dtype)
+        if (end > len(self._values)) or (dtype != self._values.dtype):
+            # grow geometrically so adding is amortized constant time
+            capacity = max(end, 2 * len(self._values), 1024)
+            new_index = np.empty(capacity, dtype=np.int64)
+            new_index[:self.num] = self._index[:self.num]
+            new_values = np.empty(capacity, dtype=dtype)
+            new_values[:self.num] = self._values[:self.num]
+            self._index = new_index
+            self._values = new_values
+        self._index[self.num:end] = index
+        self._values[self.num:end] = values
+        self.num = end
+
+    def statistics(self):
+        """Return the exact median, count, and median absolute deviation.
+
+        Returns
+        -------
+        median : np.array
+            Median of the values in each bin, NaN if empty
+        count : np.array
+            Number of values in each bin, NaN if empty
+        avg_abs_dev : np.array
+            Median absolute deviation from the median in each bin, NaN
+            if empty
+
+        """
+
+        index = self._index[:self.num]
+        values = self._values[:self.num].astype(np.float64)
+        # sort by bin, then by value within each bin
+        order = np.lexsort((values, index))
+        index = index[order]
+        values = values[order]
+        counts = np.bincount(index, minlength=self.size)
+        starts = np.zeros(self.size, dtype=np.int64)
+        np.cumsum(counts[:-1], out=starts[1:])
+
+        median = _segment_median(values, starts, counts)
+        dev = np.abs(values - median[index])
+        dev = dev[np.lexsort((dev, index))]
+        avg_abs_dev = _segment_median(dev, starts, counts)
+
+        count = counts.astype(np.float64)
+        count[counts == 0] = np.nan
+        return median, count, avg_abs_dev
+
+    def bin_values(self):
+        """Return a list with the values of each bin, in the order added.
+
+        Values keep their type, see BinAccumulator.dtype.
+
+        """
+
+        order, bounds = bin_groups(self._index[:self.num], self.size)
+        values = self._values[:self.num][order]
+        return [values[bounds[i]:bounds[i + 1]] for i in range(self.size)]
+
+
+def _segment_median(values, starts, counts):
+    """Return the median of each segment of values sorted within segments.
+
+    Parameters
+    ----------
+    values : np.array
+        Values, sorted in increasing order within each segment
+    starts : np.array
+        Position of the first value in each segment
+    counts : np.array
+        Number of values in each segment
+
+    Returns
+    -------
+    np.array
+        Median of each segment, NaN for empty segments
+
+    """
+
+    median = np.full(len(counts), np.nan)
+    filled = counts > 0
+    # average the middle values, as for numpy.median
+    lower = starts[filled] + (counts[filled] - 1) // 2
+    upper = starts[filled] + counts[filled] // 2
+    median[filled] = (values[lower] + values[upper]) / 2.
+    return median
@@ -0,0 +1,159 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+"""Checkpointing of seasonal calculations.
+
+The accumulated state of a seasonal calculation is periodically saved to a
+file along with the days/files already processed, so an interrupted run may
+be resumed, or an existing result extended to new data, without processing
+the same data twice.
+
+"""
+
+import os
+import pickle
+
+import numpy as np
+import pandas as pds
+
+# atomic on all platforms under python 3, and on posix under python 2
+_replace = getattr(os, 'replace', os.rename)
+
+
+class Checkpoint(object):
+    """Records the state and progress of a seasonal calculation.
+
+    Parameters
+    ----------
+    fname : str or NoneType
+        File used to store the checkpoint. If None, no checkpoint is kept
+        and every day/file within the bounds is processed.
+    params : list
+        Parameters defining the calculation. A stored checkpoint may only be
+        resumed with the same parameters.
+    every : int
+        Number of days/files loaded between saves of the checkpoint.
+        (default=10)
+
+    Attributes
+    ----------
+    state : object
+        Accumulated state of the calculation, None if no checkpoint was
+        restored. Set by the calculation and updated in place.
+    done : set
+        (instrument number, date or filename) of each day/file with data
+        that has been processed
+    empty : dict
+        Files seen for each (instrument number, date or filename) loaded
+        without any data, as (filename, modification time) pairs
+
+    """
+
+    def __init__(self, fname, params, every=10):
+        self.fname = fname
+        self.params = repr([np.asarray(par).tolist()
+                            if isinstance(par, np.ndarray) else par
+                            for par in params])
+        self.every = every
+        self.state = None
+        self.done = set()
+        self.empty = {}
+        self._num_loaded = 0
+
+        if (fname is not None) and os.path.isfile(fname):
+            with open(fname, 'rb') as fin:
+                stored = pickle.load(fin)
+            if stored['params'] != self.params:
+                raise ValueError(''.join(('Checkpoint ', fname, ' was ',
+                                          'created with different ',
+                                          'parameters.')))
+            self.state = stored['state']
+            self.done = stored['done']
+            self.empty = stored['empty']
+
+    def save(self):
+        """Write the state and progress to the checkpoint file."""
+
+        self._num_loaded = 0
+        if self.fname is None:
+            return
+
+        stored = {'params': self.params, 'state': self.state,
+                  'done': self.done, 'empty': self.empty}
+        temp_name = self.fname + '.tmp'
+        with open(temp_name, 'wb') as fout:
+            pickle.dump(stored, fout, protocol=pickle.HIGHEST_PROTOCOL)
+        # the previous checkpoint is only replaced by a complete one
+        _replace(temp_name, self.fname)
+
+    @staticmethod
+    def _seen_files(inst, key):
+        """Return the files, with modification times, for a date/filename."""
+
+        if inst._iter_type == 'file':
+            fnames = [key]
+        else:
+            fnames = inst.files[key:key + pds.DateOffset(days=1)]
+
+        seen = []
+        for fname in fnames:
+            path = os.path.join(inst.files.data_path, fname)
+            seen.append((os.path.basename(fname),
+                         os.path.getmtime(path) if os.path.isfile(path)
+                         else None))
+        return tuple(seen)
+
+    def iterate(self, const):
+        """Load each day/file within bounds that has yet to be processed.
+
+        Parameters
+        ----------
+        const : list-like or Constellation
+            Instruments to iterate over
+
+        Yields
+        ------
+        pysat.Instrument
+            Instrument with data loaded for a day/file. The day/file is
+            recorded as processed once control returns to the generator.
+
+        Note
+        ----
+        Days/files that were loaded without any data are only loaded again
+        if their files have since been added, removed, or modified.
+
+        """
+
+        if self.fname is None:
+            for inst in const:
+                for inst in inst:
+                    if len(inst.data) != 0:
+                        yield inst
+            return
+
+        for i, inst in enumerate(const):
+            keys = [key for key in getattr(inst, '_iter_list', [])
+                    if (i, key) not in self.done]
+            if np.any([(i, key) in self.empty for key in keys]):
+                # compare against the files on disk, not the stored list
+                inst.files.refresh()
+                keys = [key for key in keys if ((i, key) not in self.empty) or
+                        self.empty[(i, key)] != self._seen_files(inst, key)]
+
+            for key in keys:
+                if inst._iter_type == 'file':
+                    inst.load(fname=key)
+                else:
+                    inst.load(date=key)
+                if len(inst.data) != 0:
+                    yield inst
+                    self.done.add((i, key))
+                    self.empty.pop((i, key), None)
+                else:
+                    self.empty[(i, key)] = self._seen_files(inst, key)
+
+                self._num_loaded += 1
+                if self._num_loaded >= self.every:
+                    self.save()
+
+        self.save()
@@ -11,7 +11,228 @@ import numpy as np
 import pandas as pds
 import collections
 
-def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False):
+from pysat.ssnl._binning import bin_index, bin_groups, BinAccumulator
+from pysat.ssnl._checkpoint import Checkpoint
+
+
+class HistogramSketch(object):
+    """Mergeable fixed-histogram quantile sketch of binned data.
+
+    Counts the number of samples within fixed value bins, separately for
+    each data bin, so memory use is independent of the number of samples.
+    Medians and median absolute deviations are estimated from the counts.
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of the data bins, e.g. (number of y bins, number of x bins)
+    value_bins : array-like
+        [min, max, number of value bins] used to resolve the data values
+
+    Attributes
+    ----------
+    counts : np.array
+        Number of samples per data bin (leading dimensions) and value bin
+        (last dimension). The first and last value bins hold samples below
+        min and at or above max, respectively.
+    resolution : float
+        Width of the value bins
+
+    Note
+    ----
+    Estimated medians lie within resolution of the exact median of each
+    data bin, and estimated median absolute deviations within 1.5 times
+    resolution, as long as the middle samples fall between min and max.
+    Samples outside of [min, max) are counted as though they were at min or
+    max.
+
+    Sketches with the same shape and value_bins may be merged with +, so
+    seasons may be split up, processed separately, and combined.
+
+    Examples
+    --------
+    ::
+
+        out1 = avg.median2D(inst1, [0., 360., 24], 'longitude',
+                            [0., 24., 24], 'mlt', ['dummy1'],
+                            sketch=[0., 24., 2400])
+        out2 = avg.median2D(inst2, [0., 360., 24], 'longitude',
+                            [0., 24., 24], 'mlt', ['dummy1'],
+                            sketch=[0., 24., 2400])
+        sketch = out1['dummy1']['sketch'] + out2['dummy1']['sketch']
+        median = sketch.median()
+
+    """
+
+    def __init__(self, shape, value_bins):
+        self.shape = tuple(shape)
+        self.value_bins = list(value_bins)
+        self.edges = np.linspace(value_bins[0], value_bins[1],
+                                 int(value_bins[2]) + 1)
+        self.resolution = self.edges[1] - self.edges[0]
+        self.counts = np.zeros(self.shape + (len(self.edges) + 1,),
+                               dtype=np.int64)
+
+    def __repr__(self):
+        output_str = ''.join(('pysat.ssnl.avg.HistogramSketch(shape=',
+                              repr(self.shape), ', value_bins=',
+                              repr(self.value_bins), ')'))
+        return output_str
+
+    def __add__(self, other):
+        if (self.shape != other.shape) or \
+                (self.value_bins != other.value_bins):
+            raise ValueError('Sketches must have the same shape and bins.')
+        output = HistogramSketch(self.shape, self.value_bins)
+        output.counts = self.counts + other.counts
+        return output
+
+    def add(self, bin_index, values):
+        """Add samples to the sketch.
+
+        Parameters
+        ----------
+        bin_index : array-like
+            Flat index of the data bin for each sample, see
+            numpy.ravel_multi_index
+        values : array-like
+            Finite sample values
+
+        """
+
+        num_cells = self.counts.shape[-1]
+        cells = np.digitize(values, self.edges)
+        counts = np.bincount(np.asarray(bin_index) * num_cells + cells,
+                             minlength=self.counts.size)
+        self.counts += counts.reshape(self.counts.shape)
+
+    def count(self):
+        """Return the number of samples in each data bin."""
+
+        return self.counts.sum(axis=-1)
+
+    def _cells(self):
+        """Return the lower edge and width of every value bin."""
+
+        lower = np.hstack((self.edges[0], self.edges[:-1], self.edges[-1]))
+        width = np.hstack((0., np.diff(self.edges), 0.))
+        return lower, width
+
+    @staticmethod
+    def _rank_value(counts, rank, lower, width):
+        """Estimate the value of the sample at rank (starting at 1) in each
+        row of counts, given the lower edge and width of every value bin."""
+
+        cumulative = np.cumsum(counts, axis=1)
+        cell = np.minimum((cumulative < rank[:, None]).sum(axis=1),
+                          counts.shape[1] - 1)
+        rows = np.arange(counts.shape[0])
+        before = cumulative[rows, cell] - counts[rows, cell]
+        # samples are assumed to be evenly spread within each value bin
+        with np.errstate(divide='ignore', invalid='ignore'):
+            frac = (rank - before - 0.5) / counts[rows, cell]
+            return lower[rows, cell] + frac * width[rows, cell]
+
+    @classmethod
+    def _median(cls, counts, lower, width):
+        """Estimate the median of each row of counts, NaN if empty."""
+
+        total = counts.sum(axis=1)
+        # average the middle samples, as for numpy.median
+        median = 0.5 * (cls._rank_value(counts, (total + 1) // 2, lower,
+                                        width) +
+                        cls._rank_value(counts, total // 2 + 1, lower, width))
+        median[total == 0] = np.nan
+        return median
+
+    def median(self):
+        """Return the estimated median in each data bin, NaN if empty."""
+
+        counts = self.counts.reshape(-1, self.counts.shape[-1])
+        lower, width = self._cells()
+        lower = np.broadcast_to(lower, counts.shape)
+        width = np.broadcast_to(width, counts.shape)
+        return self._median(counts, lower, width).reshape(self.shape)
+
+    def avg_abs_dev(self):
+        """Return the estimated median absolute deviation from the median
+        in each data bin, NaN if empty."""
+
+        counts = self.counts.reshape(-1, self.counts.shape[-1])
+        lower, width = self._cells()
+        median = self.median().ravel()
+        # distance of each value bin from the median, in increasing order
+        dist = np.abs(lower + width / 2. - median[:, None])
+        order = np.argsort(dist, axis=1)
+        rows = np.arange(counts.shape[0])[:, None]
+        dev = self._median(counts[rows, order], dist[rows, order],
+                           np.zeros(counts.shape))
+        return dev.reshape(self.shape)
+
+
+def _sketch_median(const, bins, labels, data_label, sketch, checkpoint=None,
+                   checkpoint_every=10):
+    """Return sketch based medians of data_label binned by labels.
+
+    Parameters
+    ----------
+    const : list-like or Constellation
+        Instruments to iterate over
+    bins : list
+        Bin edges for each dimension of the output
+    labels : list
+        Data labels binned by bins, in the same order
+    data_label : list-like
+        Data product(s) to be averaged
+    sketch : array-like or dict
+        [min, max, number of value bins] used for every data_label, or a
+        dict of these keyed by data_label
+    checkpoint : str or NoneType
+        File used to checkpoint the sketches (default=None)
+    checkpoint_every : int
+        Number of days/files between checkpoints (default=10)
+
+    Returns
+    -------
+    output : dict
+        Sketch and statistics keyed by data_label
+
+    """
+
+    shape = tuple([len(edges) - 1 for edges in bins])
+    if not isinstance(sketch, dict):
+        sketch = dict([(label, sketch) for label in data_label])
+    sketches = [HistogramSketch(shape, sketch[label]) for label in data_label]
+
+    # restore the sketches so far if resuming from a checkpoint
+    ckpt = Checkpoint(checkpoint, ['sketch', [np.asarray(edges).tolist()
+                                              for edges in bins],
+                                   labels, list(data_label), sketch],
+                      checkpoint_every)
+    if ckpt.state is not None:
+        sketches = ckpt.state
+    ckpt.state = sketches
+
+    for inst in ckpt.iterate(const):
+        index, good = bin_index(inst.data, labels, bins)
+        for label, sk in zip(data_label, sketches):
+            values = np.asarray(inst.data[label], dtype=float)[good]
+            finite = np.isfinite(values)
+            sk.add(index[finite], values[finite])
+
+    output = {}
+    for label, sk in zip(data_label, sketches):
+        count = sk.count().astype(float)
+        count[count == 0] = np.nan
+        output[label] = {'median': sk.median(),
+                         'count': count,
+                         'avg_abs_dev': sk.avg_abs_dev(),
+                         'sketch': sk}
+    return output
+
+
+def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False,
+             sketch=None, checkpoint=None, checkpoint_every=10):
     """Return a 1D median of data_label over a season and label1
 
     Parameters
@@ -29,6 +250,20 @@ def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False):
               number of bins. If false, bin edges must be manually entered
     returnData : (boolean)
         Return data in output dictionary as well as statistics
+    sketch : (array-like, dict, or NoneType)
+        If not None, estimate statistics with a HistogramSketch per
+        data_label rather than storing every sample. Holds [min, max,
+        number of value bins] for all data_label, or a dict of these keyed
+        by data_label. Only supports scalar data. (default=None)
+    checkpoint : (string or NoneType)
+        If not None, file used to save the collected data every
+        checkpoint_every days/files. A run with the same parameters and an
+        existing checkpoint only processes days/files within the bounds
+        that have not already been processed. Days/files without data are
+        only revisited if their files have changed since. (default=None)
+    checkpoint_every : (int)
+        Number of days/files loaded between saves of the checkpoint.
+        (default=10)
 
     Returns
     -------
@@ -36,7 +271,8 @@ def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False):
         1D median accessed by data_label as a function of label1
         over the season delineated by bounds of passed instrument objects.
         Also includes 'count' and 'avg_abs_dev' as well as the values of
-        the bin edges in 'bin_x'
+        the bin edges in 'bin_x'. If sketch is used, also includes the
+        HistogramSketch in 'sketch'.
     
     """
 
@@ -57,6 +293,16 @@ def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False):
     else:
         binx = np.array(bin1)
 
+    if sketch is not None:
+        if returnData:
+            raise ValueError('Data can not be returned when using sketch.')
+        output = _sketch_median(const, [binx], [label1], data_label, sketch,
+                                checkpoint=checkpoint,
+                                checkpoint_every=checkpoint_every)
+        for label in data_label:
+            output[label]['bin_x'] = binx
+        return output
+
     # how many bins are used
     numx = len(binx)-1
     # how many different data products
@@ -66,39 +312,65 @@ def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False):
     # the indices of the bins/data products? used for looping.
     xarr = np.arange(numx)
     zarr = np.arange(numz)
-    # 3d array:  stores the data that is sorted into each bin? - in a deque
-    ans = [[collections.deque() for i in xarr] for k in zarr]
-
-    for inst in const:
-        # do loop to iterate over instrument season
-        # probably iterates by date but that all depends on the
-        # configuration of that particular instrument. 
-        # either way, it iterates over the instrument, loading successive
-        # data between start and end bounds
-        for inst in inst:
-            # collect data in bins for averaging
-            if len(inst.data) != 0:
-                # sort the data into bins (x) based on label 1
-                # (stores bin indexes in xind)
-                xind = np.digitize(inst.data[label1], binx) - 1
-                # for each possible x index
-                for xi in xarr:
-                    # get the indicies of those pieces of data in that bin
-                    xindex, = np.where(xind==xi)
-                    if len(xindex) > 0:
-                        # for each data product label zk
-                        for zk in zarr:
-                            # take the data (already filtered by x), select the
-                            # data, put it in a list, and extend the deque
-                            idata = inst.data.iloc[xindex]
-                            ans[zk][xi].extend(idata[data_label[zk]].tolist())
+    # stores the data that is sorted into each bin, created once the type
+    # of each data product is known
+    ans = [None for k in zarr]
+
+    # restore the data collected so far if resuming from a checkpoint
+    ckpt = Checkpoint(checkpoint, ['median1D', binx, label1, list(data_label)],
+                      checkpoint_every)
+    if ckpt.state is not None:
+        ans = ckpt.state
+    ckpt.state = ans
+
+    # do loop to iterate over instrument season
+    # probably iterates by date but that all depends on the
+    # configuration of that particular instrument.
+    # either way, it iterates over the instrument, loading successive
+    # data between start and end bounds, skipping any already processed
+    for inst in ckpt.iterate(const):
+        # collect data in bins for averaging, sorting the data into bins
+        # (x) based on label 1
+        index, good = bin_index(inst.data, [label1], [binx])
+        positions = None
+        for zk in zarr:
+            zdata = inst.data[data_label[zk]]
+            if ans[zk] is None:
+                # numbers are stored in arrays along with their bin,
+                # more generalized objects in a deque for each bin
+                if zdata.dtype.kind in 'biuf':
+                    ans[zk] = BinAccumulator(numx)
+                else:
+                    ans[zk] = [collections.deque() for i in xarr]
+            if isinstance(ans[zk], BinAccumulator):
+                if zdata.dtype.kind in 'biuf':
+                    ans[zk].add(index, zdata.values[good])
+                    continue
+                # generalized objects in a later load, move the numbers
+                # collected so far into a deque for each bin
+                ans[zk] = [collections.deque(values.tolist())
+                           for values in ans[zk].bin_values()]
+
+            if positions is None:
+                # data within each bin is contiguous and in time order
+                order, bounds = bin_groups(index, numx)
+                positions = np.nonzero(good)[0][order]
+                filled, = np.nonzero(np.diff(bounds))
+            # select the data product, put it in a list, and
+            # extend the deque of each bin with its segment
+            zdata = zdata.iloc[positions].tolist()
+            for xi in filled:
+                ans[zk][xi].extend(zdata[bounds[xi]:bounds[xi + 1]])
+
+    ans = [BinAccumulator(numx) if item is None else item for item in ans]
 
     # Calculate the 1D median
     return _calc_1d_median(ans, data_label, binx, xarr, zarr, numx, numz,
                            returnData)
 
 def median2D(const, bin1, label1, bin2, label2, data_label,
-             returnData=False, auto_bin=True):
+             returnData=False, auto_bin=True, sketch=None, checkpoint=None,
+             checkpoint_every=10):
     """Return a 2D average of data_label over a season and label1, label2.
 
     Parameters
@@ -111,6 +383,21 @@ def median2D(const, bin1, label1, bin2, label2, data_label,
             contains strings identifying data product(s) to be averaged
         auto_bin: if True, function will create bins from the min, max and
                   number of bins. If false, bin edges must be manually entered
+        sketch: array-like, dict, or NoneType
+            If not None, estimate statistics with a HistogramSketch per
+            data_label rather than storing every sample. Holds [min, max,
+            number of value bins] for all data_label, or a dict of these
+            keyed by data_label. Only supports scalar data. (default=None)
+        checkpoint: string or NoneType
+            If not None, file used to save the collected data every
+            checkpoint_every days/files. A run with the same parameters and
+            an existing checkpoint only processes days/files within the
+            bounds that have not already been processed. Days/files without
+            data are only revisited if their files have changed since.
+            (default=None)
+        checkpoint_every: int
+            Number of days/files loaded between saves of the checkpoint.
+            (default=10)
 
     Returns
     -------
@@ -118,7 +405,8 @@ def median2D(const, bin1, label1, bin2, label2, data_label,
         2D median accessed by data_label as a function of label1 and label2
         over the season delineated by bounds of passed instrument objects.
         Also includes 'count' and 'avg_abs_dev' as well as the values of
-        the bin edges in 'bin_x' and 'bin_y'.
+        the bin edges in 'bin_x' and 'bin_y'. If sketch is used, also
+        includes the HistogramSketch in 'sketch'.
 
     """
 
@@ -141,6 +429,17 @@ def median2D(const, bin1, label1, bin2, label2, data_label,
         binx = np.array(bin1)
         biny = np.array(bin2)
 
+    if sketch is not None:
+        if returnData:
+            raise ValueError('Data can not be returned when using sketch.')
+        output = _sketch_median(const, [biny, binx], [label2, label1],
+                                data_label, sketch, checkpoint=checkpoint,
+                                checkpoint_every=checkpoint_every)
+        for label in data_label:
+            output[label]['bin_x'] = binx
+            output[label]['bin_y'] = biny
+        return output
+
     # how many bins are used
     numx = len(binx)-1
     numy = len(biny)-1
@@ -152,47 +451,61 @@ def median2D(const, bin1, label1, bin2, label2, data_label,
     yarr = np.arange(numy)
     xarr = np.arange(numx)
     zarr = np.arange(numz)
-    # 3d array:  stores the data that is sorted into each bin? - in a deque
-    ans = [[[collections.deque() for i in xarr] for j in yarr] for k in zarr]
-
-    for inst in const:
-        # do loop to iterate over instrument season
-        # probably iterates by date but that all depends on the
-        # configuration of that particular instrument.
-        # either way, it iterates over the instrument, loading successive
-        # data between start and end bounds
-        for inst in inst:
-            # collect data in bins for averaging
-            if len(inst.data) != 0:
-                # sort the data into bins (x) based on label 1
-                # (stores bin indexes in xind)
-                xind = np.digitize(inst.data[label1], binx)-1
-                # for each possible x index
-                for xi in xarr:
-                    # get the indicies of those pieces of data in that bin
-                    xindex, = np.where(xind == xi)
-                    if len(xindex) > 0:
-                        # look up the data along y (label2) at that set of
-                        # indices (a given x)
-                        yData = inst.data.iloc[xindex]
-                        # digitize that, to sort data into bins along y
-                        # (label2) (get bin indexes)
-                        yind = np.digitize(yData[label2], biny)-1
-                        # for each possible y index
-                        for yj in yarr:
-                            # select data with this y index (and we already
-                            # filtered for this x index)
-                            yindex, = np.where(yind == yj)
-                            if len(yindex) > 0:
-                                # for each data product label zk
-                                for zk in zarr:
-                                    # take the data (already filtered by x)
-                                    # filter it by y and
-                                    # select the data product, put it in a
-                                    # list, and extend the deque
-                                    indlab = yData.columns.get_loc(data_label[zk])
-                                    ans[zk][yj][xi].extend(yData.iloc[yindex,
-                                                                      indlab].tolist())
+    # stores the data that is sorted into each bin, created once the type
+    # of each data product is known
+    ans = [None for k in zarr]
+
+    # restore the data collected so far if resuming from a checkpoint
+    ckpt = Checkpoint(checkpoint, ['median2D', binx, label1, biny, label2,
+                                   list(data_label)], checkpoint_every)
+    if ckpt.state is not None:
+        ans = ckpt.state
+    ckpt.state = ans
+
+    # do loop to iterate over instrument season
+    # probably iterates by date but that all depends on the
+    # configuration of that particular instrument.
+    # either way, it iterates over the instrument, loading successive
+    # data between start and end bounds, skipping any already processed
+    for inst in ckpt.iterate(const):
+        # collect data in bins for averaging, sorting the data into bins
+        # along y (label2) and x (label1)
+        index, good = bin_index(inst.data, [label2, label1], [biny, binx])
+        positions = None
+        for zk in zarr:
+            zdata = inst.data[data_label[zk]]
+            if ans[zk] is None:
+                # numbers are stored in arrays along with their bin,
+                # more generalized objects in a deque for each bin
+                if zdata.dtype.kind in 'biuf':
+                    ans[zk] = BinAccumulator(numy * numx)
+                else:
+                    ans[zk] = [[collections.deque() for i in xarr]
+                               for j in yarr]
+            if isinstance(ans[zk], BinAccumulator):
+                if zdata.dtype.kind in 'biuf':
+                    ans[zk].add(index, zdata.values[good])
+                    continue
+                # generalized objects in a later load, move the numbers
+                # collected so far into a deque for each bin
+                values = ans[zk].bin_values()
+                ans[zk] = [[collections.deque(values[yj * numx + xi].tolist())
+                            for xi in xarr] for yj in yarr]
+
+            if positions is None:
+                # data within each bin is contiguous and in time order
+                order, bounds = bin_groups(index, numy * numx)
+                positions = np.nonzero(good)[0][order]
+                filled, = np.nonzero(np.diff(bounds))
+                filled_y, filled_x = np.unravel_index(filled, (numy, numx))
+            # select the data product, put it in a list, and
+            # extend the deque of each bin with its segment
+            zdata = zdata.iloc[positions].tolist()
+            for flat, yj, xi in zip(filled, filled_y, filled_x):
+                ans[zk][yj][xi].extend(zdata[bounds[flat]:bounds[flat + 1]])
+
+    ans = [BinAccumulator(numy * numx) if item is None else item
+           for item in ans]
 
     return _calc_2d_median(ans, data_label, binx, biny, xarr, yarr, zarr,
                            numx, numy, numz, returnData)
@@ -214,6 +527,9 @@ def _calc_2d_median(ans, data_label, binx, biny, xarr, yarr, zarr, numx,
     # for each data product label, find the first nonempty bin
     # and select its type
     for zk in zarr:
+        if isinstance(ans[zk], BinAccumulator):
+            dataType[zk] = BinAccumulator
+            continue
         breakNow = False
         for yj in yarr:
             for xi in xarr:
@@ -232,6 +548,8 @@ def _calc_2d_median(ans, data_label, binx, biny, xarr, yarr, zarr, numx,
             objArray[i] = 'S'
         elif thing == pds.core.frame.DataFrame:
             objArray[i] = 'F'
+        elif thing == BinAccumulator:
+            objArray[i] = 'A'
         else:
             # other, simple scalaRs
             objArray[i] = 'R'
@@ -272,6 +590,19 @@ def _calc_2d_median(ans, data_label, binx, biny, xarr, yarr, zarr, numx,
                                            axis=0)).abs().median(axis=0,
                                                                  skipna=True)
 
+    # numbers collected with their bin, all bins are calculated at once
+    objidx, = np.where(objArray == 'A')
+    if len(objidx) > 0:
+        for zk in zarr[objidx]:
+            median, count, dev = ans[zk].statistics()
+            medianAns[zk] = median.reshape((numy, numx))
+            countAns[zk] = count.reshape((numy, numx))
+            devAns[zk] = dev.reshape((numy, numx))
+            if returnData:
+                values = ans[zk].bin_values()
+                ans[zk] = [[values[yj * numx + xi] for xi in xarr]
+                           for yj in yarr]
+
     objidx, = np.where(objArray == 'R')
     if len(objidx) > 0:
         for zk in zarr[objidx]:
@@ -421,6 +752,9 @@ def _calc_1d_median(ans, data_label, binx, xarr, zarr, numx, numz,
     # for each data product label, find the first nonempty bin
     # and select its type
     for zk in zarr:
+        if isinstance(ans[zk], BinAccumulator):
+            dataType[zk] = BinAccumulator
+            continue
         for xi in xarr:
             if len(ans[zk][xi]) > 0:
                 dataType[zk] = type(ans[zk][xi][0]) 
@@ -434,6 +768,8 @@ def _calc_1d_median(ans, data_label, binx, xarr, zarr, numx, numz,
             objArray[i] = 'S'
          elif thing == pds.core.frame.DataFrame:
             objArray[i] = 'F'
+         elif thing == BinAccumulator:
+            objArray[i] = 'A'
          else:
              # other, simple scalaRs
             objArray[i] = 'R'
@@ -467,6 +803,14 @@ def _calc_1d_median(ans, data_label, binx, xarr, zarr, numx, numz,
                     devAns[zk][xi] = (test.subtract(medianAns[zk][xi], \
                                     axis=0)).abs().median(axis=0, skipna=True)
 
+    # numbers collected with their bin, all bins are calculated at once
+    objidx, = np.where(objArray == 'A')
+    if len(objidx) > 0:
+        for zk in zarr[objidx]:
+            medianAns[zk], countAns[zk], devAns[zk] = ans[zk].statistics()
+            if returnData:
+                ans[zk] = ans[zk].bin_values()
+
     objidx, = np.where(objArray == 'R')
     if len(objidx) > 0:
         for zk in zarr[objidx]:
@@ -19,9 +19,12 @@ object as the season of interest.
 
 import numpy as np
 
+from pysat.ssnl._binning import bin_index, bin_any
+from pysat.ssnl._checkpoint import Checkpoint
+
 
 def daily2D(inst, bin1, label1, bin2, label2, data_label, gate,
-            returnBins=False):
+            returnBins=False, checkpoint=None, checkpoint_every=10):
     """2D Daily Occurrence Probability of data_label > gate over a season.
 
     If data_label is greater than gate at least once per day,
@@ -44,6 +47,14 @@ def daily2D(inst, bin1, label1, bin2, label2, data_label, gate,
         values that data_label must achieve to be counted as an occurrence
     returnBins: Boolean
         if True, return arrays with values of bin edges, useful for pcolor
+    checkpoint: string or NoneType
+        If not None, file used to save the counts every checkpoint_every
+        days. A run with the same parameters and an existing checkpoint only
+        processes days within the bounds that have not already been
+        processed. Days without data are only revisited if their files have
+        changed since. (default=None)
+    checkpoint_every: int
+        Number of days loaded between saves of the checkpoint. (default=10)
 
     Returns
     -------
@@ -61,7 +72,9 @@ def daily2D(inst, bin1, label1, bin2, label2, data_label, gate,
     """
 
     return _occurrence2D(inst, bin1, label1, bin2, label2, data_label, gate,
-                         by_orbit=False, returnBins=returnBins)
+                         by_orbit=False, returnBins=returnBins,
+                         checkpoint=checkpoint,
+                         checkpoint_every=checkpoint_every)
 
 
 def by_orbit2D(inst, bin1, label1, bin2, label2, data_label, gate,
@@ -108,7 +121,8 @@ def by_orbit2D(inst, bin1, label1, bin2, label2, data_label, gate,
 
 
 def _occurrence2D(inst, bin1, label1, bin2, label2, data_label, gate,
-                  by_orbit=False, returnBins=False):
+                  by_orbit=False, returnBins=False, checkpoint=None,
+                  checkpoint_every=10):
     if not hasattr(data_label, '__iter__'):
         raise ValueError('Data label must be list-like group of variable ' +
                          'names.')
@@ -125,8 +139,6 @@ def _occurrence2D(inst, bin1, label1, bin2, label2, data_label, gate,
     numx = len(binx) - 1
     numy = len(biny) - 1
     numz = len(data_label)
-    arrx = np.arange(numx)
-    arry = np.arange(numy)
     arrz = np.arange(numz)
 
     # create arrays to store all values
@@ -136,27 +148,25 @@ def _occurrence2D(inst, bin1, label1, bin2, label2, data_label, gate,
         inst.load(date=inst.bounds[0][0])
         iterator = inst.orbits
     else:
-        iterator = inst
+        # restore the counts so far if resuming from a checkpoint
+        ckpt = Checkpoint(checkpoint, ['occurrence2D', binx, label1, biny,
+                                       label2, list(data_label), list(gate)],
+                          checkpoint_every)
+        if ckpt.state is not None:
+            total, hits = ckpt.state
+        ckpt.state = (total, hits)
+        iterator = ckpt.iterate([inst])
 
     for i, inst in enumerate(iterator):
         if len(inst.data) != 0:
-            xind = np.digitize(inst.data[label1], binx) - 1
-            for xi in arrx:
-                xindex, = np.where(xind == xi)
-                if len(xindex) > 0:
-                    yData = inst.data.iloc[xindex]
-                    yind = np.digitize(yData[label2], biny) - 1
-                    for yj in arry:
-                        yindex, = np.where(yind == yj)
-                        if len(yindex) > 0:
-                            # iterate over the different data_labels
-                            for zk in arrz:
-                                indlab = yData.columns.get_loc(data_label[zk])
-                                zdata = yData.iloc[yindex, indlab]
-                                if np.any(np.isfinite(zdata)):
-                                    total[zk, yj, xi] += 1.
-                                    if np.any(zdata > gate[zk]):
-                                        hits[zk, yj, xi] += 1.
+            # bin all of the data at once
+            index, good = bin_index(inst.data, [label2, label1], [biny, binx])
+            for zk in arrz:
+                zdata = np.asarray(inst.data[data_label[zk]])[good]
+                present = bin_any(index, np.isfinite(zdata), numy * numx)
+                hit = present & bin_any(index, zdata > gate[zk], numy * numx)
+                total[zk] += present.reshape((numy, numx))
+                hits[zk] += hit.reshape((numy, numx))
 
     # all of the loading and storing data is done
     # get probability
@@ -174,7 +184,8 @@ def _occurrence2D(inst, bin1, label1, bin2, label2, data_label, gate,
 
 
 def daily3D(inst, bin1, label1, bin2, label2, bin3, label3,
-            data_label, gate, returnBins=False):
+            data_label, gate, returnBins=False, checkpoint=None,
+            checkpoint_every=10):
     """3D Daily Occurrence Probability of data_label > gate over a season.
 
     If data_label is greater than gate atleast once per day,
@@ -196,6 +207,14 @@ def daily3D(inst, bin1, label1, bin2, label2, bin3, label3,
         values that data_label must achieve to be counted as an occurrence
     returnBins: Boolean
         if True, return arrays with values of bin edges, useful for pcolor
+    checkpoint: string or NoneType
+        If not None, file used to save the counts every checkpoint_every
+        days. A run with the same parameters and an existing checkpoint only
+        processes days within the bounds that have not already been
+        processed. Days without data are only revisited if their files have
+        changed since. (default=None)
+    checkpoint_every: int
+        Number of days loaded between saves of the checkpoint. (default=10)
 
     Returns
     -------
@@ -213,7 +232,8 @@ def daily3D(inst, bin1, label1, bin2, label2, bin3, label3,
 
     return _occurrence3D(inst, bin1, label1, bin2, label2, bin3, label3,
                          data_label, gate, returnBins=returnBins,
-                         by_orbit=False)
+                         by_orbit=False, checkpoint=checkpoint,
+                         checkpoint_every=checkpoint_every)
 
 
 def by_orbit3D(inst, bin1, label1, bin2, label2, bin3, label3,
@@ -260,7 +280,8 @@ def by_orbit3D(inst, bin1, label1, bin2, label2, bin3, label3,
 
 
 def _occurrence3D(inst, bin1, label1, bin2, label2, bin3, label3,
-                  data_label, gate, returnBins=False, by_orbit=False):
+                  data_label, gate, returnBins=False, by_orbit=False,
+                  checkpoint=None, checkpoint_every=10):
 
     if not hasattr(data_label, '__iter__'):
         raise ValueError('Data label must be list-like group of variable ' +
@@ -281,10 +302,6 @@ def _occurrence3D(inst, bin1, label1, bin2, label2, bin3, label3,
     numz = len(binz) - 1
     numd = len(data_label)
 
-    # create array to store all values before taking median
-    yarr = np.arange(numy)
-    xarr = np.arange(numx)
-    zarr = np.arange(numz)
     darr = np.arange(numd)
 
     total = np.zeros((numd, numz, numy, numx))
@@ -293,34 +310,28 @@ def _occurrence3D(inst, bin1, label1, bin2, label2, bin3, label3,
     if by_orbit:
         iterator = inst.orbits
     else:
-        iterator = inst
+        # restore the counts so far if resuming from a checkpoint
+        ckpt = Checkpoint(checkpoint, ['occurrence3D', binx, label1, biny,
+                                       label2, binz, label3, list(data_label),
+                                       list(gate)], checkpoint_every)
+        if ckpt.state is not None:
+            total, hits = ckpt.state
+        ckpt.state = (total, hits)
+        iterator = ckpt.iterate([inst])
     # do loop to iterate over given season
     for i, sat in enumerate(iterator):
 
         if len(sat.data) != 0:
-            xind = np.digitize(sat.data[label1], binx) - 1
-            for xi in xarr:
-                xindex, = np.where(xind == xi)
-                if len(xindex) > 0:
-                    yData = sat.data.iloc[xindex]
-                    yind = np.digitize(yData[label2], biny) - 1
-                    for yj in yarr:
-                        yindex, = np.where(yind == yj)
-                        if len(yindex) > 0:
-                            zData = yData.iloc[yindex]
-                            zind = np.digitize(zData[label3], binz) - 1
-                            for zk in zarr:
-                                zindex, = np.where(zind == zk)
-                                if len(zindex) > 0:
-                                    for di in darr:
-                                        indlab = zData.columns.get_loc(data_label[di])
-                                        ddata = zData.iloc[zindex, indlab]
-                                        idx, = np.where(np.isfinite(ddata))
-                                        if len(idx) > 0:
-                                            total[di, zk, yj, xi] += 1
-                                            idx, = np.where(ddata > gate[di])
-                                            if len(idx) > 0:
-                                                hits[di, zk, yj, xi] += 1
+            # bin all of the data at once
+            index, good = bin_index(sat.data, [label3, label2, label1],
+                                    [binz, biny, binx])
+            size = numz * numy * numx
+            for di in darr:
+                ddata = np.asarray(sat.data[data_label[di]])[good]
+                present = bin_any(index, np.isfinite(ddata), size)
+                hit = present & bin_any(index, ddata > gate[di], size)
+                total[di] += present.reshape((numz, numy, numx))
+                hits[di] += hit.reshape((numz, numy, numx))
 
     # all of the loading and storing data is done
     # prob = np.zeros((numz, numy, numx))
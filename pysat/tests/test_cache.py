@@ -0,0 +1,294 @@
+"""
+tests the pysat LoadCache and DiskCache objects and their use by Instrument
+"""
+import numpy as np
+import os
+import sys
+
+import pandas as pds
+
+import pysat
+import pysat.instruments.pysat_testing
+
+if sys.version_info[0] >= 3:
+    from importlib import reload as re_load
+else:
+    re_load = reload
+
+
+class TestBasics():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.cache = pysat.LoadCache()
+        self.data = pds.DataFrame({'a': np.arange(100.)})
+        self.meta = pysat.Meta()
+        self.meta['a'] = {'units': 'm'}
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.cache, self.data, self.meta
+
+    def test_miss_on_empty_cache(self):
+        assert self.cache.get(('key',)) is None
+        assert self.cache.misses == 1
+        assert self.cache.hits == 0
+
+    def test_hit_after_put(self):
+        self.cache.put(('key',), self.data, self.meta)
+        data, meta = self.cache.get(('key',))
+        assert np.all(data['a'] == self.data['a'])
+        assert meta['a', 'units'] == 'm'
+        assert self.cache.hits == 1
+        assert self.cache.misses == 0
+
+    def test_returned_data_is_copy(self):
+        self.cache.put(('key',), self.data, self.meta)
+        data, meta = self.cache.get(('key',))
+        data['a'] = 0.
+        data, meta = self.cache.get(('key',))
+        assert np.all(data['a'] == self.data['a'])
+
+    def test_stored_data_is_copy(self):
+        self.cache.put(('key',), self.data, self.meta)
+        self.data['a'] = 0.
+        data, meta = self.cache.get(('key',))
+        assert np.all(data['a'] == np.arange(100.))
+
+    def test_nbytes_tracking(self):
+        self.cache.put(('key',), self.data, self.meta)
+        self.cache.put(('key2',), self.data, self.meta)
+        nbytes = self.data.memory_usage(index=True, deep=True).sum()
+        assert self.cache.nbytes == 2 * nbytes
+        self.cache.pop(('key',))
+        assert self.cache.nbytes == nbytes
+        assert len(self.cache) == 1
+
+    def test_least_recently_used_evicted(self):
+        nbytes = self.data.memory_usage(index=True, deep=True).sum()
+        self.cache.max_bytes = 2 * nbytes
+        self.cache.put(('key',), self.data, self.meta)
+        self.cache.put(('key2',), self.data, self.meta)
+        # use the first entry so the second is the oldest
+        self.cache.get(('key',))
+        self.cache.put(('key3',), self.data, self.meta)
+        assert ('key',) in self.cache
+        assert ('key2',) not in self.cache
+        assert ('key3',) in self.cache
+        assert self.cache.nbytes <= self.cache.max_bytes
+
+    def test_data_larger_than_budget_not_stored(self):
+        self.cache.max_bytes = 10
+        self.cache.put(('key',), self.data, self.meta)
+        assert len(self.cache) == 0
+        assert self.cache.nbytes == 0
+
+    def test_clear(self):
+        self.cache.put(('key',), self.data, self.meta)
+        self.cache.get(('key',))
+        self.cache.clear()
+        assert len(self.cache) == 0
+        assert self.cache.nbytes == 0
+        assert self.cache.hits == 0
+
+    def test_copy_shares_cache(self):
+        import copy
+        assert copy.deepcopy(self.cache) is self.cache
+
+    def test_pickle_drops_data(self):
+        import pickle
+        self.cache.put(('key',), self.data, self.meta)
+        new_cache = pickle.loads(pickle.dumps(self.cache))
+        assert len(new_cache) == 0
+        assert new_cache.max_bytes == self.cache.max_bytes
+
+
+class TestInstrumentCache():
+    def setup(self):
+        re_load(pysat.instruments.pysat_testing)
+        """Runs before every method to create a clean testing setup."""
+        self.cache = pysat.LoadCache()
+        self.testInst = pysat.Instrument('pysat', 'testing', sat_id='100',
+                                         clean_level='clean',
+                                         update_files=True,
+                                         cache=self.cache)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst, self.cache
+
+    def test_repeat_load_uses_cache(self):
+        self.testInst.load(2009, 1)
+        self.testInst.load(2009, 2)
+        self.testInst.load(2009, 1)
+        assert self.cache.hits == 1
+        assert self.cache.misses == 2
+        assert self.testInst.date == pysat.datetime(2009, 1, 1)
+        assert self.testInst.index[0] == pysat.datetime(2009, 1, 1)
+
+    def test_cached_load_unaffected_by_custom_functions(self):
+        def custom1(inst):
+            inst['mlt'] = 0.
+
+        self.testInst.load(2009, 1)
+        mlt = self.testInst['mlt'].copy()
+        self.testInst.custom.add(custom1, 'modify')
+        self.testInst.load(2009, 1)
+        self.testInst.custom.clear()
+        self.testInst.load(2009, 1)
+        assert np.all(self.testInst['mlt'] == mlt)
+
+    def test_copy_shares_cache(self):
+        self.testInst.load(2009, 1)
+        inst_copy = self.testInst.copy()
+        assert inst_copy.cache is self.cache
+        inst_copy.load(2009, 1)
+        assert self.cache.hits == 1
+
+    def test_load_kwargs_in_key(self):
+        other = pysat.Instrument('pysat', 'testing', sat_id='100',
+                                 clean_level='clean', cache=self.cache,
+                                 sim_multi_file_right=True)
+        self.testInst.load(2009, 1)
+        other.load(2009, 1)
+        assert self.cache.hits == 0
+        assert len(self.cache) == 2
+
+
+class TestDiskCache():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        import tempfile
+        self.tempdir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tempdir, 'source.txt')
+        with open(self.fname, 'w') as fout:
+            fout.write('source file')
+        self.cache = pysat.DiskCache(path=os.path.join(self.tempdir, 'cache'))
+        self.inst = pysat.Instrument()
+        self.key = self.cache.make_key(self.inst, [self.fname])
+        index = pds.date_range(pysat.datetime(2009, 1, 1), periods=100,
+                               freq='S')
+        self.data = pds.DataFrame({'a': np.arange(100.),
+                                   'b': np.arange(100)}, index=index)
+        self.data.index.name = 'Epoch'
+        self.meta = pysat.Meta()
+        self.meta['a'] = {'units': 'm'}
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        import shutil
+        shutil.rmtree(self.tempdir)
+        del self.cache, self.data, self.meta, self.inst
+
+    def test_miss_on_empty_cache(self):
+        assert self.cache.get(self.key) is None
+        assert self.cache.misses == 1
+
+    def test_columnar_round_trip(self):
+        self.cache.put(self.key, self.data, self.meta)
+        data, meta = self.cache.get(self.key)
+        assert data.equals(self.data)
+        assert data.index.name == 'Epoch'
+        assert meta['a', 'units'] == 'm'
+        assert self.cache.hits == 1
+        files = os.listdir(self.cache._entry_path(self.key))
+        assert 'data.pkl' not in files
+
+    def test_object_data_round_trip(self):
+        self.data['c'] = 'string'
+        self.cache.put(self.key, self.data, self.meta)
+        data, meta = self.cache.get(self.key)
+        assert data.equals(self.data)
+        files = os.listdir(self.cache._entry_path(self.key))
+        assert 'data.pkl' in files
+
+    def test_loaded_data_is_writeable(self):
+        self.cache.put(self.key, self.data, self.meta)
+        data, meta = self.cache.get(self.key)
+        data['a'] = 0.
+        data, meta = self.cache.get(self.key)
+        assert np.all(data['a'] == self.data['a'])
+
+    def test_changed_source_file_invalidates(self):
+        self.cache.put(self.key, self.data, self.meta)
+        with open(self.fname, 'a') as fout:
+            fout.write(' that changed')
+        assert self.key not in self.cache
+        assert self.cache.get(self.key) is None
+
+    def test_missing_source_file_not_stored(self):
+        key = self.cache.make_key(self.inst, [self.fname + '.nofile'])
+        self.cache.put(key, self.data, self.meta)
+        assert not os.path.isdir(self.cache._entry_path(key))
+
+    def test_new_session_uses_stored_data(self):
+        self.cache.put(self.key, self.data, self.meta)
+        cache = pysat.DiskCache(path=self.cache.path)
+        data, meta = cache.get(self.key)
+        assert data.equals(self.data)
+
+    def test_copy_shares_cache(self):
+        inst = pysat.Instrument(cache=self.cache)
+        inst_copy = inst.copy()
+        assert inst_copy.cache is self.cache
+
+    def test_clear(self):
+        self.cache.put(self.key, self.data, self.meta)
+        self.cache.clear()
+        assert self.key not in self.cache
+
+
+class TestInstrumentDiskCache():
+    def setup(self):
+        re_load(pysat.instruments.pysat_testing)
+        """Runs before every method to create a clean testing setup."""
+        import tempfile
+        self.tempdir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.tempdir, 'cache')
+        self.testInst = self.new_session()
+        # the testing instrument only needs its source files to exist
+        self.fname = os.path.join(self.testInst.files.data_path,
+                                  '2009-01-01.nofile')
+        with open(self.fname, 'w') as fout:
+            fout.write('source file')
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        import shutil
+        shutil.rmtree(self.tempdir)
+        del self.testInst, self.tempdir
+
+    def new_session(self):
+        """Return an Instrument with a new DiskCache on the same path"""
+        return pysat.Instrument('pysat', 'testing', sat_id='100',
+                                clean_level='clean', update_files=True,
+                                directory_format=self.tempdir,
+                                cache=pysat.DiskCache(path=self.cache_path))
+
+    def test_new_session_uses_stored_data(self):
+        self.testInst.load(2009, 1)
+        assert self.testInst.cache.misses == 1
+        inst = self.new_session()
+        inst.load(2009, 1)
+        assert inst.cache.hits == 1
+        assert inst.cache.misses == 0
+        assert inst.data.equals(self.testInst.data)
+
+    def test_changed_source_file_invalidates(self):
+        self.testInst.load(2009, 1)
+        with open(self.fname, 'a') as fout:
+            fout.write(' that changed')
+        inst = self.new_session()
+        inst.load(2009, 1)
+        assert inst.cache.hits == 0
+        assert inst.cache.misses == 1
+        inst = self.new_session()
+        inst.load(2009, 1)
+        assert inst.cache.hits == 1
+
+    def test_copy_shares_counters(self):
+        self.testInst.load(2009, 1)
+        inst_copy = self.testInst.copy()
+        inst_copy.load(2009, 1)
+        assert inst_copy.cache is self.testInst.cache
+        assert self.testInst.cache.hits == 1
+        assert self.testInst.cache.misses == 1
@@ -318,6 +318,175 @@ class TestBasicsXarray(TestBasics):
         del self.testInst
 
 
+class TestBasicsNoCopy(TestBasics):
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing', tag='10',
+                                         clean_level='clean')
+        self.testInst.custom.copy = False
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+
+    @raises(ValueError)
+    def test_single_adding_custom_function_that_modifies_passed_data(self):
+        """Read-only Instrument supplied to add functions can't be changed"""
+        def custom1(inst):
+            inst['mlt'] = 0.
+            return ('doubleMLT', 2.0 * inst.data.mlt.values)
+
+        self.add(custom1, 'add')
+        self.testInst.load(2009, 1)
+
+    def test_adding_custom_function_that_declares_mutation(self):
+        """Functions declaring they mutate their input are supplied a copy"""
+        def custom1(inst):
+            inst.data['doubleMLT'] = 2.0 * inst.data.mlt
+            inst['mlt'] = 0.
+            return inst.data.doubleMLT
+        custom1.mutates_input = True
+
+        self.add(custom1, 'add')
+        self.testInst.load(2009, 1)
+        assert (self.testInst.data['doubleMLT'] == 2.0 *
+                self.testInst['mlt']).all()
+
+    def test_add_function_adding_column_to_view(self):
+        """Columns may be added to data of the read-only Instrument"""
+        def custom1(inst):
+            inst.data['tripleMLT'] = 3.0 * inst.data.mlt
+            return ('doubleMLT', 2.0 * inst.data.mlt.values)
+
+        self.add(custom1, 'add')
+        self.testInst.load(2009, 1)
+        assert 'tripleMLT' not in self.testInst.data
+        assert (self.testInst['doubleMLT'] == 2.0 * self.testInst['mlt']).all()
+
+    def test_add_function_reading_column_added_to_view(self):
+        """Columns added to data of the read-only Instrument may be read"""
+        def custom1(inst):
+            inst.data['tmp'] = inst['mlt'] * 2.
+            assert 'tmp' in inst.variables
+            assert len(inst.index) == len(inst['tmp'])
+            return ('doubleMLT', inst['tmp'])
+
+        self.add(custom1, 'add')
+        self.testInst.load(2009, 1)
+        assert 'tmp' not in self.testInst.variables
+        assert (self.testInst['doubleMLT'] == 2.0 * self.testInst['mlt']).all()
+
+    def test_add_function_reading_lazy_variable_from_view(self):
+        """Lazy variables are available after data is added to the view"""
+        def double_mlt(inst):
+            inst['lazyMLT'] = 2.0 * inst['mlt']
+
+        def custom1(inst):
+            inst.data['tmp'] = inst['mlt'] * 2.
+            return ('doubleMLT', inst['lazyMLT'] + 0. * inst['tmp'])
+
+        self.testInst.custom.add_lazy(double_mlt, 'lazyMLT', 'mlt', 'modify')
+        self.add(custom1, 'add')
+        self.testInst.load(2009, 1)
+        assert (self.testInst['doubleMLT'] == 2.0 * self.testInst['mlt']).all()
+
+    def test_add_function_changing_view_meta(self):
+        """Metadata of the read-only Instrument is a copy"""
+        def custom1(inst):
+            inst.meta['mlt'] = {'units': 'changed'}
+            return ('doubleMLT', 2.0 * inst['mlt'])
+
+        self.add(custom1, 'add')
+        self.testInst.load(2009, 1)
+        assert self.testInst.meta['mlt', 'units'] != 'changed'
+
+
+class TestBasicsNoCopyXarray(TestBasicsNoCopy):
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing_xarray', tag='10',
+                                         clean_level='clean')
+        self.testInst.custom.copy = False
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+
+
+class TestLazyFunctions():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing', tag='10',
+                                         clean_level='clean')
+        self.calls = []
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst, self.calls
+
+    def double_mlt(self, inst):
+        self.calls.append('double')
+        inst['doubleMLT'] = 2.0 * inst['mlt']
+
+    def quad_mlt(self, inst):
+        self.calls.append('quad')
+        return ('quadMLT', 2.0 * inst['doubleMLT'].values)
+
+    def test_lazy_function_not_applied_on_load(self):
+        self.testInst.custom.add_lazy(self.double_mlt, 'doubleMLT', 'mlt',
+                                      'modify')
+        self.testInst.load(2009, 1)
+        assert self.calls == []
+        assert 'doubleMLT' not in self.testInst.data
+
+    def test_lazy_functions_applied_in_dependency_order(self):
+        self.testInst.custom.add_lazy(self.quad_mlt, 'quadMLT', 'doubleMLT')
+        self.testInst.custom.add_lazy(self.double_mlt, 'doubleMLT', 'mlt',
+                                      'modify')
+        self.testInst.load(2009, 1)
+        assert (self.testInst['quadMLT'] == 4.0 * self.testInst['mlt']).all()
+        assert self.calls == ['double', 'quad']
+
+    def test_lazy_function_applied_once(self):
+        self.testInst.custom.add_lazy(self.double_mlt, 'doubleMLT', 'mlt',
+                                      'modify')
+        self.testInst.load(2009, 1)
+        self.testInst['doubleMLT']
+        self.testInst['doubleMLT']
+        assert self.calls == ['double']
+
+    def test_lazy_function_reapplied_after_load(self):
+        self.testInst.custom.add_lazy(self.double_mlt, 'doubleMLT', 'mlt',
+                                      'modify')
+        self.testInst.load(2009, 1)
+        self.testInst['doubleMLT']
+        self.testInst.load(2009, 2)
+        self.testInst['doubleMLT']
+        assert self.calls == ['double', 'double']
+
+    def test_evaluate_lazy_functions(self):
+        self.testInst.custom.add_lazy(self.quad_mlt, 'quadMLT', 'doubleMLT')
+        self.testInst.custom.add_lazy(self.double_mlt, 'doubleMLT', 'mlt',
+                                      'modify')
+        self.testInst.load(2009, 1)
+        self.testInst.custom.evaluate(self.testInst)
+        assert 'quadMLT' in self.testInst.data
+        assert 'doubleMLT' in self.testInst.data
+
+    @raises(ValueError)
+    def test_lazy_pass_function(self):
+        self.testInst.custom.add_lazy(self.double_mlt, 'doubleMLT', 'mlt',
+                                      'pass')
+
+
+class TestLazyFunctionsXarray(TestLazyFunctions):
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing_xarray', tag='10',
+                                         clean_level='clean')
+        self.calls = []
+
+
 class ConstellationTestBasics(TestBasics):
     def setup(self):
         """Runs before every method to create a clean testing setup"""
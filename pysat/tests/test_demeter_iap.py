@@ -0,0 +1,99 @@
+import datetime as dt
+import os
+import shutil
+import struct
+import tempfile
+
+import pysat
+from pysat.instruments import demeter_iap
+
+
+def write_survey_file(fname, start, nrecords):
+    """Write a DEMETER IAP survey file with a record every four seconds"""
+
+    with open(fname, 'wb') as fout:
+        for i in range(nrecords):
+            time = start + dt.timedelta(seconds=4 * i, milliseconds=250)
+            days = (time - dt.datetime(1950, 1, 1)).days
+            msec = (time.hour * 3600 + time.minute * 60 + time.second) \
+                * 1000 + time.microsecond // 1000
+
+            # General header, location, attitude, and experiment blocks
+            fout.write(struct.pack('!B', 3) + struct.pack('!I', days)[1:])
+            fout.write(struct.pack('!I9H', msec, time.year, time.month,
+                                   time.day, time.hour, time.minute,
+                                   time.second, time.microsecond // 1000,
+                                   1234, i % 2))
+            fout.write(b'STATION1' + struct.pack('!4B', 1, 2, 3, 4))
+            fout.write(struct.pack('!22f', *[i + k / 8. for k in range(22)]))
+            fout.write(struct.pack('!2B', 5, 6))
+            fout.write(struct.pack('!18fH2B', *([-k / 4. for k in range(18)]
+                                                + [7, 8, 9])))
+            fout.write(b'IAP_SURVEY' + struct.pack('!32B', *range(32)))
+            fout.write(struct.pack('!f', 2.0))
+            fout.write(b'cm-3  K     m/s   V     deg   ')
+            fout.write(struct.pack('!8f', 1000.5 + i, 2., 3., 4., 5., 6., 7.,
+                                   8.))
+
+
+class TestDEMETERIAPLoad():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.data_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.data_dir, 'survey.DAT')
+        self.start = dt.datetime(2009, 12, 31, 23, 50)
+        write_survey_file(self.fname, self.start, 600)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        shutil.rmtree(self.data_dir)
+        del self.fname, self.start
+
+    def test_load(self):
+        """Test that every block of the records is decoded"""
+        data, meta = demeter_iap.load([self.fname])
+
+        assert data.shape == (600, 88)
+        assert data.index[1] == pysat.datetime(2009, 12, 31, 23, 50, 4,
+                                               250000)
+        assert (data.index == data['UT']).all()
+        assert data['epoch_time'][0] == 21914
+        assert data['time_of_day'][1] == 85804250
+        assert data['orbit_number'][0] == 1234
+        assert not data['orbit_type'][0]
+        assert data['orbit_type'][1]
+        assert data['glat'][1] == 1.0
+        assert data['Zs'][1] == 3.625
+        assert data['geo2lgm_33'][1] == -4.25
+        assert data['attitude_flag'][1] == 7
+        assert data['status_flag_05'][1] == 5
+        assert data['time_resolution'][1] == 2.0
+        assert data['H+_density'][1] == 1001.5
+        assert data['satellite_potential'][1] == 8.0
+
+        assert meta['H+_density'].units == 'cm-3'
+        assert meta['iv_Oz'].units == 'm/s'
+        assert meta['iv_negOz_angle'].units == 'deg'
+        assert meta.info['telemetry station'] == 'STATION1'
+        assert meta.info['calibration file subversion'] == 4
+        assert meta.info['data type'] == 'IAP_SURVEY'
+
+    def test_load_window(self):
+        """Test that only records within the time window are loaded"""
+        data, meta = demeter_iap.load([self.fname])
+        start = dt.datetime(2010, 1, 1)
+        stop = dt.datetime(2010, 1, 1, 0, 10)
+        wdata, wmeta = demeter_iap.load([self.fname], start=start, stop=stop)
+
+        assert len(wdata) == 150
+        assert wdata.equals(data[(data.index >= start)
+                                 & (data.index < stop)])
+
+    def test_load_window_without_records(self):
+        """Test that a time window without records is empty"""
+        data, meta = demeter_iap.load([self.fname],
+                                      start=dt.datetime(2011, 1, 1),
+                                      stop=dt.datetime(2011, 1, 2))
+
+        assert data.shape == (0, 88)
+        assert meta['H+_density'].units == 'cm-3'
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 # Test some of the basic _core functions
+import gc
 import numpy as np
 import sys
+import threading
+import time
 
-from nose.tools import raises
+from nose.tools import assert_raises, raises
 import pandas as pds
 
 import pysat
@@ -48,6 +51,96 @@ class TestBasics():
         assert (test_date == pds.datetime(2009, 1, 1)) & \
             (test_date == self.testInst.date)
 
+    def test_load_variables(self):
+        """Test that only the requested variables are loaded"""
+        inst = pysat.Instrument(self.testInst.platform, self.testInst.name,
+                                sat_id='10', clean_level='clean',
+                                variables=['mlt', 'slt'])
+        inst.load(2009, 1)
+        assert 'mlt' in inst.variables
+        assert 'slt' in inst.variables
+        assert 'longitude' not in inst.variables
+        assert 'mlt' in inst.meta
+        assert 'longitude' not in inst.meta
+
+    def test_load_window(self):
+        """Test loading a time window within a day"""
+        start = pysat.datetime(2009, 1, 1, 0, 0, 3)
+        stop = pysat.datetime(2009, 1, 1, 0, 0, 7)
+        self.testInst.load(start=start, stop=stop)
+        assert len(self.testInst.index) == 4
+        assert self.testInst.index[0] == start
+        assert self.testInst.index[-1] < stop
+        assert self.testInst.date == pysat.datetime(2009, 1, 1)
+
+    def test_load_window_across_days(self):
+        """Test loading a time window spanning midnight"""
+        start = pysat.datetime(2009, 1, 1, 23, 0)
+        stop = pysat.datetime(2009, 1, 2, 0, 0, 5)
+        self.testInst.load(start=start, stop=stop)
+        assert len(self.testInst.index) == 5
+        assert self.testInst.index[0] == pysat.datetime(2009, 1, 2)
+
+    def test_load_window_with_pad(self):
+        """Test that padding is removed from a loaded time window"""
+        self.testInst.pad = pds.DateOffset(seconds=2)
+        start = pysat.datetime(2009, 1, 1, 0, 0, 3)
+        stop = pysat.datetime(2009, 1, 1, 0, 0, 7)
+        self.testInst.load(start=start, stop=stop, verifyPad=True)
+        assert self.testInst.index[0] == pysat.datetime(2009, 1, 1, 0, 0, 1)
+        self.testInst.load(start=start, stop=stop)
+        assert self.testInst.index[0] == start
+        assert len(self.testInst.index) == 4
+
+    def test_load_window_multiple_days(self):
+        """Test loading a time window spanning several days"""
+        calls = []
+
+        def count_calls(inst):
+            calls.append(len(inst.index))
+
+        self.testInst.custom.add(count_calls, 'modify')
+        self.testInst.load(start=pysat.datetime(2009, 1, 1),
+                           stop=pysat.datetime(2009, 1, 4))
+        dates = [pysat.datetime(time.year, time.month, time.day)
+                 for time in self.testInst.index]
+        assert len(self.testInst.index) == 30
+        assert sorted(set(dates)) == [pysat.datetime(2009, 1, 1),
+                                      pysat.datetime(2009, 1, 2),
+                                      pysat.datetime(2009, 1, 3)]
+        assert calls == [30]
+
+    def test_load_window_multi_day_load(self):
+        """Test loading several days of files with one load routine call"""
+        load_rtn = self.testInst._load_rtn
+        calls = []
+
+        def multi_day_load(fnames, **kwargs):
+            calls.append(fnames)
+            output = [load_rtn([fname], **kwargs) for fname in fnames]
+            return (self.testInst.concat_data([out[0] for out in output]),
+                    output[0][1])
+
+        self.testInst._load_rtn = multi_day_load
+        self.testInst.multi_day_load = True
+        self.testInst.load(start=pysat.datetime(2009, 1, 1, 0, 0, 5),
+                           stop=pysat.datetime(2009, 1, 4))
+        assert len(calls) == 1
+        assert len(calls[0]) == 3
+        assert len(self.testInst.index) == 25
+        assert self.testInst.index[0] == pysat.datetime(2009, 1, 1, 0, 0, 5)
+
+    @raises(ValueError)
+    def test_load_window_without_stop(self):
+        """Test that a time window requires a stop"""
+        self.testInst.load(start=pysat.datetime(2009, 1, 1))
+
+    @raises(ValueError)
+    def test_load_window_reversed(self):
+        """Test that a time window must end after it starts"""
+        self.testInst.load(start=pysat.datetime(2009, 1, 2),
+                           stop=pysat.datetime(2009, 1, 1))
+
     def test_basic_instrument_load_by_date(self):
         date = pysat.datetime(2009,1,1)
         self.testInst.load(date=date)
@@ -1163,3 +1256,149 @@ class TestMultiFileLeftDataPaddingBasicsXarray(TestDataPadding):
     def teardown(self):
         """Runs after every method to clean up previous testing."""
         del self.testInst
+
+
+#------------------------------------------------------------------------------
+#
+# Repeat tests above with data loaded in the background
+#
+#------------------------------------------------------------------------------
+
+class TestBasicsPrefetch(TestBasics):
+    def setup(self):
+        re_load(pysat.instruments.pysat_testing)
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing', sat_id='10',
+                                         clean_level='clean',
+                                         update_files=True,
+                                         prefetch=2)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+
+
+class TestDataPaddingPrefetch(TestDataPadding):
+    def setup(self):
+        re_load(pysat.instruments.pysat_testing)
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean',
+                                         pad={'minutes': 5},
+                                         update_files=True,
+                                         prefetch=2)
+
+
+class TestDataPaddingbyFilePrefetch(TestDataPaddingbyFile):
+    def setup(self):
+        re_load(pysat.instruments.pysat_testing)
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean',
+                                         pad={'minutes': 5},
+                                         update_files=True,
+                                         prefetch=2)
+        self.testInst.bounds = ('2008-01-01.nofile', '2010-12-31.nofile')
+
+        self.rawInst = pysat.Instrument('pysat', 'testing',
+                                        clean_level='clean',
+                                        update_files=True)
+        self.rawInst.bounds = self.testInst.bounds
+
+
+class TestPrefetch():
+    def setup(self):
+        re_load(pysat.instruments.pysat_testing)
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing', sat_id='100',
+                                         clean_level='clean',
+                                         pad={'minutes': 5},
+                                         update_files=True,
+                                         prefetch=3)
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 10))
+        self.rawInst = pysat.Instrument('pysat', 'testing', sat_id='100',
+                                        clean_level='clean',
+                                        pad={'minutes': 5},
+                                        update_files=True)
+        self.rawInst.bounds = self.testInst.bounds
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+        del self.rawInst
+
+    def test_prefetch_queue_filled_after_load(self):
+        self.testInst.load(date=pysat.datetime(2008, 1, 1))
+        # the three upcoming days and the day after each are needed, but the
+        # next day is already within the loaded window and the others
+        # overlap, leaving 2008-01-03 through 2008-01-05 to be loaded
+        assert len(self.testInst._prefetch_queue) == 3
+
+    def count_threads(self):
+        """Return the thread count once unreferenced instruments are freed"""
+        gc.collect()
+        time.sleep(0.1)
+        return threading.active_count()
+
+    def wait_for_threads(self, num_threads):
+        """Wait for background threads to exit, returning the thread count"""
+        for i in range(100):
+            if threading.active_count() <= num_threads:
+                break
+            time.sleep(0.05)
+        return threading.active_count()
+
+    def test_prefetch_threads_released_after_iteration(self):
+        """Test that background load threads exit once iteration ends"""
+        num_threads = self.count_threads()
+        for inst in self.testInst:
+            assert self.testInst._prefetch_pool is not None
+        assert self.testInst._prefetch_pool is None
+        assert self.testInst._prefetch_queue == {}
+        assert self.wait_for_threads(num_threads) <= num_threads
+
+    def test_prefetch_threads_released_after_next(self):
+        """Test that background load threads exit at the end of the bounds"""
+        num_threads = self.count_threads()
+        self.testInst.load(date=pysat.datetime(2008, 1, 10))
+        assert_raises(StopIteration, self.testInst.next)
+        assert self.testInst._prefetch_pool is None
+        assert self.testInst._prefetch_queue == {}
+        assert self.wait_for_threads(num_threads) <= num_threads
+
+    def test_prefetch_threads_released_with_instrument(self):
+        """Test that background load threads exit once instruments are freed"""
+        num_threads = self.count_threads()
+        for i in range(5):
+            inst = pysat.Instrument('pysat', 'testing', sat_id='100',
+                                    clean_level='clean', update_files=True,
+                                    prefetch=2)
+            inst.bounds = self.testInst.bounds
+            inst.load(date=pysat.datetime(2008, 1, 1))
+            del inst
+            gc.collect()
+        assert self.wait_for_threads(num_threads) <= num_threads
+
+    def test_prefetch_iteration_matches_serial_load(self):
+        for inst, raw in zip(self.testInst, self.rawInst):
+            assert inst.date == raw.date
+            assert np.all(inst.index == raw.index)
+            assert np.all(inst['mlt'] == raw['mlt'])
+
+    def test_prefetch_stale_loads_dropped(self):
+        self.testInst.load(date=pysat.datetime(2008, 1, 1))
+        self.testInst.load(date=pysat.datetime(2008, 1, 8))
+        dates = [pysat.datetime(2008, 1, 10), pysat.datetime(2008, 1, 11)]
+        keys = [tuple([self.testInst.files.data_path + fname for fname in
+                       self.testInst.files[date:date +
+                                           pds.DateOffset(days=1)]])
+                for date in dates]
+        assert sorted(self.testInst._prefetch_queue.keys()) == sorted(keys)
+
+    def test_prefetch_copy(self):
+        self.testInst.load(date=pysat.datetime(2008, 1, 1))
+        inst_copy = self.testInst.copy()
+        assert inst_copy._prefetch_queue == {}
+        assert inst_copy._prefetch_pool is None
+        assert np.all(inst_copy.index == self.testInst.index)
@@ -0,0 +1,64 @@
+"""
+tests the pysat instrument methods shared by many instruments
+"""
+import os
+import shutil
+import tempfile
+
+from nose.tools import raises
+
+from pysat.instruments.methods import general
+
+
+def read_file(fname, offset=0):
+    """Return the integer stored in a file, plus offset."""
+    with open(fname, 'r') as fin:
+        return int(fin.read()) + offset
+
+
+class TestMapFiles():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.data_dir = tempfile.mkdtemp()
+        self.fnames = []
+        for i in range(25):
+            fname = os.path.join(self.data_dir, 'file_{:02d}.txt'.format(i))
+            with open(fname, 'w') as fout:
+                fout.write(str(i))
+            self.fnames.append(fname)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        shutil.rmtree(self.data_dir)
+        del self.fnames
+
+    def test_map_files_serial(self):
+        """Test that files are read in order by a single worker"""
+        output = general.map_files(read_file, self.fnames)
+        assert output == list(range(25))
+
+    def test_map_files_processes(self):
+        """Test that files read by a process pool are returned in order"""
+        output = general.map_files(read_file, self.fnames, workers=3)
+        assert output == list(range(25))
+
+    def test_map_files_threads(self):
+        """Test that files read by a thread pool are returned in order"""
+        output = general.map_files(read_file, self.fnames, workers=3,
+                                   use_threads=True)
+        assert output == list(range(25))
+
+    def test_map_files_keywords(self):
+        """Test that keywords are passed to the file reader"""
+        output = general.map_files(read_file, self.fnames, workers=2,
+                                   offset=10)
+        assert output == list(range(10, 35))
+
+    def test_map_files_no_files(self):
+        """Test that no files gives an empty list"""
+        assert general.map_files(read_file, [], workers=3) == []
+
+    @raises(ValueError)
+    def test_map_files_no_workers(self):
+        """Test that at least one worker is required"""
+        general.map_files(read_file, self.fnames, workers=0)
@@ -1,7 +1,10 @@
 from dateutil.relativedelta import relativedelta as relativedelta
 from nose.tools import raises
 import numpy as np
+import os
 import pandas as pds
+import shutil
+import tempfile
 
 import pysat
 
@@ -471,6 +474,38 @@ class TestGeneralOrbitsMLTxarray(TestGeneralOrbitsMLT):
         del self.testInst
 
 
+class TestGeneralOrbitsMLTNoCopy(TestGeneralOrbitsMLT):
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        info = {'index': 'mlt', 'copy': False}
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean',
+                                         orbit_info=info, update_files=True)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+
+    def test_orbit_data_not_copied(self):
+        self.testInst.load(2009, 1)
+        day_data = self.testInst.data
+        self.testInst.orbits._calcOrbits()
+        assert self.testInst.orbits._fullDayData is day_data
+
+
+class TestGeneralOrbitsMLTNoCopyXarray(TestGeneralOrbitsMLTNoCopy):
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        info = {'index': 'mlt', 'copy': False}
+        self.testInst = pysat.Instrument('pysat', 'testing_xarray',
+                                         clean_level='clean',
+                                         orbit_info=info, update_files=True)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+
+
 class TestGeneralOrbitsLong(TestGeneralOrbitsMLT):
 
     def setup(self):
@@ -751,3 +786,180 @@ class TestOrbitsGappyOrbitLatDataXarray(TestGeneralOrbitsMLT):
     def teardown(self):
         """Runs after every method to clean up previous testing."""
         del self.testInst
+
+
+class TestOrbitBreaks():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        info = {'index': 'mlt'}
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean',
+                                         orbit_info=info)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+
+    def set_mlt(self, changes, freq='60S'):
+        """Set a day of sawtooth local times with 97 minute orbits"""
+        mlt = (np.arange(1440) % 97) / 97. * 24.
+        for pos, val in changes:
+            mlt[pos] = val
+        index = pds.date_range(pysat.datetime(2009, 1, 1), periods=len(mlt),
+                               freq=freq)
+        self.testInst.data = pds.DataFrame({'mlt': mlt}, index=index)
+
+    def get_breaks(self):
+        """Return the orbit breaks found for the loaded data"""
+        self.testInst.orbits._reset()
+        self.testInst.orbits._detBreaks()
+        return list(self.testInst.orbits._orbit_breaks)
+
+    # breaks expected from the previous per-break search, for false alarm
+    # local time jumps within five samples of the start and end of the day
+    def test_false_alarms_near_day_edges(self):
+        regular = [291, 388, 485, 582, 679, 776, 873, 970, 1067, 1164, 1261,
+                   1358]
+        cases = [([(3, 0.), (1436, 0.)], [0, 3, 194]),
+                 ([(2, 0.), (1437, 1.)], [0, 2, 97, 194]),
+                 ([(1, 0.), (1438, 0.)], [0, 97, 194]),
+                 ([(4, 0.), (5, 20.), (1435, 0.)], [0, 4, 97, 194]),
+                 ([(0, 23.9), (1439, 0.)], [0, 1, 97, 194]),
+                 ([(7, 0.), (1430, 0.)], [0, 7, 194])]
+        for changes, breaks in cases:
+            self.set_mlt(changes)
+            assert self.get_breaks() == breaks + regular
+
+    def test_false_alarms_in_short_day(self):
+        # windows beginning before the first sample wrap around to the end
+        index = pds.date_range(pysat.datetime(2009, 1, 1), periods=10,
+                               freq='30min')
+        cases = [([10., 12., 5., 6., 7., 8., 20., 21., 22., 23.], [0, 2]),
+                 ([10., 3., 5., 9., 20., 22., 1., 2., 3., 23.], [0, 1, 6])]
+        for mlt, breaks in cases:
+            self.testInst.data = pds.DataFrame({'mlt': mlt}, index=index)
+            assert self.get_breaks() == breaks
+
+    def test_orbit_number_breaks_with_nan(self):
+        info = {'index': 'orbit_num', 'kind': 'orbit'}
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean',
+                                         orbit_info=info)
+        index = pds.date_range(pysat.datetime(2009, 1, 1), periods=8,
+                               freq='30min')
+        self.testInst.data = pds.DataFrame({'orbit_num': [np.nan, 1., 1.,
+                                                          np.nan, 2., 2.,
+                                                          np.nan, 3.]},
+                                           index=index)
+        assert self.get_breaks() == [0, 1, 4, 7]
+        assert self.testInst.orbits.num == 4
+
+
+class TestOrbitTable():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        info = {'index': 'mlt'}
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean',
+                                         orbit_info=info, update_files=True)
+        self.files = self.testInst.files.files
+        self.tempdir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tempdir, 'orbit_table.pkl')
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        shutil.rmtree(self.tempdir)
+        del self.testInst
+
+    def test_orbits_are_ordered(self):
+        self.testInst.files.files = self.files.iloc[:3]
+        table = pysat.OrbitTable(self.testInst, fname=self.fname)
+        assert len(table) > 0
+        assert np.all(table.data['start'] <= table.data['stop'])
+        assert np.all(table.data['start'].values[1:] >
+                      table.data['stop'].values[:-1])
+
+    def test_orbit_spanning_files(self):
+        self.testInst.files.files = self.files.iloc[:3]
+        table = pysat.OrbitTable(self.testInst, fname=self.fname)
+        num_files = np.array([len(fnames) for fnames in table.data['files']])
+        assert np.any(num_files == 2)
+
+    def test_table_stored(self):
+        self.testInst.files.files = self.files.iloc[:2]
+        table = pysat.OrbitTable(self.testInst, fname=self.fname)
+        stored = pysat.OrbitTable(self.testInst, fname=self.fname,
+                                  update=False)
+        assert stored.data.equals(table.data)
+
+    def test_incremental_update(self):
+        self.testInst.files.files = self.files.iloc[:4]
+        table = pysat.OrbitTable(self.testInst,
+                                 fname=os.path.join(self.tempdir, 'full.pkl'))
+        self.testInst.files.files = self.files.iloc[:2]
+        partial = pysat.OrbitTable(self.testInst, fname=self.fname)
+        self.testInst.files.files = self.files.iloc[:4]
+        partial.update()
+        assert partial.data.equals(table.data)
+
+    def test_load_orbit_number(self):
+        self.testInst.files.files = self.files.iloc[:3]
+        self.testInst.orbits.table = pysat.OrbitTable(self.testInst,
+                                                      fname=self.fname)
+        start, stop, fnames = self.testInst.orbits.table.data.iloc[10]
+        self.testInst.orbits.load(orbit_number=10)
+        assert self.testInst.index[0] == start
+        assert self.testInst.index[-1] == stop
+
+    def test_next_after_load_orbit_number(self):
+        self.testInst.files.files = self.files.iloc[:3]
+        table = pysat.OrbitTable(self.testInst, fname=self.fname)
+        self.testInst.orbits.table = table
+        self.testInst.orbits.load(orbit_number=10)
+        self.testInst.orbits.next()
+        start, stop, fnames = table.data.iloc[11]
+        assert self.testInst.index[0] == start
+        assert self.testInst.index[-1] == stop
+        self.testInst.orbits.prev()
+        self.testInst.orbits.prev()
+        start, stop, fnames = table.data.iloc[9]
+        assert self.testInst.index[0] == start
+        assert self.testInst.index[-1] == stop
+
+    def test_orbit_state_reset_after_load_orbit_number(self):
+        self.testInst.files.files = self.files.iloc[:3]
+        self.testInst.orbits.table = pysat.OrbitTable(self.testInst,
+                                                      fname=self.fname)
+        self.testInst.orbits.load(orbit_number=10)
+        assert self.testInst.orbits.num == 0
+        assert self.testInst.orbits.current is None
+        # loading a day returns to orbits of the day
+        self.testInst.load(date=self.files.index[0])
+        assert self.testInst.orbits._table_orbit is None
+
+    @raises(StopIteration)
+    def test_next_past_table(self):
+        self.testInst.files.files = self.files.iloc[:1]
+        self.testInst.orbits.table = pysat.OrbitTable(self.testInst,
+                                                      fname=self.fname)
+        self.testInst.orbits.load(orbit_number=-1)
+        self.testInst.orbits.next()
+
+    @raises(StopIteration)
+    def test_prev_before_table(self):
+        self.testInst.files.files = self.files.iloc[:1]
+        self.testInst.orbits.table = pysat.OrbitTable(self.testInst,
+                                                      fname=self.fname)
+        self.testInst.orbits.load(orbit_number=0)
+        self.testInst.orbits.prev()
+
+    @raises(ValueError)
+    def test_load_orbit_number_without_table(self):
+        self.testInst.orbits.load(orbit_number=10)
+
+    @raises(ValueError)
+    def test_load_orbit_number_past_table(self):
+        self.testInst.files.files = self.files.iloc[:1]
+        self.testInst.orbits.table = pysat.OrbitTable(self.testInst,
+                                                      fname=self.fname)
+        self.testInst.orbits.load(orbit_number=100)
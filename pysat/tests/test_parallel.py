@@ -0,0 +1,109 @@
+"""
+tests the pysat parallel season processing
+"""
+import numpy as np
+import sys
+
+import pandas as pds
+
+from nose.tools import raises
+
+import pysat
+import pysat.instruments.pysat_testing
+from pysat import parallel
+
+if sys.version_info[0] >= 3:
+    from importlib import reload as re_load
+else:
+    re_load = reload
+
+
+def day_sum(inst, label='dummy1'):
+    """Return the sum and number of points of label for the loaded data."""
+    return np.array([inst[label].sum(), inst[label].count()])
+
+
+def day_date(inst):
+    """Return the date of the loaded data."""
+    return inst.date
+
+
+def add(first, second):
+    """Add two partial results."""
+    return first + second
+
+
+def add_one(inst):
+    """Custom function used to check custom functions are applied."""
+    return ('dummy1_plus', inst['dummy1'] + 1.)
+
+
+class TestBasics():
+    def setup(self):
+        re_load(pysat.instruments.pysat_testing)
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing', sat_id='100',
+                                         clean_level='clean')
+        self.start = pysat.datetime(2008, 1, 1)
+        self.stop = pysat.datetime(2008, 1, 10)
+        self.testInst.bounds = (self.start, self.stop)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+
+    def serial_sum(self, label='dummy1'):
+        """Calculate the sum and count over the season without parallel."""
+        total = np.zeros(2)
+        for inst in self.testInst:
+            total += day_sum(inst, label=label)
+        return total
+
+    def test_map_season_single_worker(self):
+        ans = parallel.map_season(self.testInst, day_sum, add, workers=1)
+        assert np.all(ans == self.serial_sum())
+
+    def test_map_season_multiple_workers(self):
+        ans = parallel.map_season(self.testInst, day_sum, add, workers=2)
+        assert np.all(ans == self.serial_sum())
+
+    def test_map_season_chunk_size(self):
+        ans = parallel.map_season(self.testInst, day_sum, add, workers=2,
+                                  chunk_size=3)
+        assert np.all(ans == self.serial_sum())
+
+    def test_map_season_no_reducer_time_order(self):
+        ans = parallel.map_season(self.testInst, day_date, workers=2,
+                                  chunk_size=2)
+        assert ans == list(self.testInst._iter_list)
+
+    def test_map_season_kwargs_passed(self):
+        ans = parallel.map_season(self.testInst, day_sum, add, workers=2,
+                                  label='dummy2')
+        assert np.all(ans == self.serial_sum(label='dummy2'))
+
+    def test_map_season_custom_functions_applied(self):
+        self.testInst.custom.add(add_one, 'add')
+        ans = parallel.map_season(self.testInst, day_sum, add, workers=2,
+                                  label='dummy1_plus')
+        assert np.all(ans == self.serial_sum(label='dummy1_plus'))
+
+    def test_map_season_with_pad(self):
+        self.testInst.pad = pds.DateOffset(minutes=5)
+        ans = parallel.map_season(self.testInst, day_sum, add, workers=2)
+        assert np.all(ans == self.serial_sum())
+
+    def test_map_season_by_file(self):
+        self.testInst.bounds = ('2008-01-01.nofile', '2008-01-05.nofile')
+        ans = parallel.map_season(self.testInst, day_sum, add, workers=2)
+        assert np.all(ans == self.serial_sum())
+
+    def test_map_season_leaves_instrument_unchanged(self):
+        self.testInst.load(date=self.start)
+        parallel.map_season(self.testInst, day_sum, add, workers=2)
+        assert self.testInst.date == self.start
+        assert self.testInst.bounds == ([self.start], [self.stop])
+
+    @raises(ValueError)
+    def test_map_season_bad_workers(self):
+        parallel.map_season(self.testInst, day_sum, add, workers=0)
@@ -0,0 +1,219 @@
+import numpy as np
+import os
+import shutil
+import tempfile
+
+from nose.tools import raises
+import pandas as pds
+import xarray as xr
+
+import pysat
+from pysat.instruments import pysat_sgp4
+
+
+def run_sum(point):
+    """Model of a location, with the process that ran it"""
+    time, lat, lon, alt = point
+    return {'sum': time.second + lat + lon + alt, 'pid': os.getpid()}
+
+
+class TestSGP4Load():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.fnames = ['2018-01-01.nofile']
+        self.line1 = ('1 25544U 98067A   18135.61844383  .00002728  00000-0 '
+                      ' 48567-4 0  9998')
+        self.line2 = ('2 25544  51.6402 181.0633 0004018  88.8954  22.2246 '
+                      '15.54059185113452')
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.fnames, self.line1, self.line2
+
+    def test_load(self):
+        """Test that a day of positions is propagated at 1 Hz"""
+        from sgp4.api import Satrec, WGS72
+
+        data, meta = pysat_sgp4.load(self.fnames)
+
+        assert data.index[-1] == pysat.datetime(2018, 1, 1, 23, 59, 59)
+        assert data.index.name == 'Epoch'
+        assert not data.isnull().any().any()
+        for key in data.columns:
+            assert key in meta
+
+        sat = Satrec.twoline2rv(self.line1, self.line2, WGS72)
+        err, pos, vel = sat.sgp4(2458119.5, 3600.0 / 86400.0)
+        assert np.allclose(data.iloc[3600][['position_eci_x',
+                                            'position_eci_y',
+                                            'position_eci_z']], pos)
+        assert np.allclose(data.iloc[3600][['velocity_eci_x',
+                                            'velocity_eci_y',
+                                            'velocity_eci_z']], vel)
+
+    def test_geodetic_location(self):
+        """Test that geodetic location is consistent with ECEF position"""
+        data, meta = pysat_sgp4.load(self.fnames)
+        radius = np.sqrt(data['position_ecef_x']**2
+                         + data['position_ecef_y']**2
+                         + data['position_ecef_z']**2)
+
+        assert (data['glat'].abs() < 52.).all()
+        assert ((data['alt'] > 380.) & (data['alt'] < 440.)).all()
+        assert np.allclose(data['glong'],
+                           np.degrees(np.arctan2(data['position_ecef_y'],
+                                                 data['position_ecef_x'])))
+        # ellipsoid radius is between polar and equatorial radii
+        assert ((radius - data['alt'] > 6356.7)
+                & (radius - data['alt'] < 6378.2)).all()
+
+    def test_observer_look(self):
+        """Test look angles from a ground station beneath the satellite"""
+        data, meta = pysat_sgp4.load(self.fnames)
+        obs = data.iloc[1000]
+        data, meta = pysat_sgp4.load(self.fnames, obs_lat=obs['glat'],
+                                     obs_long=obs['glong'], obs_alt=1000.)
+
+        assert np.isclose(data['obs_sat_el_angle'][1000], 90.)
+        assert np.isclose(data['obs_sat_slant_range'][1000], obs['alt'] - 1.)
+        assert ((data['obs_sat_az_angle'] >= 0.)
+                & (data['obs_sat_az_angle'] < 360.)).all()
+        assert (data['obs_sat_el_angle'].abs() <= 90.).all()
+
+
+class TestSGP4Batch():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.data_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.data_dir, 'constellation.tle')
+        self.fnames = ['2018-01-01.nofile']
+        self.lines = [('1 25544U 98067A   18135.61844383  .00002728  00000-0 '
+                       ' 48567-4 0  9998',
+                       '2 25544  51.6402 181.0633 0004018  88.8954  22.2246 '
+                       '15.54059185113452'),
+                      ('1 20580U 90037B   18135.53237779  .00000441  00000-0 '
+                       ' 16862-4 0  9990',
+                       '2 20580  28.4698 144.0331 0002796 219.4468 264.5788 '
+                       '15.08830591338400')]
+        with open(self.fname, 'w') as fout:
+            for sat_name, lines in zip(['ISS', 'HST'], self.lines):
+                fout.write('\n'.join([sat_name] + list(lines)) + '\n')
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        shutil.rmtree(self.data_dir)
+        del self.fname, self.fnames, self.lines
+
+    def test_batch_load_file(self):
+        """Test that satellites in a TLE file are simulated together"""
+        data, meta = pysat_sgp4.load(self.fnames, TLEs=self.fname)
+
+        assert isinstance(data, xr.Dataset)
+        assert list(data['sat'].values) == ['ISS', 'HST']
+        assert data['glat'].dims == ('time', 'sat')
+        assert data.dims['time'] == 86400
+        assert 'sat' in meta
+
+        single, meta = pysat_sgp4.load(self.fnames, TLE1=self.lines[1][0],
+                                       TLE2=self.lines[1][1])
+        for key in single.columns:
+            assert np.allclose(data[key].sel(sat='HST').values,
+                               single[key].values)
+
+    def test_batch_load_list(self):
+        """Test that unnamed satellites are labelled by catalog number"""
+        data, meta = pysat_sgp4.load(self.fnames, TLEs=self.lines)
+
+        assert list(data['sat'].values) == ['25544', '20580']
+
+    def test_batch_instrument(self):
+        """Test that an Instrument with TLEs loads an xarray Dataset"""
+        inst = pysat.Instrument('pysat', 'sgp4', TLEs=self.fname)
+
+        assert not inst.pandas_format
+        assert len(inst.custom._functions) == 0
+
+    def test_read_tle_file_unnamed(self):
+        """Test reading a file of TLEs without satellite names"""
+        with open(self.fname, 'w') as fout:
+            for lines in self.lines:
+                fout.write('\n'.join(lines) + '\n')
+        names, lines = pysat_sgp4.read_tle_file(self.fname)
+
+        assert names is None
+        assert lines == self.lines
+
+    @raises(ValueError)
+    def test_read_tle_file_without_tles(self):
+        """Test that a file without TLEs raises an error"""
+        with open(self.fname, 'w') as fout:
+            fout.write('ISS\n')
+        pysat_sgp4.read_tle_file(self.fname)
+
+
+class TestEvaluateModel():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        pysat_sgp4.clear_model_cache()
+        self.testInst = pysat.Instrument('pysat', 'testing')
+        # the same three locations are sampled at 1 Hz, twice over
+        index = pds.date_range(pysat.datetime(2018, 1, 1), periods=12,
+                               freq='1S')
+        self.testInst.data = pds.DataFrame({'glat': [10., 10.1, 20.] * 4,
+                                            'glong': [0., 0., 1.] * 4,
+                                            'alt': [400., 400., 401.] * 4},
+                                           index=index)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        pysat_sgp4.clear_model_cache()
+        del self.testInst
+
+    def test_evaluate_model(self):
+        """Test that the model is run at each sample location"""
+        output = pysat_sgp4.evaluate_model(run_sum, self.testInst)
+
+        assert (output.index == self.testInst.index).all()
+        assert np.allclose(output['sum'],
+                           self.testInst.index.second
+                           + self.testInst['glat'] + self.testInst['glong']
+                           + self.testInst['alt'])
+
+    def test_evaluate_model_rounded(self):
+        """Test that rounded locations share a model run"""
+        output = pysat_sgp4.evaluate_model(run_sum, self.testInst,
+                                           time_res=6., deg_res=1.,
+                                           alt_res=10., use_cache=True)
+
+        assert len(pysat_sgp4._model_cache) == 6
+        assert list(output['sum'][:6]) == [410., 410., 421., 416., 416.,
+                                           427.]
+        assert output['sum'][11] == 433.
+
+    def test_evaluate_model_cache(self):
+        """Test that stored results are reused"""
+        output = pysat_sgp4.evaluate_model(run_sum, self.testInst,
+                                           use_cache=True)
+        self.testInst.data = self.testInst[6:]
+        cached = pysat_sgp4.evaluate_model(run_sum, self.testInst,
+                                           workers=2, use_cache=True)
+
+        # no processes are started for the stored locations
+        assert (cached['pid'] == os.getpid()).all()
+        assert (cached['sum'] == output['sum'][6:]).all()
+        assert len(pysat_sgp4._model_cache) == 12
+
+    def test_evaluate_model_no_cache(self):
+        """Test that results are not stored by default"""
+        pysat_sgp4.evaluate_model(run_sum, self.testInst)
+
+        assert len(pysat_sgp4._model_cache) == 0
+
+    def test_evaluate_model_workers(self):
+        """Test that the model may be run across many processes"""
+        output = pysat_sgp4.evaluate_model(run_sum, self.testInst)
+        pooled = pysat_sgp4.evaluate_model(run_sum, self.testInst,
+                                           workers=2)
+
+        assert (pooled['sum'] == output['sum']).all()
+        assert (pooled['pid'] != os.getpid()).all()
@@ -1,7 +1,9 @@
 """
 tests the pysat averaging code
 """
+import functools
 import numpy as np
+import os
 
 from nose.tools import raises
 import pandas as pds
@@ -64,6 +66,47 @@ class TestBasics():
 
         assert np.all(check)
 
+    def test_return_data_keeps_dtype(self):
+        """Test binned data is returned with the type of the data"""
+        self.testInst.bounds = self.bounds2
+        results = avg.median1D(self.testInst, [0., 24., 24], 'mlt',
+                               ['int64_dummy', 'dummy1', 'mlt'],
+                               returnData=True)
+        assert results['int64_dummy']['data'][0].dtype.kind == 'i'
+        assert results['dummy1']['data'][0].dtype.kind == 'i'
+        assert results['mlt']['data'][0].dtype.kind == 'f'
+
+    def test_median2D_object_data_in_later_load(self):
+        """Test numbers binned before a load of object data are kept"""
+        def as_object(inst):
+            if inst.date == self.bounds1[1]:
+                inst['dummy3'] = inst['dummy3'].astype(object)
+
+        self.testInst.bounds = self.bounds1
+        args = ([0., 360., 24.], 'longitude', [0., 24, 24], 'mlt',
+                ['dummy3'])
+        exact = avg.median2D(self.testInst, *args)
+        self.testInst.custom.add(as_object, 'modify')
+        results = avg.median2D(self.testInst, *args)
+        for key in ['median', 'count', 'avg_abs_dev']:
+            np.testing.assert_array_equal(results['dummy3'][key],
+                                          exact['dummy3'][key])
+
+    def test_median1D_object_data_in_later_load(self):
+        """Test numbers binned before a load of object data are kept"""
+        def as_object(inst):
+            if inst.date == self.bounds1[1]:
+                inst['dummy3'] = inst['dummy3'].astype(object)
+
+        self.testInst.bounds = self.bounds1
+        args = ([0., 24, 24], 'mlt', ['dummy3'])
+        exact = avg.median1D(self.testInst, *args)
+        self.testInst.custom.add(as_object, 'modify')
+        results = avg.median1D(self.testInst, *args)
+        for key in ['median', 'count', 'avg_abs_dev']:
+            np.testing.assert_array_equal(results['dummy3'][key],
+                                          exact['dummy3'][key])
+
     def test_basic_daily_mean(self):
         """ Test basic daily mean"""
         self.testInst.bounds = self.bounds1
@@ -542,3 +585,221 @@ class TestInstMed1D():
         pysat.ssnl.avg.median2D(self.testInst, ['0', 'd', '24', 'c'],
                                 self.test_label, self.test_data,
                                 auto_bin=False)
+
+
+class TestHistogramSketch():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.sketch = avg.HistogramSketch((2, 3), [0., 10., 100])
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.sketch
+
+    def test_empty_sketch(self):
+        """Test empty bins return NaN statistics and zero counts"""
+        assert np.all(self.sketch.count() == 0)
+        assert np.all(np.isnan(self.sketch.median()))
+        assert np.all(np.isnan(self.sketch.avg_abs_dev()))
+
+    def test_statistics_within_resolution(self):
+        """Test estimates are within the sketch resolution of exact values"""
+        values = np.random.RandomState(0).normal(5., 2., 1001)
+        self.sketch.add(np.zeros(len(values), dtype=int) + 4, values)
+        median = np.median(values)
+        dev = np.median(np.abs(values - median))
+        assert self.sketch.count()[1, 1] == len(values)
+        assert abs(self.sketch.median()[1, 1] - median) <= \
+            self.sketch.resolution
+        assert abs(self.sketch.avg_abs_dev()[1, 1] - dev) <= \
+            1.5 * self.sketch.resolution
+        assert np.isnan(self.sketch.median()[0, 0])
+
+    def test_merge(self):
+        """Test merged sketches hold the counts of both sketches"""
+        other = avg.HistogramSketch((2, 3), [0., 10., 100])
+        self.sketch.add([0, 1], [1., 2.])
+        other.add([1], [3.])
+        merged = self.sketch + other
+        assert merged.count()[0, 0] == 1
+        assert merged.count()[0, 1] == 2
+        assert abs(merged.median()[0, 1] - 2.5) <= merged.resolution
+
+    @raises(ValueError)
+    def test_merge_different_bins(self):
+        """Test failure when merging sketches with different value bins"""
+        self.sketch + avg.HistogramSketch((2, 3), [0., 10., 10])
+
+
+class TestSketchMedian():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean')
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 3))
+        self.sketch = {'dummy1': [0., 24., 240], 'mlt': [0., 24., 2400]}
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst, self.sketch
+
+    def test_sketch_median2D(self):
+        """Test sketch 2D median agrees with the exact 2D median"""
+        exact = avg.median2D(self.testInst, [0., 360., 24], 'longitude',
+                             [0., 24., 24], 'mlt', ['dummy1', 'mlt'])
+        results = avg.median2D(self.testInst, [0., 360., 24], 'longitude',
+                               [0., 24., 24], 'mlt', ['dummy1', 'mlt'],
+                               sketch=self.sketch)
+        for label in ['dummy1', 'mlt']:
+            res = results[label]['sketch'].resolution
+            assert np.all(results[label]['count'] == exact[label]['count'])
+            assert np.all(np.abs(results[label]['median'] -
+                                 exact[label]['median']) <= res)
+            assert np.all(np.abs(results[label]['avg_abs_dev'] -
+                                 exact[label]['avg_abs_dev']) <= 1.5 * res)
+            assert np.all(results[label]['bin_x'] == exact[label]['bin_x'])
+            assert np.all(results[label]['bin_y'] == exact[label]['bin_y'])
+
+    def test_sketch_median1D(self):
+        """Test sketch 1D median agrees with the exact 1D median"""
+        exact = avg.median1D(self.testInst, [0., 24., 24], 'mlt', ['mlt'])
+        results = avg.median1D(self.testInst, [0., 24., 24], 'mlt', ['mlt'],
+                               sketch=[0., 24., 2400])
+        res = results['mlt']['sketch'].resolution
+        assert np.all(results['mlt']['count'] == exact['mlt']['count'])
+        assert np.all(np.abs(results['mlt']['median'] -
+                             exact['mlt']['median']) <= res)
+        assert np.all(np.abs(results['mlt']['avg_abs_dev'] -
+                             exact['mlt']['avg_abs_dev']) <= 1.5 * res)
+
+    def test_sketch_merge_over_season(self):
+        """Test sketches from parts of a season combine to the full season"""
+        results = avg.median2D(self.testInst, [0., 360., 24], 'longitude',
+                               [0., 24., 24], 'mlt', ['dummy1'],
+                               sketch=self.sketch)
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 2))
+        first = avg.median2D(self.testInst, [0., 360., 24], 'longitude',
+                             [0., 24., 24], 'mlt', ['dummy1'],
+                             sketch=self.sketch)
+        self.testInst.bounds = (pysat.datetime(2008, 1, 3),
+                                pysat.datetime(2008, 1, 3))
+        second = avg.median2D(self.testInst, [0., 360., 24], 'longitude',
+                              [0., 24., 24], 'mlt', ['dummy1'],
+                              sketch=self.sketch)
+        merged = first['dummy1']['sketch'] + second['dummy1']['sketch']
+        assert np.all(merged.counts == results['dummy1']['sketch'].counts)
+
+    @raises(ValueError)
+    def test_sketch_return_data(self):
+        """Test failure when requesting data along with a sketch"""
+        avg.median2D(self.testInst, [0., 360., 24], 'longitude',
+                     [0., 24., 24], 'mlt', ['dummy1'], returnData=True,
+                     sketch=self.sketch)
+
+
+class TestCheckpoint():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        import tempfile
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean')
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 3))
+        self.tempdir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tempdir, 'checkpoint.pkl')
+        self.args = ([0., 360., 24], 'longitude', [0., 24., 24], 'mlt',
+                     ['dummy1', 'mlt'])
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        import shutil
+        shutil.rmtree(self.tempdir)
+        del self.testInst, self.tempdir, self.fname, self.args
+
+    def test_extend_season(self):
+        """Test a checkpointed season extends to the full season result"""
+        exact = avg.median2D(self.testInst, *self.args)
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 2))
+        avg.median2D(self.testInst, *self.args, checkpoint=self.fname)
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 3))
+        results = avg.median2D(self.testInst, *self.args,
+                               checkpoint=self.fname)
+        for label in ['dummy1', 'mlt']:
+            for key in ['median', 'count', 'avg_abs_dev']:
+                np.testing.assert_array_equal(results[label][key],
+                                              exact[label][key])
+
+    def test_rerun_loads_nothing(self):
+        """Test days in the checkpoint are not loaded again"""
+        dates = []
+
+        def record(inst):
+            dates.append(inst.date)
+
+        self.testInst.custom.add(record, 'modify')
+        exact = avg.median2D(self.testInst, *self.args,
+                             checkpoint=self.fname, checkpoint_every=1)
+        assert len(dates) == 3
+        results = avg.median2D(self.testInst, *self.args,
+                               checkpoint=self.fname)
+        assert len(dates) == 3
+        np.testing.assert_array_equal(results['mlt']['median'],
+                                      exact['mlt']['median'])
+
+    def test_sketch_checkpoint(self):
+        """Test sketches are restored from a checkpoint"""
+        exact = avg.median1D(self.testInst, [0., 24., 24], 'mlt', ['mlt'],
+                             sketch=[0., 24., 240])
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 1))
+        avg.median1D(self.testInst, [0., 24., 24], 'mlt', ['mlt'],
+                     sketch=[0., 24., 240], checkpoint=self.fname)
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 3))
+        results = avg.median1D(self.testInst, [0., 24., 24], 'mlt', ['mlt'],
+                               sketch=[0., 24., 240], checkpoint=self.fname)
+        assert np.all(results['mlt']['sketch'].counts ==
+                      exact['mlt']['sketch'].counts)
+
+    def test_empty_day_reloaded_after_new_files(self):
+        """Test empty days are loaded once files appear, whatever came after"""
+        from pysat.instruments import pysat_testing
+
+        def set_files(dates):
+            self.testInst._list_rtn = functools.partial(
+                pysat_testing.list_files, file_date_range=dates)
+            self.testInst.files.refresh()
+
+        exact = avg.median2D(self.testInst, *self.args)
+        list_rtn = self.testInst._list_rtn
+        try:
+            set_files(pds.DatetimeIndex([pysat.datetime(2008, 1, 1),
+                                         pysat.datetime(2008, 1, 3)]))
+            avg.median2D(self.testInst, *self.args, checkpoint=self.fname)
+            # the file list changes twice before the next run, so
+            # Files.get_new only reports the later, unrelated, file
+            set_files(pds.date_range(pysat.datetime(2008, 1, 1),
+                                     pysat.datetime(2008, 1, 3)))
+            set_files(pds.date_range(pysat.datetime(2008, 1, 1),
+                                     pysat.datetime(2008, 1, 4)))
+            results = avg.median2D(self.testInst, *self.args,
+                                   checkpoint=self.fname)
+        finally:
+            self.testInst._list_rtn = list_rtn
+            self.testInst.files.refresh()
+        for label in ['dummy1', 'mlt']:
+            for key in ['median', 'count', 'avg_abs_dev']:
+                np.testing.assert_array_equal(results[label][key],
+                                              exact[label][key])
+
+    @raises(ValueError)
+    def test_different_parameters(self):
+        """Test failure when resuming with different parameters"""
+        avg.median2D(self.testInst, *self.args, checkpoint=self.fname)
+        avg.median2D(self.testInst, [0., 360., 12], 'longitude',
+                     [0., 24., 24], 'mlt', ['dummy1', 'mlt'],
+                     checkpoint=self.fname)
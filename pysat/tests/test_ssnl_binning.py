@@ -0,0 +1,105 @@
+"""
+tests the binning kernel used by the seasonal analysis routines
+"""
+from nose.tools import raises
+import numpy as np
+
+import pandas as pds
+
+from pysat.ssnl import _binning
+
+
+class TestBinning():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.data = pds.DataFrame({'x': [0.5, 1.5, 2.5, 0.5, np.nan, 1.5],
+                                   'y': [0.5, 0.5, 1.5, 1.5, 0.5, 5.]})
+        self.bins = [np.array([0., 1., 2.]), np.array([0., 1., 2., 3.])]
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.data, self.bins
+
+    def test_bin_index(self):
+        """Test flat index matches digitize along each dimension"""
+        index, good = _binning.bin_index(self.data, ['y', 'x'], self.bins)
+        assert np.all(good == [True, True, True, True, False, False])
+        assert np.all(index == [0, 1, 5, 3])
+
+    def test_bin_groups(self):
+        """Test samples are grouped by bin in their original order"""
+        index = np.array([3, 0, 3, 1, 0])
+        order, bounds = _binning.bin_groups(index, 5)
+        assert np.all(order == [1, 4, 3, 0, 2])
+        assert np.all(bounds == [0, 2, 3, 3, 5, 5])
+
+    def test_bin_any(self):
+        """Test bins with at least one flagged sample are found"""
+        index = np.array([3, 0, 3, 1, 0])
+        flag = np.array([False, False, True, True, False])
+        assert np.all(_binning.bin_any(index, flag, 4) ==
+                      [False, True, False, True])
+
+
+class TestBinAccumulator():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.acc = _binning.BinAccumulator(3)
+        rand = np.random.RandomState(0)
+        self.index = rand.randint(0, 2, 3001)
+        self.values = rand.normal(0., 1., 3001)
+        self.values[::10] = np.nan
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.acc, self.index, self.values
+
+    def test_statistics_match_numpy(self):
+        """Test exact statistics agree with numpy for each bin"""
+        # add in pieces to exercise buffer growth
+        for start in np.arange(0, len(self.values), 700):
+            self.acc.add(self.index[start:start + 700],
+                         self.values[start:start + 700])
+        median, count, dev = self.acc.statistics()
+        for i in range(2):
+            vals = self.values[(self.index == i) &
+                               np.isfinite(self.values)]
+            assert median[i] == np.median(vals)
+            assert count[i] == len(vals)
+            assert dev[i] == np.median(np.abs(vals - np.median(vals)))
+        assert np.isnan(median[2])
+        assert np.isnan(count[2])
+        assert np.isnan(dev[2])
+
+    def test_bin_values_in_order_added(self):
+        """Test values are returned by bin in the order added"""
+        self.acc.add(self.index, self.values)
+        values = self.acc.bin_values()
+        finite = np.isfinite(self.values)
+        for i in range(3):
+            assert np.all(values[i] ==
+                          self.values[(self.index == i) & finite])
+
+    def test_bin_values_keep_dtype(self):
+        """Test values are returned with the type they were added with"""
+        self.acc.add([0, 1, 0], np.array([3, 1, 2], dtype=np.int32))
+        assert self.acc.dtype == np.int32
+        assert self.acc.bin_values()[0].dtype == np.int32
+        median, count, dev = self.acc.statistics()
+        assert median[0] == 2.5
+
+    def test_bin_values_promoted(self):
+        """Test values of different types are promoted as for numpy"""
+        self.acc.add([0, 1], np.array([True, False]))
+        assert self.acc.dtype == bool
+        self.acc.add([0, 1], np.array([2, 3]))
+        self.acc.add([0, 1], np.array([0.5, np.nan]))
+        values = self.acc.bin_values()
+        assert self.acc.dtype == np.float64
+        assert np.all(values[0] == [1., 2., 0.5])
+        assert np.all(values[1] == [0., 3.])
+
+    @raises(ValueError)
+    def test_non_numeric_values(self):
+        """Test values that are not numbers raise an error"""
+        self.acc.add([0, 1], np.array(['a', 'b'], dtype=object))
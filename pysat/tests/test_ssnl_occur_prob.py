@@ -2,6 +2,9 @@
 tests the pysat occur_prob object and code
 """
 
+import numpy as np
+import os
+
 from nose.tools import raises
 
 import pysat
@@ -107,3 +110,37 @@ class TestBasics():
         assert abs(ans['slt']['bin_x'] - [0, 90, 180, 270, 360]).max() < 1.0e-6
         assert abs(ans['slt']['bin_y'] - [-60, -20, 20, 60]).max() < 1.0e-6
         assert abs(ans['slt']['bin_z'] - [0, 12, 24]).max() < 1.0e-6
+
+
+class TestCheckpoint():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        import tempfile
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean')
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 3))
+        self.tempdir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tempdir, 'checkpoint.pkl')
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        import shutil
+        shutil.rmtree(self.tempdir)
+        del self.testInst, self.tempdir, self.fname
+
+    def test_extend_season_daily_2D(self):
+        """Test a checkpointed season extends to the full season result"""
+        exact = occur_prob.daily2D(self.testInst, [0, 24, 2], 'slt',
+                                   [-60, 60, 3], 'latitude', ['slt'], [12.])
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 2))
+        occur_prob.daily2D(self.testInst, [0, 24, 2], 'slt', [-60, 60, 3],
+                           'latitude', ['slt'], [12.], checkpoint=self.fname)
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 3))
+        ans = occur_prob.daily2D(self.testInst, [0, 24, 2], 'slt',
+                                 [-60, 60, 3], 'latitude', ['slt'], [12.],
+                                 checkpoint=self.fname)
+        assert np.all(ans['slt']['count'] == exact['slt']['count'])
+        assert np.all(ans['slt']['prob'] == exact['slt']['prob'])
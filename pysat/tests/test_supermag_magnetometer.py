@@ -0,0 +1,101 @@
+import datetime as dt
+import numpy as np
+import os
+import shutil
+import tempfile
+
+import xarray as xr
+
+from pysat.instruments import supermag_magnetometer as smag
+
+
+def write_ascii_file(fname, stations, nmin=60, indices=True):
+    """Write a SuperMAG ASCII file, with some stations missing at each time"""
+
+    lines = ['Produced by SuperMAG', 'Selected parameters:',
+             ' '.join(['-stations all -mlt -sza -decl',
+                       '-envelope' if indices else '',
+                       '-delta start -baseline yearly -sd 2009-01-01T00:00',
+                       '-st 0 -ex 1440']),
+             '=' * 20]
+    for i in range(nmin):
+        time = dt.datetime(2009, 1, 1) + dt.timedelta(minutes=i)
+        snames = [ss for j, ss in enumerate(stations) if (i + j) % 5 != 0]
+        lines.append('\t'.join([time.strftime('%Y\t%m\t%d\t%H\t%M\t%S'),
+                                str(len(snames))]))
+        if indices:
+            lines.extend(['SML\t{:d}'.format(-i), 'SMU\t{:d}'.format(i)])
+        for j, ss in enumerate(stations):
+            if ss in snames:
+                lines.append('\t'.join([ss] + ['{:.1f}'.format(val) for val
+                                               in [i + j, -j, 0.5, 12.5,
+                                                   60.0 + j, 90.1, -3.0]]))
+
+    with open(fname, 'w') as fout:
+        fout.write('\n'.join(lines) + '\n')
+
+
+class TestSuperMAGASCII():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.data_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.data_dir,
+                                  'supermag_magnetometer_all_20090101.txt')
+        self.stations = ['BOU', 'NAN', 'T03']
+        write_ascii_file(self.fname, self.stations)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        shutil.rmtree(self.data_dir)
+        del self.fname, self.stations
+
+    def test_load_ascii_magnetometer(self):
+        """Test that a row is loaded for each station at each time"""
+        data, baseline = smag.load_ascii_data(self.fname, '')
+
+        assert len(data) == 144
+        assert list(data.columns) == ['IAGA', 'N', 'E', 'Z', 'MLT', 'MLAT',
+                                      'SZA', 'IGRF_DECL']
+        assert baseline == 'yearly start 2009-01-01T00:00 0 1440'
+        assert data.index[0] == dt.datetime(2009, 1, 1)
+        assert list(data['IAGA'][:4]) == ['NAN', 'T03', 'BOU', 'NAN']
+        assert list(data['N'][:4]) == [1.0, 2.0, 1.0, 2.0]
+        assert data['IGRF_DECL'].dtype == np.float64
+
+    def test_load_ascii_all(self):
+        """Test that indices are repeated for each station"""
+        data, baseline = smag.load_ascii_data(self.fname, 'all')
+
+        assert len(data) == 144
+        assert list(data['SML'][:4]) == [0, 0, -1, -1]
+        assert data['SML'].dtype == np.int64
+
+    def test_load_ascii_indices(self):
+        """Test that indices are loaded once for each time"""
+        data, baseline = smag.load_ascii_data(self.fname, 'indices')
+
+        assert list(data.columns) == ['SML', 'SMU']
+        assert len(data) == 60
+        assert data.index[1] == dt.datetime(2009, 1, 1, 0, 1)
+        assert list(data['SMU'][:3]) == [0, 1, 2]
+
+    def test_load_ascii_indices_not_in_file(self):
+        """Test that no data is loaded if the file has no indices"""
+        write_ascii_file(self.fname, self.stations, indices=False)
+        data, baseline = smag.load_ascii_data(self.fname, 'indices')
+
+        assert len(data.columns) == 0
+
+    def test_load_xarray_output(self):
+        """Test that data may be loaded by time and station"""
+        data, meta = smag.load([self.fname + '_2009-01-01'], tag='all',
+                               xarray_output=True)
+
+        assert isinstance(data, xr.Dataset)
+        assert list(data['station'].values) == ['BOU', 'NAN', 'T03']
+        assert data['N'].dims == ('time', 'station')
+        assert data['SML'].dims == ('time',)
+        assert data['SML'].dtype == np.int64
+        assert np.isnan(data['N'].values[0, 0])
+        assert data['N'].sel(station='T03').values[1] == 3.0
+        assert meta['N'].units == 'nT'
@@ -209,6 +209,39 @@ class TestSWKp():
 
         del fill_label, kp_out, kp_meta
 
+    def test_convert_kp_to_ap_all_values(self):
+        """ Test conversion of every Kp value to ap"""
+
+        kp = np.arange(0, 28) / 3.0
+        self.testInst.data = pds.DataFrame({'Kp': kp},
+                                           index=pds.date_range('2009-01-01',
+                                                                periods=28,
+                                                                freq='3H'))
+        sw_kp.convert_3hr_kp_to_ap(self.testInst)
+
+        assert list(self.testInst['3hr_ap']) == [0, 2, 3, 4, 5, 6, 7, 9, 12,
+                                                 15, 18, 22, 27, 32, 39, 48,
+                                                 56, 67, 80, 94, 111, 132,
+                                                 154, 179, 207, 236, 300, 400]
+
+    def test_convert_kp_to_ap_bad_value(self):
+        """ Test conversion of Kp to ap with a Kp that is not an index value"""
+
+        self.testInst['Kp'][3] = 1.5
+
+        assert_raises(ValueError, sw_kp.convert_3hr_kp_to_ap, self.testInst)
+
+    def test_convert_ap_to_kp_bounds(self):
+        """ Test conversion of ap to Kp outside of the ap index values"""
+
+        kp_out, kp_meta = sw_meth.convert_ap_to_kp([-1.0, 0.0, 1.9, 400.0,
+                                                    500.0])
+
+        assert list(kp_out[:3]) == [-1, 0.0, 0.0]
+        assert list(kp_out[3:]) == [9.0, 9.0]
+
+        del kp_out, kp_meta
+
 
 class TestSwKpCombine():
     def setup(self):
@@ -4,6 +4,7 @@ tests the pysat utils area
 import numpy as np
 import os
 import tempfile
+import pandas as pds
 
 import pysat
 
@@ -184,6 +185,42 @@ class TestBasicNetCDF4():
             print('Testing Data Equality to filesystem and back ', key)
             assert (np.all(self.testInst[key] == loaded_inst[key]))
 
+    def test_read_netcdf4_time_window(self):
+        prep_dir(self.testInst)
+        outfile = os.path.join(self.testInst.files.data_path,
+                               'pysat_test_ncdf.nc')
+        self.testInst.load(2009, 1)
+        self.testInst.to_netcdf4(outfile)
+
+        start = pysat.datetime(2009, 1, 1, 1)
+        stop = pysat.datetime(2009, 1, 1, 2, 30)
+        loaded_inst, meta = pysat.utils.load_netcdf4(outfile, start=start,
+                                                     stop=stop)
+        test_data = self.testInst[start:stop - pds.DateOffset(seconds=1)]
+
+        assert np.all(loaded_inst.index == test_data.index)
+        for key in self.testInst.data.columns:
+            assert np.all(test_data[key] == loaded_inst[key])
+
+    def test_read_netcdf4_time_window_higher_order(self):
+        test_inst = pysat.Instrument('pysat', 'testing2d')
+        prep_dir(test_inst)
+        outfile = os.path.join(test_inst.files.data_path, 'pysat_test_ncdf.nc')
+        test_inst.load(2009, 1)
+        test_inst.to_netcdf4(outfile)
+
+        start = pysat.datetime(2009, 1, 1, 1)
+        stop = pysat.datetime(2009, 1, 1, 1, 0, 30)
+        loaded_inst, meta = pysat.utils.load_netcdf4(outfile, start=start,
+                                                     stop=stop)
+        test_data = test_inst[start:stop - pds.DateOffset(seconds=1)]
+        prep_dir(test_inst)
+
+        assert np.all(loaded_inst.index == test_data.index)
+        for frame1, frame2 in zip(test_data['profiles'],
+                                  loaded_inst['profiles']):
+            assert np.all((frame1 == frame2).all())
+
     def test_write_and_read_netcdf4_default_format_higher_order(self):
         # create a bunch of files by year and doy
         test_inst = pysat.Instrument('pysat', 'testing2d')
@@ -260,3 +297,46 @@ class TestBasicNetCDF4():
 
         assert (np.all((test_inst.data == loaded_inst).all()))
         assert np.all(test_list)
+
+    def test_write_and_read_netcdf4_higher_order_w_chunks(self):
+        import netCDF4
+
+        test_inst = pysat.Instrument('pysat', 'testing2d')
+        prep_dir(test_inst)
+        outfile = os.path.join(test_inst.files.data_path, 'pysat_test_ncdf.nc')
+        test_inst.load(2009, 1)
+        test_inst.to_netcdf4(outfile, zlib=True, chunk_size=100)
+
+        with netCDF4.Dataset(outfile) as data:
+            assert data['Epoch'].chunking() == [100]
+            assert data['profiles_density'].chunking() == [100, 50]
+            assert data['series_profiles_data'].chunking() == [100, 50]
+
+        loaded_inst, meta = pysat.utils.load_netcdf4(outfile)
+        prep_dir(test_inst)
+
+        assert np.all(loaded_inst.index == test_inst.index)
+        assert np.all(loaded_inst['longitude'] == test_inst['longitude'])
+        for frame1, frame2 in zip(test_inst.data['profiles'],
+                                  loaded_inst['profiles']):
+            assert np.all((frame1 == frame2).all())
+        for frame1, frame2 in zip(test_inst.data['series_profiles'],
+                                  loaded_inst['series_profiles']):
+            assert np.all(frame1 == frame2)
+
+    def test_write_netcdf4_chunks_larger_than_data(self):
+        import netCDF4
+
+        test_inst = pysat.Instrument('pysat', 'testing2d')
+        prep_dir(test_inst)
+        outfile = os.path.join(test_inst.files.data_path, 'pysat_test_ncdf.nc')
+        test_inst.load(2009, 1)
+        test_inst.data = test_inst[0:50]
+        test_inst.to_netcdf4(outfile, zlib=True, chunk_size=1000)
+
+        # chunks along time are limited to the number of times
+        with netCDF4.Dataset(outfile) as data:
+            assert data['Epoch'].chunking() == [50]
+            assert data['longitude'].chunking() == [50]
+            assert data['profiles_density'].chunking() == [50, 50]
+        prep_dir(test_inst)
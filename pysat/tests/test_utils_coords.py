@@ -101,6 +101,21 @@ class TestBasics():
         assert (abs(self.testInst['slt']
                     - self.testInst['slt2'])).max() < 1.0e-6
 
+    def test_calc_solar_local_time_xarray(self):
+        """Test calc_solar_local_time with an xarray instrument"""
+
+        inst = pysat.Instrument(platform='pysat', name='testing_xarray')
+        inst.load(2009, 1)
+        coords.calc_solar_local_time(inst, lon_name="longitude",
+                                     slt_name='slt2')
+        target = np.mod(inst.index.hour + inst.index.minute / 60.0
+                        + inst.index.second / 3600.0
+                        + inst['longitude'].values / 15.0, 24.0)
+
+        assert inst['slt2'].dims == ('time',)
+        assert (abs(inst['slt2'].values - target)).max() < 1.0e-6
+        assert inst.meta['slt2', inst.meta.units_label] == 'h'
+
     @raises(ValueError)
     def test_bad_lon_name_calc_solar_local_time(self):
         """Test calc_solar_local_time with a bad longitude name"""
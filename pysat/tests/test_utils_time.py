@@ -165,3 +165,48 @@ def test_create_datetime_index_wo_month_day_uts():
     assert dates[0] == pds.datetime(2012, 1, 1)
     assert dates[-1] == pds.datetime(2012, 1, 1)
     assert len(dates) == 4
+
+
+###############
+# window_slice
+
+def test_window_slice():
+    """Test the slice covering a time window"""
+
+    times = pds.date_range('2009-01-01', periods=24, freq='H')
+    rows = pytime.window_slice(times, pds.datetime(2009, 1, 1, 3, 30),
+                               pds.datetime(2009, 1, 1, 6))
+
+    assert rows == slice(4, 6)
+
+
+def test_window_slice_open():
+    """Test the slice covering a time window without a start or stop"""
+
+    times = pds.date_range('2009-01-01', periods=24, freq='H')
+
+    assert pytime.window_slice(times, stop=pds.datetime(2009, 1, 1, 2)) == \
+        slice(0, 2)
+    assert pytime.window_slice(times, start=pds.datetime(2009, 1, 1, 22)) == \
+        slice(22, 24)
+
+
+def test_window_slice_unsorted():
+    """Test the slice covering a time window for unsorted times"""
+
+    times = pds.date_range('2009-01-01', periods=24, freq='H')
+    times = times[[0, 5, 1, 6, 2, 7]]
+    rows = pytime.window_slice(times, pds.datetime(2009, 1, 1, 1),
+                               pds.datetime(2009, 1, 1, 3))
+
+    assert rows == slice(2, 5)
+
+
+def test_window_slice_empty():
+    """Test the slice covering a time window without any times"""
+
+    times = pds.date_range('2009-01-01', periods=24, freq='H')
+    rows = pytime.window_slice(times, pds.datetime(2009, 1, 2),
+                               pds.datetime(2009, 1, 3))
+
+    assert len(times[rows]) == 0
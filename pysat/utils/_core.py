@@ -32,6 +32,10 @@ def set_data_dir(path=None, store=True):
         pysat.data_dir = path
         pysat._files = re_load(pysat._files)
         pysat._instrument = re_load(pysat._instrument)
+        # keep the package level classes the same as the reloaded ones, so
+        # Instruments may still be pickled, e.g. by pysat.parallel
+        pysat.Files = pysat._files.Files
+        pysat.Instrument = pysat._instrument.Instrument
     else:
         raise ValueError('Path %s does not lead to a valid directory.' % path)
 
@@ -73,7 +77,8 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
                  name_label='long_name', notes_label='notes',
                  desc_label='desc', plot_label='label', axis_label='axis',
                  scale_label='scale', min_label='value_min',
-                 max_label='value_max', fill_label='fill'):
+                 max_label='value_max', fill_label='fill', variables=None,
+                 start=None, stop=None):
     # unix_time=False, **kwargs):
     """Load netCDF-3/4 file produced by pysat.
 
@@ -107,6 +112,17 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
         keyword for maximum in allowable value range
     fill_label : string ('fill')
         keyword for fill values
+    variables : list or NoneType (None)
+        names of the variables to load, other variables are not read from
+        file. 2D variables are selected by their dimension name. If None,
+        all variables are loaded.
+    start : datetime or NoneType (None)
+        start of the time window to load, only records within the window
+        are read from file. If None, records from the start of each file
+        are loaded.
+    stop : datetime or NoneType (None)
+        exclusive end of the time window to load. If None, records up to
+        the end of each file are loaded.
 
     Returns
     --------
@@ -161,15 +177,30 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
                 else:
                     mdata.__setattr__(d, data.getncattr(d))
 
+            # records within the time window, all records if no window
+            rows = slice(0, data.variables[epoch_name].shape[0])
+            if (start is not None) or (stop is not None):
+                time_var = data.variables[epoch_name][:]
+                rows = pysat.utils.time.window_slice(
+                    pds.to_datetime((1E6 * time_var).astype(int)), start,
+                    stop)
+            num_rows = rows.stop - rows.start
+
             # loadup all of the variables in the netCDF
             loadedVars = {}
             for key in data.variables.keys():
+                if variables is not None:
+                    # 2D variables are selected by their dimension name
+                    dims = data.variables[key].dimensions
+                    name = dims[1] if len(dims) == 2 else key
+                    if (key != epoch_name) and (name not in variables):
+                        continue
                 # load up metadata.  From here group unique
                 # dimensions and act accordingly, 1D, 2D, 3D
                 if len(data.variables[key].dimensions) == 1:
                     # load 1D data variable
                     # assuming basic time dimension
-                    loadedVars[key] = data.variables[key][:]
+                    loadedVars[key] = data.variables[key][rows]
                     # if key != epoch_name:
                     # load up metadata
                     meta_dict = {}
@@ -263,9 +294,9 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
                 for key, clean_key in zip(obj_var_keys, clean_var_keys):
                     # data
                     loop_dict[clean_key] = \
-                        data.variables[key][:, :].flatten(order='C')
+                        data.variables[key][rows, :].flatten(order='C')
                 # number of values in time
-                loop_lim = data.variables[obj_var_keys[0]].shape[0]
+                loop_lim = num_rows
                 # number of values per time
                 step_size = len(data.variables[obj_var_keys[0]][0, :])
                 # check if there is an index we should use
@@ -334,9 +365,9 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
                     # list holds a series of slices, parsed from dict above
                     loop_list = []
                     loop_dict[obj_key_name] = \
-                        data.variables[obj_key_name][:, :, :]
+                        data.variables[obj_key_name][rows, :, :]
                     # number of values in time
-                    loop_lim = data.variables[obj_key_name].shape[0]
+                    loop_lim = num_rows
                     # number of values per time
                     step_size_x = len(data.variables[obj_key_name][0, :, 0])
                     step_size_y = len(data.variables[obj_key_name][0, 0, :])
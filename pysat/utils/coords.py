@@ -8,6 +8,7 @@ functions used throughout the pysat package.
 
 import numpy as np
 import pandas as pds
+import xarray as xr
 
 
 def adjust_cyclic_data(samples, high=2.0*np.pi, low=0.0):
@@ -94,32 +95,23 @@ def calc_solar_local_time(inst, lon_name=None, slt_name='slt'):
 
     """
 
-    import datetime as dt
-
     if lon_name not in inst.data.keys():
         raise ValueError('uknown longitude variable name')
 
-    # Convert from numpy epoch nanoseconds to UT seconds of day
-    ut_hr = list()
-    for nptime in inst.index.values.astype(int):
-        # Numpy times come out in nanoseconds and timestamp converts
-        # from seconds
-        dtime = dt.datetime.utcfromtimestamp(nptime * 1.0e-9)
-        ut_hr.append((dtime.hour * 3600.0 + dtime.minute * 60.0 +
-                      dtime.second + dtime.microsecond * 1.0e-6) / 3600.0)
-    # Calculate solar local time
-    slt = np.array([t + inst[lon_name][i] / 15.0 for i, t in enumerate(ut_hr)])
-
-    # Ensure that solar local time falls between 0 and 24 hours
-    slt = np.mod(slt, 24.0)
-
-    # Add the solar local time to the instrument
+    # Convert from numpy epoch nanoseconds to UT hours of day
+    ut_hr = np.mod(inst.index.values.astype(np.int64), 86400 * 10**9) / 3.6e12
+
+    # Calculate solar local time, ensuring that it falls between 0 and 24
+    # hours, and add it to the instrument
     if inst.pandas_format:
+        lon = inst[lon_name].values.astype(np.float64)
+        slt = np.mod(ut_hr + lon / 15.0, 24.0)
         inst[slt_name] = pds.Series(slt, index=inst.data.index)
     else:
-        data = inst.data.assign(pysat_slt=(inst.data.coords.keys(), slt))
-        data.rename({"pysat_slt": slt_name}, inplace=True)
-        inst.data = data
+        # Longitude may vary along dimensions other than time
+        ut_hr = xr.DataArray(ut_hr, coords={'time': inst.index}, dims='time')
+        slt = np.mod(ut_hr + inst[lon_name] / 15.0, 24.0)
+        inst.data = inst.data.assign(**{slt_name: slt})
 
     # Add units to the metadata
     inst.meta[slt_name] = {inst.meta.units_label: 'h',
@@ -212,3 +212,47 @@ def create_datetime_index(year=None, month=None, day=None, uts=None):
     # going to use routine that defaults to nanseconds for epoch
     uts_del *= 1E9
     return pds.to_datetime(uts_del)
+
+
+def window_slice(times, start=None, stop=None):
+    """Return the slice of times covering a time window.
+
+    Parameters
+    ----------
+    times : array-like
+        Datetime list, array, or Index
+    start : datetime or NoneType
+        Start of the window, if None the window starts with the first time
+        (default=None)
+    stop : datetime or NoneType
+        Exclusive end of the window, if None the window ends with the last
+        time (default=None)
+
+    Returns
+    -------
+    slice
+        Smallest slice of times holding every time within the window
+
+    Note
+    ----
+    Used by load routines to read only the records within a time window.
+    If times are not increasing, the slice may also hold times outside of
+    the window.
+
+    """
+
+    times = pds.DatetimeIndex(times)
+    if times.is_monotonic_increasing:
+        first = 0 if start is None else times.searchsorted(start)
+        last = len(times) if stop is None else times.searchsorted(stop)
+        return slice(int(first), int(max(first, last)))
+
+    in_window = np.ones(len(times), dtype=bool)
+    if start is not None:
+        in_window &= times >= start
+    if stop is not None:
+        in_window &= times < stop
+    idx, = np.where(in_window)
+    if len(idx) == 0:
+        return slice(0, 0)
+    return slice(int(idx[0]), int(idx[-1]) + 1)